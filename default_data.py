@@ -1,1325 +1,46 @@
-# load_existing_data function and static facility data
+"""
+Baseline facility data (the last full scrape), used by --load-existing and by --enrich without --scrape.
+Kept as zstd-compressed JSON in default_data.json.zst rather than as Python source,
+refresh it with `python main.py --scrape --save-default-data`.
+"""
 
+import json
+import os
+import zstandard
 
-facilities_data = {
-    "enrich_runtime": 0,
-    "facilities": {
-        "1 SHERIFF OFFICE DRIVE,MACCLENNY,FL,32063": {
-            "_repaired_record": True,
-            "address": {
-                "administrative_area": "FL",
-                "country": "United States",
-                "locality": "MacClenny",
-                "postal_code": "32063",
-                "street": "1 Sheriff Office Drive",
-            },
-            "address_str": "1 SHERIFF OFFICE DRIVE,MACCLENNY,FL,32063",
-            "facility_type": {
-                "description": "A publicly-owned facility operated by state/local government(s), or private contractors, in which ICE contracts for bed space via an Intergovernmental Service Agreement; or local jails used by ICE pursuant to Intergovernmental Service Agreements, which house both ICE and non-ICE detainees, typically county prisoners awaiting trial or serving short sentences, but sometimes also USMS prisoners.",
-                "expanded_name": "Intergovernmental Service Agreement",
-                "id": "IGSA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "FL",
-                    "country": "United States",
-                    "locality": "Plantation",
-                    "postal_code": "33324",
-                    "street": "865 SW 78th Avenue Suite 101",
-                },
-                "address_str": "865 SW 78th Avenue Suite 101 Plantation, FL 33324",
-                "aor": "Florida, Puerto Rico, U.S. Virgin Islands",
-                "email": "Miami.Outreach@ice.dhs.gov",
-                "field_office": "Miami Field Office",
-                "id": "MIA",
-                "name": "Plantation - ERO",
-                "phone": "(954) 236-4900",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=5&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/assets/pages/detention/facilities/bakerfl.jpg",
-            "inspection": {
-                "last_date": "2024-10-24",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "BAKER COUNTY SHERIFF DEPT.",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-07-07 07:28:25+04:00",
-            "phone": "",
-            "population": {
-                "female": {"allowed": True, "criminal": 26.4047619047619, "non_criminal": 31.9910714285714},
-                "avg_stay_length": 32.1266008049762,
-                "ice_threat_level": {
-                    "level_1": 24.5952380952381,
-                    "level_2": 13.0059523809524,
-                    "level_3": 13.1428571428571,
-                    "none": 210.523809523811,
-                },
-                "male": {"allowed": True, "criminal": 143.247023809523, "non_criminal": 59.6249999999997},
-                "housing": {"guaranteed_min": 192, "mandatory": 199.196428571429},
-                "security_threat": {
-                    "high": 83.4196428571429,
-                    "low": 36.1041666666665,
-                    "medium_high": 107.586309523809,
-                    "medium_low": 34.1577380952381,
-                },
-                "total": 261.26785714285603,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=0&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/baker-county-facility",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "1300 LANGE CT,BARABOO,WI,53913": {
-            "_repaired_record": True,
-            "address": {
-                "administrative_area": "WI",
-                "country": "",
-                "locality": "BARABOO",
-                "postal_code": "53913",
-                "street": "1300 LANGE CT",
-            },
-            "address_str": "1300 LANGE CT,BARABOO,WI,53913",
-            "facility_type": {
-                "description": "A USMS Intergovernmental Agreement in which ICE agrees to utilize an already established US Marshals Service contract.",
-                "expanded_name": "United States Marshals Service Intergovernmental Agreement",
-                "id": "USMS IGA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "IL",
-                    "country": "United States",
-                    "locality": "Chicago",
-                    "postal_code": "60605",
-                    "street": "101 W Ida B Wells Drive Suite 4000",
-                },
-                "address_str": "101 W Ida B Wells Drive Suite 4000 Chicago, IL 60605",
-                "aor": "Illinois, Indiana, Wisconsin, Missouri, Kentucky, Kansas",
-                "email": "Chicago.Outreach@ice.dhs.gov",
-                "field_office": "Chicago Field Office",
-                "id": "CHI",
-                "name": "Chicago - ERO",
-                "phone": "(872) 351-3990",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=1&exposed_form_display=1"],
-            },
-            "image_url": "",
-            "inspection": {"last_date": None, "last_rating": None, "last_type": None},
-            "name": "SAUK COUNTY SHERIFF",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": None,
-            "phone": "",
-            "population": {
-                "avg_stay_length": 6.81081081081081,
-                "female": {"allowed": True, "criminal": 0.0, "non_criminal": 0.00595238095238095},
-                "ice_threat_level": {
-                    "level_1": 0.0,
-                    "level_2": 0.136904761904762,
-                    "level_3": 0.0267857142857143,
-                    "none": 1.75297619047619,
-                },
-                "male": {"allowed": True, "criminal": 0.842261904761905, "non_criminal": 1.06845238095238},
-                "housing": {"guaranteed_min": None, "mandatory": 1.23214285714286},
-                "security_threat": {
-                    "high": 0.267857142857143,
-                    "low": 0.610119047619048,
-                    "medium_high": 0.571428571428571,
-                    "medium_low": 0.467261904761905,
-                },
-                "total": 1.916666666666666,
-            },
-            "source_urls": ["https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx"],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "1623 E J STREET,TACOMA,WA,98421": {
-            "_repaired_record": True,
-            "address": {
-                "administrative_area": "WA",
-                "country": "United States",
-                "locality": "Tacoma",
-                "postal_code": "98421",
-                "street": "1623 E J STREET",
-            },
-            "address_str": "1623 E J STREET,TACOMA,WA,98421",
-            "facility_type": {
-                "description": "Name derived from listing at https://www.vera.org/ice-detention-trends",
-                "expanded_name": "Contract Detention Facility",
-                "id": "CDF",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "WA",
-                    "country": "United States",
-                    "locality": "Seattle",
-                    "postal_code": "98168",
-                    "street": "12500 Tukwila International Boulevard",
-                },
-                "address_str": "12500 Tukwila International Boulevard Seattle, WA 98168",
-                "aor": "Alaska, Oregon, Washington",
-                "email": "Seattle.Outreach@ice.dhs.gov",
-                "field_office": "Seattle Field Office",
-                "id": "SEA",
-                "name": "Seattle - ERO",
-                "phone": "(206) 277-2000",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=7&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/sites/default/files/images/nwIPC.png",
-            "inspection": {
-                "last_date": "2025-01-30",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "NORTHWEST ICE PROCESSSING CENTER",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-08-20 07:47:00+04:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 69.515069725596,
-                "female": {"allowed": True, "criminal": 46.4107142857143, "non_criminal": 78.5446428571429},
-                "ice_threat_level": {
-                    "level_1": 151.08630952381,
-                    "level_2": 42.5327380952381,
-                    "level_3": 30.5297619047619,
-                    "none": 943.872023809526,
-                },
-                "male": {"allowed": True, "criminal": 408.907738095238, "non_criminal": 634.157738095241},
-                "housing": {"guaranteed_min": 1181, "mandatory": 949.535714285718},
-                "security_threat": {
-                    "high": 212.28869047619,
-                    "low": 592.693452380955,
-                    "medium_high": 232.479166666666,
-                    "medium_low": 130.559523809524,
-                },
-                "total": 1168.0208333333362,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=4&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/northwest-ice-processing-center-nwipc",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "216 S BROAD ST,GUTHRIE,OK,73044": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "OK",
-                "country": "",
-                "locality": "GUTHRIE",
-                "postal_code": "73044",
-                "street": "216 S BROAD ST",
-            },
-            "address_str": "216 S BROAD ST,GUTHRIE,OK,73044",
-            "facility_type": {
-                "description": "A USMS Intergovernmental Agreement in which ICE agrees to utilize an already established US Marshals Service contract.",
-                "expanded_name": "United States Marshals Service Intergovernmental Agreement",
-                "id": "USMS IGA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "TX",
-                    "country": "United States",
-                    "locality": "Dallas",
-                    "postal_code": "75247",
-                    "street": "8101 N. Stemmons Frwy",
-                },
-                "address_str": "8101 N. Stemmons Frwy Dallas, TX 75247",
-                "aor": "North Texas, Oklahoma",
-                "email": "Dallas.Outreach@ice.dhs.gov",
-                "field_office": "Dallas Field Office",
-                "id": "DAL",
-                "name": "Dallas - ERO",
-                "phone": "(972) 367-2200",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=1&exposed_form_display=1"],
-            },
-            "image_url": "",
-            "inspection": {"last_date": "2025-05-13", "last_rating": "Pass", "last_type": None},
-            "name": "LOGAN COUNTY JAIL",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": None,
-            "phone": "",
-            "population": {
-                "avg_stay_length": 2.70526315789474,
-                "female": {"allowed": False, "criminal": 0.0476190476190476, "non_criminal": 0.163690476190476},
-                "housing": {"guaranteed_min": None, "mandatory": 0.901785714285713},
-                "ice_threat_level": {
-                    "level_1": 0.0178571428571429,
-                    "level_2": 0.0119047619047619,
-                    "level_3": 0.0148809523809524,
-                    "none": 2.41964285714286,
-                },
-                "male": {"allowed": False, "criminal": 0.663690476190476, "non_criminal": 1.58928571428571},
-                "security_threat": {
-                    "high": 0.232142857142857,
-                    "low": 1.6547619047619,
-                    "medium_high": 0.229166666666667,
-                    "medium_low": 0.348214285714286,
-                },
-                "total": 2.4642857142857095,
-            },
-            "source_urls": ["https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx"],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "219 EAST FREMONT AVENUE,RIGBY,ID,83442": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "ID",
-                "country": "",
-                "locality": "RIGBY",
-                "postal_code": "83442",
-                "street": "219 EAST FREMONT AVENUE",
-            },
-            "address_str": "219 EAST FREMONT AVENUE,RIGBY,ID,83442",
-            "facility_type": {
-                "description": "A publicly-owned facility operated by state/local government(s), or private contractors, in which ICE contracts for bed space via an Intergovernmental Service Agreement; or local jails used by ICE pursuant to Intergovernmental Service Agreements, which house both ICE and non-ICE detainees, typically county prisoners awaiting trial or serving short sentences, but sometimes also USMS prisoners.",
-                "expanded_name": "Intergovernmental Service Agreement",
-                "id": "IGSA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "UT",
-                    "country": "United States",
-                    "locality": "West Valley City",
-                    "postal_code": "84119-6096",
-                    "street": "2975 Decker Lake Drive Suite 100",
-                },
-                "address_str": "2975 Decker Lake Drive Suite 100 West Valley City, UT 84119-6096",
-                "aor": "Utah, Idaho, Montana, Nevada",
-                "email": "SaltLakeCity.Outreach@ice.dhs.gov",
-                "field_office": "Salt Lake City Field Office",
-                "id": "SLC",
-                "name": "West Valley City - ERO",
-                "phone": "(801) 736-1200",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=7&exposed_form_display=1"],
-            },
-            "image_url": "",
-            "inspection": {
-                "last_date": "2024-07-18",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "JEFFERSON COUNTY JAIL",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": None,
-            "phone": "",
-            "population": {
-                "avg_stay_length": 2.98178506375228,
-                "female": {"allowed": True, "criminal": 0.0297619047619048, "non_criminal": 0.0238095238095238},
-                "housing": {"guaranteed_min": None, "mandatory": 4.18750000000003},
-                "ice_threat_level": {
-                    "level_1": 0.0654761904761905,
-                    "level_2": 0.178571428571429,
-                    "level_3": 0.223214285714286,
-                    "none": 4.57142857142861,
-                },
-                "male": {"allowed": True, "criminal": 3.65178571428573, "non_criminal": 1.33333333333333},
-                "security_threat": {
-                    "high": 0.613095238095237,
-                    "low": 0.999999999999999,
-                    "medium_high": 1.50595238095238,
-                    "medium_low": 1.91964285714285,
-                },
-                "total": 5.038690476190489,
-            },
-            "source_urls": ["https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx"],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "320 SHAW STATION ROAD,LEITCHFIELD,KY,42754": {
-            "_repaired_record": True,
-            "address": {
-                "administrative_area": "KY",
-                "country": "United States",
-                "locality": "LEITCHFIELD",
-                "postal_code": "42754",
-                "street": "320 Shaw Station Road",
-            },
-            "address_str": "320 SHAW STATION ROAD,LEITCHFIELD,KY,42754",
-            "facility_type": {
-                "description": "A USMS Intergovernmental Agreement in which ICE agrees to utilize an already established US Marshals Service contract.",
-                "expanded_name": "United States Marshals Service Intergovernmental Agreement",
-                "id": "USMS IGA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "IL",
-                    "country": "United States",
-                    "locality": "Chicago",
-                    "postal_code": "60605",
-                    "street": "101 W Ida B Wells Drive Suite 4000",
-                },
-                "address_str": "101 W Ida B Wells Drive Suite 4000 Chicago, IL 60605",
-                "aor": "Illinois, Indiana, Wisconsin, Missouri, Kentucky, Kansas",
-                "email": "Chicago.Outreach@ice.dhs.gov",
-                "field_office": "Chicago Field Office",
-                "id": "CHI",
-                "name": "Chicago - ERO",
-                "phone": "(872) 351-3990",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=1&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/sites/default/files/2025-08/detFacGrayson.jpg",
-            "inspection": {
-                "last_date": "2025-08-21",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "GRAYSON COUNTY JAIL",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-08-20 08:07:50+04:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 18.0488505747126,
-                "female": {"allowed": True, "criminal": 20.3869047619048, "non_criminal": 39.9613095238095},
-                "housing": {"guaranteed_min": 0, "mandatory": 50.785714285714},
-                "ice_threat_level": {
-                    "level_1": 6.74404761904762,
-                    "level_2": 3.27678571428571,
-                    "level_3": 4.125,
-                    "none": 54.3422619047616,
-                },
-                "male": {"allowed": True, "criminal": 5.02678571428573, "non_criminal": 3.11309523809524},
-                "security_threat": {
-                    "high": 7.52380952380953,
-                    "low": 36.6636904761905,
-                    "medium_high": 16.7053571428571,
-                    "medium_low": 7.5952380952381,
-                },
-                "total": 68.48809523809527,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=3&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/grayson-county-detention-center",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "3347 TAMIAMI TRAIL E,NAPLES,FL,34112": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "FL",
-                "country": "",
-                "locality": "NAPLES",
-                "postal_code": "34112",
-                "street": "3347 TAMIAMI TRAIL E",
-            },
-            "address_str": "3347 TAMIAMI TRAIL E,NAPLES,FL,34112",
-            "facility_type": {
-                "description": "A publicly-owned facility operated by state/local government(s), or private contractors, in which ICE contracts for bed space via an Intergovernmental Service Agreement; or local jails used by ICE pursuant to Intergovernmental Service Agreements, which house both ICE and non-ICE detainees, typically county prisoners awaiting trial or serving short sentences, but sometimes also USMS prisoners.",
-                "expanded_name": "Intergovernmental Service Agreement",
-                "id": "IGSA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "FL",
-                    "country": "United States",
-                    "locality": "Plantation",
-                    "postal_code": "33324",
-                    "street": "865 SW 78th Avenue Suite 101",
-                },
-                "address_str": "865 SW 78th Avenue Suite 101 Plantation, FL 33324",
-                "aor": "Florida, Puerto Rico, U.S. Virgin Islands",
-                "email": "Miami.Outreach@ice.dhs.gov",
-                "field_office": "Miami Field Office",
-                "id": "MIA",
-                "name": "Plantation - ERO",
-                "phone": "(954) 236-4900",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=5&exposed_form_display=1"],
-            },
-            "image_url": "",
-            "inspection": {
-                "last_date": "2024-12-05",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "COLLIER COUNTY NAPLES JAIL CENTER",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": None,
-            "phone": "",
-            "population": {
-                "avg_stay_length": 2.91890440386681,
-                "female": {"allowed": True, "criminal": 0.366071428571429, "non_criminal": 0.601190476190476},
-                "housing": {"guaranteed_min": None, "mandatory": 11.8065476190477},
-                "ice_threat_level": {
-                    "level_1": 0.306547619047619,
-                    "level_2": 0.258928571428571,
-                    "level_3": 0.336309523809524,
-                    "none": 15.8303571428572,
-                },
-                "male": {"allowed": True, "criminal": 8.41666666666674, "non_criminal": 7.34821428571436},
-                "security_threat": {
-                    "high": 2.60119047619048,
-                    "low": 8.22321428571438,
-                    "medium_high": 3.88690476190477,
-                    "medium_low": 2.02083333333333,
-                },
-                "total": 16.732142857143007,
-            },
-            "source_urls": ["https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx"],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "3855 SOUTH JOHN YOUNG PARKWAY,ORLANDO,FL,32839": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "FL",
-                "country": "",
-                "locality": "ORLANDO",
-                "postal_code": "32839",
-                "street": "3855 SOUTH JOHN YOUNG PARKWAY",
-            },
-            "address_str": "3855 SOUTH JOHN YOUNG PARKWAY,ORLANDO,FL,32839",
-            "facility_type": {
-                "description": "A USMS Intergovernmental Agreement in which ICE agrees to utilize an already established US Marshals Service contract.",
-                "expanded_name": "United States Marshals Service Intergovernmental Agreement",
-                "id": "USMS IGA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "FL",
-                    "country": "United States",
-                    "locality": "Plantation",
-                    "postal_code": "33324",
-                    "street": "865 SW 78th Avenue Suite 101",
-                },
-                "address_str": "865 SW 78th Avenue Suite 101 Plantation, FL 33324",
-                "aor": "Florida, Puerto Rico, U.S. Virgin Islands",
-                "email": "Miami.Outreach@ice.dhs.gov",
-                "field_office": "Miami Field Office",
-                "id": "MIA",
-                "name": "Plantation - ERO",
-                "phone": "(954) 236-4900",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=5&exposed_form_display=1"],
-            },
-            "image_url": "",
-            "inspection": {
-                "last_date": "2024-08-15",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "ORANGE COUNTY JAIL (FL)",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": None,
-            "phone": "",
-            "population": {
-                "female": {"allowed": True, "criminal": 0.75297619047619, "non_criminal": 2.18154761904762},
-                "avg_stay_length": 2.24147157190635,
-                "housing": {"guaranteed_min": None, "mandatory": 12.014880952381},
-                "ice_threat_level": {
-                    "level_1": 0.151785714285714,
-                    "level_2": 0.0476190476190476,
-                    "level_3": 0.0952380952380952,
-                    "none": 20.2648809523812,
-                },
-                "male": {"allowed": True, "criminal": 5.72023809523814, "non_criminal": 11.9047619047619},
-                "security_threat": {
-                    "high": 2.52678571428572,
-                    "low": 7.93452380952386,
-                    "medium_high": 5.31547619047622,
-                    "medium_low": 4.78273809523812,
-                },
-                "total": 20.55952380952385,
-            },
-            "source_urls": ["https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx"],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "406 NORTH AVENUE D,SAN LUIS,AZ,85349": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "AZ",
-                "country": "United States",
-                "locality": "San Luis",
-                "postal_code": "85349",
-                "street": "406 North Avenue D",
-            },
-            "address_str": "406 NORTH AVENUE D,SAN LUIS,AZ,85349",
-            "facility_type": {
-                "description": "A publicly-owned facility operated by state/local government(s), or private contractors, in which ICE contracts for bed space via an Intergovernmental Service Agreement; or local jails used by ICE pursuant to Intergovernmental Service Agreements, which house both ICE and non-ICE detainees, typically county prisoners awaiting trial or serving short sentences, but sometimes also USMS prisoners.",
-                "expanded_name": "Intergovernmental Service Agreement",
-                "id": "IGSA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "CA",
-                    "country": "United States",
-                    "locality": "San Diego",
-                    "postal_code": "92101",
-                    "street": "880 Front Street #2242",
-                },
-                "address_str": "880 Front Street #2242 San Diego, CA 92101",
-                "aor": "San Diego and Imperial County",
-                "email": "SanDiego.Outreach@ice.dhs.gov",
-                "field_office": "San Diego Field Office",
-                "id": "SND",
-                "name": "San Diego - ERO",
-                "phone": "(619) 436-0410",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=6&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/assets/pages/detention/facilities/sanLuisDetCntr.jpg",
-            "inspection": {
-                "last_date": "2024-04-25",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "SAN LUIS REGIONAL DETENTION CENTER",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-02-10 18:54:02+05:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 17.4419417475728,
-                "female": {"allowed": True, "criminal": 2.45833333333333, "non_criminal": 41.5327380952381},
-                "housing": {"guaranteed_min": 100, "mandatory": 153.306547619047},
-                "ice_threat_level": {
-                    "level_1": 13.8095238095238,
-                    "level_2": 3.2202380952381,
-                    "level_3": 2.81845238095238,
-                    "none": 202.553571428571,
-                },
-                "male": {"allowed": True, "criminal": 33.7113095238095, "non_criminal": 144.699404761904},
-                "security_threat": {
-                    "high": 18.110119047619,
-                    "low": 152.684523809524,
-                    "medium_high": 9.63690476190476,
-                    "medium_low": 41.9702380952381,
-                },
-                "total": 222.40178571428493,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=5&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/san-luis-regional-detention-center",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "409 FM 1144,KARNES CITY,TX,78118": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "TX",
-                "country": "United States",
-                "locality": "Karnes City",
-                "postal_code": "78118",
-                "street": "409 FM 1144",
-            },
-            "address_str": "409 FM 1144,KARNES CITY,TX,78118",
-            "facility_type": {
-                "description": "A publicly-owned facility operated by state/local government(s), or private contractors, in which ICE contracts to use all bed space via a Dedicated Intergovernmental Service Agreement; or facilities used by ICE pursuant to Intergovernmental Service Agreements, which house only ICE detainees. Typically these are operated by private contractors pursuant to their agreements with local governments.",
-                "expanded_name": "Dedicated Intergovernmental Service Agreement",
-                "id": "DIGSA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "TX",
-                    "country": "United States",
-                    "locality": "San Antonio",
-                    "postal_code": "78217",
-                    "street": "1777 NE Loop 410 Floor 15",
-                },
-                "address_str": "1777 NE Loop 410 Floor 15 San Antonio, TX 78217",
-                "aor": "Central Texas",
-                "email": "SanAntonio.Outreach@ice.dhs.gov",
-                "field_office": "San Antonio Field Office",
-                "id": "SNA",
-                "name": "San Antonio - ERO",
-                "phone": "(210) 283-4750",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=6&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/sites/default/files/images/detention/karnetx_0.jpg",
-            "inspection": {
-                "last_date": "2025-06-05",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "KARNES COUNTY IMMIGRATION PROCESSING CENTER",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-08-18 15:00:23+04:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 33.2780461031833,
-                "female": {"allowed": True, "criminal": 20.4434523809524, "non_criminal": 258.038690476191},
-                "housing": {"guaranteed_min": 928, "mandatory": 605.050595238094},
-                "ice_threat_level": {
-                    "level_1": 1.38988095238095,
-                    "level_2": 7.22321428571429,
-                    "level_3": 43.7708333333333,
-                    "none": 905.139880952385,
-                },
-                "male": {"allowed": True, "criminal": 56.4553571428572, "non_criminal": 622.586309523808},
-                "security_threat": {
-                    "high": 0.18452380952381,
-                    "low": 877.574404761908,
-                    "medium_high": 2.86309523809524,
-                    "medium_low": 76.9017857142857,
-                },
-                "total": 957.5238095238087,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=3&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/karnes-county-ipc",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "451 DOREMUS AVENUE,NEWARK,NJ,07105": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "NJ",
-                "country": "United States",
-                "locality": "Newark",
-                "postal_code": "07105",
-                "street": "451 Doremus Avenue",
-            },
-            "address_str": "451 DOREMUS AVENUE,NEWARK,NJ,07105",
-            "facility_type": {
-                "description": "Name derived from listing at https://www.vera.org/ice-detention-trends",
-                "expanded_name": "Contract Detention Facility",
-                "id": "CDF",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "NJ",
-                    "country": "United States",
-                    "locality": "Newark",
-                    "postal_code": "07102",
-                    "street": "970 Broad St. 11th Floor",
-                },
-                "address_str": "970 Broad St. 11th Floor Newark, NJ 07102",
-                "aor": "New Jersey",
-                "email": "Newark.Outreach@ice.dhs.gov",
-                "field_office": "Newark Field Office",
-                "id": "NEW",
-                "name": "Newark - ERO",
-                "phone": "(862) 445-9200",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=4&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/sites/default/files/2025-05/detFacDelaney.png",
-            "inspection": {"last_date": "2025-08-28", "last_rating": "", "last_type": "Office of Detention Oversight"},
-            "name": "DELANEY HALL DETENTION FACILITY",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-09-15 13:47:56+04:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 18.698902027027,
-                "female": {"allowed": True, "criminal": 1.66964285714286, "non_criminal": 15.9107142857143},
-                "housing": {"guaranteed_min": 700, "mandatory": 118.9375},
-                "ice_threat_level": {
-                    "level_1": 0.854166666666667,
-                    "level_2": 2.87202380952381,
-                    "level_3": 8.70535714285714,
-                    "none": 199.886904761905,
-                },
-                "male": {"allowed": True, "criminal": 29.1815476190476, "non_criminal": 165.556547619048},
-                "security_threat": {
-                    "high": 7.21428571428572,
-                    "low": 151.318452380952,
-                    "medium_high": 15.2946428571429,
-                    "medium_low": 38.4910714285714,
-                },
-                "total": 212.31845238095275,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=1&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/delaney-hall-detention-facility",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "5001 MALONEYVILLE RD,KNOXVILLE,TN,37918": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "TN",
-                "country": "",
-                "locality": "KNOXVILLE",
-                "postal_code": "37918",
-                "street": "5001 MALONEYVILLE RD",
-            },
-            "address_str": "5001 MALONEYVILLE RD,KNOXVILLE,TN,37918",
-            "facility_type": {
-                "description": "A USMS Intergovernmental Agreement in which ICE agrees to utilize an already established US Marshals Service contract.",
-                "expanded_name": "United States Marshals Service Intergovernmental Agreement",
-                "id": "USMS IGA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "LA",
-                    "country": "United States",
-                    "locality": "New Orleans",
-                    "postal_code": "70113",
-                    "street": "1250 Poydras Suite 325",
-                },
-                "address_str": "1250 Poydras Suite 325 New Orleans, LA 70113",
-                "aor": "Alabama, Arkansas, Louisiana, Mississippi, Tennessee",
-                "email": "NewOrleans.Outreach@ice.dhs.gov",
-                "field_office": "New Orleans Field Office",
-                "id": "NOL",
-                "name": "New Orleans - ERO",
-                "phone": "(504) 599-7800",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=4&exposed_form_display=1"],
-            },
-            "image_url": "",
-            "inspection": {
-                "last_date": "2024-09-26",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "KNOX COUNTY DETENTION FACILITY",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": None,
-            "phone": "",
-            "population": {
-                "avg_stay_length": 3.70551670551671,
-                "female": {"allowed": True, "criminal": 0.720238095238095, "non_criminal": 1.41964285714285},
-                "housing": {"guaranteed_min": None, "mandatory": 20.5654761904763},
-                "ice_threat_level": {
-                    "level_1": 0.196428571428571,
-                    "level_2": 0.0476190476190476,
-                    "level_3": 0.339285714285714,
-                    "none": 28.0386904761906,
-                },
-                "male": {"allowed": True, "criminal": 13.4970238095239, "non_criminal": 12.9851190476191},
-                "security_threat": {
-                    "high": 2.91666666666667,
-                    "low": 11.3214285714286,
-                    "medium_high": 6.62202380952385,
-                    "medium_low": 7.7619047619048,
-                },
-                "total": 28.62202380952395,
-            },
-            "source_urls": ["https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx"],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "555 GEO DRIVE,PHILIPSBURG,PA,16866": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "PA",
-                "country": "United States",
-                "locality": "Philipsburg",
-                "postal_code": "16866",
-                "street": "555 GEO Drive",
-            },
-            "address_str": "555 GEO DRIVE,PHILIPSBURG,PA,16866",
-            "facility_type": {
-                "description": "A publicly-owned facility operated by state/local government(s), or private contractors, in which ICE contracts to use all bed space via a Dedicated Intergovernmental Service Agreement; or facilities used by ICE pursuant to Intergovernmental Service Agreements, which house only ICE detainees \u2013 typically these are operated by private contractors pursuant to their agreements with local governments.",
-                "expanded_name": "Dedicated Intergovernmental Service Agreement",
-                "id": "DIGSA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "PA",
-                    "country": "United States",
-                    "locality": "Philadelphia",
-                    "postal_code": "19107",
-                    "street": "114 North 8th Street",
-                },
-                "address_str": "114 North 8th Street Philadelphia, PA 19107",
-                "aor": "Delaware, Pennsylvania, West Virginia",
-                "email": "Philadelphia.Outreach@ice.dhs.gov",
-                "field_office": "Philadelphia Field Office",
-                "id": "PHI",
-                "name": "Philadelphia - ERO",
-                "phone": "(215) 656-7164",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=5&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/assets/pages/detention/facilities/moshannon.png",
-            "inspection": {
-                "last_date": "2025-03-06",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "MOSHANNON VALLEY PROCESSING CENTER",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-08-14 07:24:42+04:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 60.577734375,
-                "female": {"allowed": True, "criminal": 25.4940476190476, "non_criminal": 23.1279761904762},
-                "housing": {"guaranteed_min": 800, "mandatory": 1031.93452380953},
-                "ice_threat_level": {
-                    "level_1": 187.080357142857,
-                    "level_2": 63.6279761904762,
-                    "level_3": 74.3363095238095,
-                    "none": 1070.05357142857,
-                },
-                "male": {"allowed": True, "criminal": 696.252976190479, "non_criminal": 650.223214285716},
-                "security_threat": {
-                    "high": 397.491071428571,
-                    "low": 351.229166666671,
-                    "medium_high": 534.288690476191,
-                    "medium_low": 112.089285714286,
-                },
-                "total": 1395.0982142857188,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=4&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/moshannon-valley-processing-center",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "651 FEDERAL DRIVE SUITE 104,GUAYNABO,PR,00965": {
-            "_repaired_record": True,
-            "address": {
-                "administrative_area": "PR",
-                "country": "",
-                "locality": "GUAYNABO",
-                "postal_code": "00965",
-                "street": "651 FEDERAL DRIVE SUITE 104",
-            },
-            "address_str": "651 FEDERAL DRIVE SUITE 104,GUAYNABO,PR,00965",
-            "facility_type": {"expanded_name": "", "description": "", "id": "STAGING"},
-            "field_office": {
-                "address": {
-                    "administrative_area": "FL",
-                    "country": "United States",
-                    "locality": "Plantation",
-                    "postal_code": "33324",
-                    "street": "865 SW 78th Avenue Suite 101",
-                },
-                "address_str": "865 SW 78th Avenue Suite 101 Plantation, FL 33324",
-                "aor": "Florida, Puerto Rico, U.S. Virgin Islands",
-                "email": "Miami.Outreach@ice.dhs.gov",
-                "field_office": "Miami Field Office",
-                "id": "MIA",
-                "name": "Plantation - ERO",
-                "phone": "(954) 236-4900",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=5&exposed_form_display=1"],
-            },
-            "image_url": "",
-            "inspection": {"last_date": None, "last_rating": None, "last_type": None},
-            "name": "SAN JUAN STAGING",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": None,
-            "phone": "",
-            "population": {
-                "avg_stay_length": 4.85525227460711,
-                "female": {"allowed": True, "criminal": 0.1875, "non_criminal": 0.982142857142856},
-                "housing": {"guaranteed_min": 100, "mandatory": 8.66666666666672},
-                "ice_threat_level": {
-                    "level_1": 0.0892857142857143,
-                    "level_2": 0.0744047619047619,
-                    "level_3": 0.0714285714285714,
-                    "none": 12.8065476190477,
-                },
-                "male": {"allowed": True, "criminal": 3.46130952380953, "non_criminal": 8.41071428571434},
-                "security_threat": {
-                    "high": 0.732142857142857,
-                    "low": 9.66964285714294,
-                    "medium_high": 1.66369047619047,
-                    "medium_low": 0.976190476190475,
-                },
-                "total": 13.041666666666726,
-            },
-            "source_urls": ["https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx"],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "705 HANOVER STREET,HAMILTON,OH,45011": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "OH",
-                "country": "United States",
-                "locality": "Hamilton",
-                "postal_code": "45011",
-                "street": "705 Hanover Street",
-            },
-            "address_str": "705 HANOVER STREET,HAMILTON,OH,45011",
-            "facility_type": {
-                "description": "A USMS Intergovernmental Agreement in which ICE agrees to utilize an already established US Marshals Service contract.",
-                "expanded_name": "United States Marshals Service Intergovernmental Agreement",
-                "id": "USMS IGA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "MI",
-                    "country": "United States",
-                    "locality": "Detroit",
-                    "postal_code": "48226",
-                    "street": "985 Michigan Avenue Suite 207",
-                },
-                "address_str": "985 Michigan Avenue Suite 207 Detroit, MI 48226",
-                "aor": "Michigan, Ohio",
-                "email": "Detroit.Outreach@ice.dhs.gov",
-                "field_office": "Detroit Field Office",
-                "id": "DET",
-                "name": "Detroit - ERO",
-                "phone": "(313) 771-6601",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=1&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/sites/default/files/images/detFacButler.png",
-            "inspection": {"last_date": None, "last_rating": "Pass", "last_type": "Office of Detention Oversight"},
-            "name": "BUTLER COUNTY JAIL",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-05-15 07:19:46+04:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 28.500872600349,
-                "female": {"allowed": True, "criminal": 1.87202380952381, "non_criminal": 12.8630952380952},
-                "housing": {"guaranteed_min": 0, "mandatory": 110.571428571429},
-                "ice_threat_level": {
-                    "level_1": 4.52083333333333,
-                    "level_2": 5.66071428571429,
-                    "level_3": 9.54761904761905,
-                    "none": 130.741071428571,
-                },
-                "male": {"allowed": True, "criminal": 34.9523809523809, "non_criminal": 100.782738095238},
-                "security_threat": {
-                    "high": 7.61309523809524,
-                    "low": 93.8184523809523,
-                    "medium_high": 25.5386904761905,
-                    "medium_low": 23.5,
-                },
-                "total": 150.4702380952379,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=0&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/butler-county-sheriffs-office",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "715 5TH AVENUE,HOLDREGE,NE,68949": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "NE",
-                "country": "United States",
-                "locality": "Holdrege",
-                "postal_code": "68949",
-                "street": "715 5th Avenue",
-            },
-            "address_str": "715 5TH AVENUE,HOLDREGE,NE,68949",
-            "facility_type": {
-                "description": "A USMS Intergovernmental Agreement in which ICE agrees to utilize an already established US Marshals Service contract.",
-                "expanded_name": "United States Marshals Service Intergovernmental Agreement",
-                "id": "USMS IGA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "MN",
-                    "country": "United States",
-                    "locality": "Fort Snelling",
-                    "postal_code": "55111",
-                    "street": "1 Federal Drive Suite 1601",
-                },
-                "address_str": "1 Federal Drive Suite 1601 Fort Snelling, MN 55111",
-                "aor": "Iowa, Minnesota, Nebraska, North Dakota, South Dakota",
-                "email": "StPaul.Outreach@ice.dhs.gov",
-                "field_office": "St Paul Field Office",
-                "id": "SPM",
-                "name": "Fort Snelling - ERO",
-                "phone": "(612) 843-8600",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=2&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/assets/pages/detention/facilities/phelpsCoJail.jpg",
-            "inspection": {
-                "last_date": "2025-02-06",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "PHELPS COUNTY JAIL (NE)",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-02-10 18:50:51+05:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 38.2981132075472,
-                "female": {"allowed": True, "criminal": 1.27678571428571, "non_criminal": 0.342261904761905},
-                "housing": {"guaranteed_min": 0, "mandatory": 26.764880952381},
-                "ice_threat_level": {
-                    "level_1": 2.05952380952381,
-                    "level_2": 2.0327380952381,
-                    "level_3": 1.22916666666667,
-                    "none": 25.7797619047619,
-                },
-                "male": {"allowed": True, "criminal": 23.4791666666667, "non_criminal": 6.00297619047619},
-                "security_threat": {
-                    "high": 9.01488095238095,
-                    "low": 4.11904761904762,
-                    "medium_high": 11.4761904761905,
-                    "medium_low": 6.49107142857143,
-                },
-                "total": 31.101190476190503,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=4&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/phelps-county-jail",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "4702 EAST SAUNDERS STREET,LAREDO,TX,78401": {
-            "_repaired_record": True,
-            "address": {
-                "administrative_area": "TX",
-                "country": "United States",
-                "locality": "Laredo",
-                "postal_code": "78401",
-                "street": "4702 EAST SAUNDERS STREET",
-            },
-            "address_str": "4702 EAST SAUNDERS STREET,LAREDO,TX,78401",
-            "facility_type": {
-                "description": "A publicly-owned facility operated by state/local government(s), or private contractors, in which ICE contracts to use all bed space via a Dedicated Intergovernmental Service Agreement; or facilities used by ICE pursuant to Intergovernmental Service Agreements, which house only ICE detainees \u2013 typically these are operated by private contractors pursuant to their agreements with local governments.",
-                "expanded_name": "Dedicated Intergovernmental Service Agreement",
-                "id": "DIGSA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "TX",
-                    "country": "United States",
-                    "locality": "Harlingen",
-                    "postal_code": "78552",
-                    "street": "1717 Zoy Street",
-                },
-                "address_str": "1717 Zoy Street Harlingen, TX 78552",
-                "aor": "South Texas",
-                "email": "Harlingen.Outreach@ice.dhs.gov",
-                "field_office": "Harlingen Field Office",
-                "id": "HLG",
-                "name": "Harlingen - ERO",
-                "phone": "(956) 389-7884",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=2&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/sites/default/files/images/detention/lrdicdf.jpg",
-            "inspection": {
-                "last_date": "2025-03-20",
-                "last_rating": "Pass",
-                "last_type": "Office of Detention Oversight",
-            },
-            "name": "LAREDO PROCESSING CENTER",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-02-10 15:38:10+05:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 34.5141129032258,
-                "female": {"allowed": True, "criminal": 26.4047619047619, "non_criminal": 336.178571428572},
-                "housing": {"guaranteed_min": 0, "mandatory": 234.130952380952},
-                "ice_threat_level": {
-                    "level_1": 6.05357142857143,
-                    "level_2": 5.58630952380952,
-                    "level_3": 12.2440476190476,
-                    "none": 343.639880952382,
-                },
-                "male": {"allowed": True, "criminal": 0.625, "non_criminal": 4.31547619047619},
-                "security_threat": {
-                    "high": 9.27380952380953,
-                    "low": 332.92261904762,
-                    "medium_high": 12.4136904761905,
-                    "medium_low": 12.9136904761905,
-                },
-                "total": 367.5238095238101,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=1&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/laredo-detention-center",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "11541 MONTANA AVENUE,EL PASO,TX,79936": {
-            "_repaired_record": True,
-            "address": {
-                "administrative_area": "TX",
-                "country": "United States",
-                "locality": "El Paso",
-                "postal_code": "79936",
-                "street": "11541 Montana Avenue",
-            },
-            "address_str": "11541 MONTANA AVENUE,EL PASO,TX,79936",
-            "facility_type": {
-                "description": "",
-                "expanded_name": "",
-                "id": "DOD",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "TX",
-                    "country": "United States",
-                    "locality": "El Paso",
-                    "postal_code": "79936",
-                    "street": "11541 Montana Ave Suite E",
-                },
-                "address_str": "11541 Montana Ave Suite E El Paso, TX 79936",
-                "aor": "West Texas, New Mexico",
-                "email": "ElPaso.Outreach@ice.dhs.gov",
-                "field_office": "El Paso Field Office",
-                "id": "ELP",
-                "name": "El Paso - ERO",
-                "phone": "(915) 225-1901",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=2&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/sites/default/files/2025-09/detFacFortBliss.jpg",
-            "inspection": {"last_date": None, "last_rating": "", "last_type": ""},
-            "name": "DOD DETENTION FACILITY AT FORT BLISS",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-09-18 13:57:54+04:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 3.64849187935035,
-                "female": {"allowed": True, "criminal": 0.0416666666666667, "non_criminal": 0.598214285714285},
-                "housing": {"guaranteed_min": 0, "mandatory": 16.5684523809523},
-                "ice_threat_level": {
-                    "level_1": 5.79761904761905,
-                    "level_2": 3.36309523809524,
-                    "level_3": 5.87500000000001,
-                    "none": 43.955357142857,
-                },
-                "male": {"allowed": True, "criminal": 17.1964285714285, "non_criminal": 41.1547619047618},
-                "security_threat": {
-                    "high": 6.5327380952381,
-                    "low": 30.4821428571426,
-                    "medium_high": 10.9255952380952,
-                    "medium_low": 11.0505952380952,
-                },
-                "total": 58.991071428571246,
-            },
-            "source_urls": [
-                "https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx",
-                "https://www.ice.gov/detention-facilities?page=1&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/fort-bliss-detention-facility",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "Naval Station Guantanamo Bay (JTF Camp Six and Migrant Ops Center Main A)": {
-            "_repaired_record": False,
-            "address": {"administrative_area": "", "country": "", "locality": "", "postal_code": "", "street": ""},
-            "address_str": ",,,00000",
-            "facility_type": {
-                "description": "",
-                "expanded_name": "",
-                "id": "",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "FL",
-                    "country": "United States",
-                    "locality": "Plantation",
-                    "postal_code": "33324",
-                    "street": "865 SW 78th Avenue Suite 101",
-                },
-                "address_str": "865 SW 78th Avenue Suite 101 Plantation, FL 33324",
-                "aor": "Florida, Puerto Rico, U.S. Virgin Islands",
-                "email": "Miami.Outreach@ice.dhs.gov",
-                "field_office": "Miami Field Office",
-                "id": "MIA",
-                "name": "Plantation - ERO",
-                "phone": "(954) 236-4900",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=5&exposed_form_display=1"],
-            },
-            "image_url": "https://www.ice.gov/sites/default/files/images/detFacNSGB.png",
-            "inspection": {"last_date": None, "last_rating": "", "last_type": ""},
-            "name": "Naval Station Guantanamo Bay (JTF Camp Six and Migrant Ops Center Main A)",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": "2025-05-06 08:22:09+04:00",
-            "phone": "",
-            "population": {
-                "avg_stay_length": 0,
-                "female": {"allowed": False, "criminal": 0, "non_criminal": 0},
-                "housing": {"guaranteed_min": 0, "mandatory": 0},
-                "ice_threat_level": {"level_1": 0, "level_2": 0, "level_3": 0, "none": 0},
-                "male": {"allowed": False, "criminal": 0, "non_criminal": 0},
-                "security_threat": {"high": 0, "low": 0, "medium_high": 0, "medium_low": 0},
-                "total": 0,
-            },
-            "source_urls": [
-                "https://www.ice.gov/detention-facilities?page=4&exposed_form_display=1",
-                "https://www.ice.gov/detain/detention-facilities/naval-station-guantanamo-bay",
-            ],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-        "PARK STREET,FONDA,NY,12068": {
-            "_repaired_record": False,
-            "address": {
-                "administrative_area": "NY",
-                "country": "",
-                "locality": "FONDA",
-                "postal_code": "12068",
-                "street": "PARK STREET",
-            },
-            "address_str": "PARK STREET,FONDA,NY,12068",
-            "facility_type": {
-                "description": "A publicly-owned facility operated by state/local government(s), or private contractors, in which ICE contracts for bed space via an Intergovernmental Service Agreement; or local jails used by ICE pursuant to Intergovernmental Service Agreements, which house both ICE and non-ICE detainees, typically county prisoners awaiting trial or serving short sentences, but sometimes also USMS prisoners.",
-                "expanded_name": "Intergovernmental Service Agreement",
-                "id": "IGSA",
-            },
-            "field_office": {
-                "address": {
-                    "administrative_area": "NY",
-                    "country": "United States",
-                    "locality": "Buffalo",
-                    "postal_code": "14202",
-                    "street": "250 Delaware Avenue, Floor 7",
-                },
-                "address_str": "250 Delaware Avenue, Floor 7 Buffalo, NY 14202",
-                "aor": "Upstate New York",
-                "email": "Buffalo.Outreach@ice.dhs.gov",
-                "field_office": "Buffalo Field Office",
-                "id": "BUF",
-                "name": "Buffalo - ERO",
-                "phone": "(716) 464-5800",
-                "source_urls": ["https://www.ice.gov/contact/field-offices?page=0&exposed_form_display=1"],
-            },
-            "image_url": "",
-            "inspection": {"last_date": None, "last_rating": None, "last_type": None},
-            "name": "MONTGOMERY COUNTY JAIL",
-            "osm": {"latitude": 0, "longitude": 0, "search_query": "", "url": ""},
-            "page_updated_date": None,
-            "phone": "",
-            "population": {
-                "avg_stay_length": 1.953125,
-                "female": {"allowed": True, "criminal": 0.0, "non_criminal": 0.0684523809523809},
-                "housing": {"guaranteed_min": None, "mandatory": 0.654761904761904},
-                "ice_threat_level": {
-                    "level_1": 0.00595238095238095,
-                    "level_2": 0.0119047619047619,
-                    "level_3": 0.0297619047619048,
-                    "none": 1.47321428571428,
-                },
-                "male": {"allowed": True, "criminal": 0.30952380952381, "non_criminal": 1.14285714285714},
-                "security_threat": {
-                    "high": 0.0625,
-                    "low": 1.13988095238095,
-                    "medium_high": 0.139880952380952,
-                    "medium_low": 0.178571428571429,
-                },
-                "total": 1.5208333333333308,
-            },
-            "source_urls": ["https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx"],
-            "vera_id": "",
-            "wikidata": {"page_url": "", "search_query": ""},
-            "wikipedia": {"page_url": "", "search_query": ""},
-        },
-    },
-    "scrape_runtime": 48.883458614349365,
-    "scraped_date": "2025-09-08 00:00:17.837345",
-}
+SCRIPTDIR = os.path.dirname(os.path.realpath(__file__))
+default_data_file = f"{SCRIPTDIR}{os.sep}default_data.json.zst"
+
+
+def load_default_data(as_frame: bool = False, path: str = default_data_file):
+    """
+    The baseline data as a new dict on every call (so callers may modify it),
+    or with as_frame, its facilities as a (flattened) polars DataFrame.
+    """
+    with open(path, "rb") as f_in:
+        with zstandard.ZstdDecompressor().stream_reader(f_in) as reader:
+            data = json.load(reader)
+    if as_frame:
+        from utils import convert_to_dataframe
+
+        return convert_to_dataframe(data["facilities"])
+    return data
+
+
+def save_default_data(facilities_data: dict, path: str = default_data_file) -> None:
+    """Replace the baseline with (scraped) facilities_data"""
+    tmp_name = f"{path}.tmp"
+    with open(tmp_name, "wb") as f_out:
+        _ = f_out.write(
+            zstandard.ZstdCompressor(level=19).compress(
+                json.dumps(facilities_data, ensure_ascii=False, default=str).encode("utf-8")
+            )
+        )
+    os.replace(tmp_name, path)
+
+
+def __getattr__(name: str):
+    # `default_data.facilities_data` still works, it's just read from the snapshot when first asked for
+    if name == "facilities_data":
+        return load_default_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
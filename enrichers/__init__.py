@@ -6,6 +6,7 @@ may call them
 
 import copy
 from schemas import enrich_resp_schema
+from typing import TYPE_CHECKING
 
 
 class Enrichment(object):
@@ -91,4 +92,18 @@ class Enrichment(object):
         return cleaned
 
 
-from .general import enrich_facility_data  # noqa: F401,E402
+# enrichment dispatch modes: asyncio tasks (searches in threads), or a pool of worker processes
+dispatch_modes = ["async", "process"]
+
+
+def __getattr__(name: str):
+    # the providers (and their dependencies) are only imported once enrichment is asked for
+    if name == "enrich_facility_data":
+        from .general import enrich_facility_data
+
+        return enrich_facility_data
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if TYPE_CHECKING:
+    from .general import enrich_facility_data  # noqa: F401
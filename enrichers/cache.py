@@ -0,0 +1,124 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from utils import (
+    logger,
+    output_folder,
+)
+
+default_enrichment_cache = f"{output_folder}enrichment_cache.sqlite3"
+# how long (in seconds) an answer stays good, per provider
+provider_ttls: dict = {
+    "openstreetmap": 90 * 24 * 60 * 60,
+    "wikidata": 30 * 24 * 60 * 60,
+    "wikipedia": 30 * 24 * 60 * 60,
+}
+# "nothing found" is cached too, but re-checked sooner in case a page/entry gets created
+negative_ttls: dict = {
+    "openstreetmap": 14 * 24 * 60 * 60,
+    "wikidata": 7 * 24 * 60 * 60,
+    "wikipedia": 7 * 24 * 60 * 60,
+}
+space_re = re.compile(r"\s+")
+
+
+class EnrichmentCache(object):
+    """
+    Persistent (SQLite) store of enrichment responses, keyed by provider and the
+    normalized facility name + address.
+    Also keeps an address -> coordinates table for offline geocoding.
+    Each thread opens its own connection.
+    """
+
+    def __init__(self, path: str = default_enrichment_cache) -> None:
+        self.path = path
+        # sqlite connections can't be shared between threads
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if not conn:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=60)
+            # several threads read and write at once
+            _ = conn.execute("PRAGMA journal_mode=WAL")
+            _ = conn.execute(
+                """CREATE TABLE IF NOT EXISTS enrichment (
+                    provider TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    found INTEGER NOT NULL,
+                    stored REAL NOT NULL,
+                    response TEXT NOT NULL,
+                    PRIMARY KEY (provider, key)
+                )"""
+            )
+            # coordinates don't move, so these never expire
+            _ = conn.execute(
+                """CREATE TABLE IF NOT EXISTS geocode (
+                    address TEXT PRIMARY KEY,
+                    stored REAL NOT NULL,
+                    coordinates TEXT NOT NULL
+                )"""
+            )
+            self._local.conn = conn
+        return conn
+
+    def key(self, name: str, address: dict | None = None) -> str:
+        """Normalized facility name + address"""
+        address = address or {}
+        parts = [name] + [
+            str(address.get(field, "")) for field in ["street", "locality", "administrative_area", "postal_code"]
+        ]
+        return "|".join(space_re.sub(" ", part).strip().upper() for part in parts)
+
+    def get(self, provider: str, name: str, address: dict | None = None) -> dict:
+        """Cached response, or an empty dict if we have nothing (fresh enough)"""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT found, stored, response FROM enrichment WHERE provider = ? AND key = ?",
+                (provider, self.key(name, address)),
+            )
+            .fetchone()
+        )
+        if not row:
+            return {}
+        found, stored, response = row
+        ttl = provider_ttls[provider] if found else negative_ttls[provider]
+        if time.time() - stored > ttl:
+            logger.debug("  Expired %s cache entry for %s", provider, name)
+            return {}
+        return json.loads(response)
+
+    def put(self, provider: str, name: str, address: dict | None, resp: dict) -> None:
+        """Store a response. Failed lookups (network errors etc.) aren't answers, so they're skipped"""
+        if any(str(step).startswith("(Failed") for step in resp.get("search_query_steps", [])):
+            return
+        conn = self._connection()
+        with conn:
+            _ = conn.execute(
+                "INSERT OR REPLACE INTO enrichment (provider, key, found, stored, response) VALUES (?, ?, ?, ?, ?)",
+                (
+                    provider,
+                    self.key(name, address),
+                    1 if resp.get("url", "") else 0,
+                    time.time(),
+                    json.dumps(resp, default=str),
+                ),
+            )
+
+    def get_coordinates(self, address: str) -> dict:
+        """Coordinates ({"latitude", "longitude", "url"}) we've geocoded this address to before"""
+        row = self._connection().execute("SELECT coordinates FROM geocode WHERE address = ?", (address,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def put_coordinates(self, address: str, coordinates: dict) -> None:
+        conn = self._connection()
+        with conn:
+            _ = conn.execute(
+                "INSERT OR REPLACE INTO geocode (address, stored, coordinates) VALUES (?, ?, ?)",
+                (address, time.time(), json.dumps(coordinates, default=str)),
+            )
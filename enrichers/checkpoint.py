@@ -0,0 +1,74 @@
+import copy
+import json
+import os
+from .incremental import (
+    enrichment_fields,
+    fingerprint,
+)
+from utils import (
+    logger,
+    output_folder,
+)
+
+default_checkpoint = f"{output_folder}enrichment_checkpoint.jsonl"
+
+
+class Checkpoint(object):
+    """
+    Append-only log of enrichment results, one JSON line per facility with only its enrichment blocks
+    (and the fingerprint of the facility they were found for), synced to disk as each one finishes.
+    A run that dies part way through can pick up from it (see load()).
+    """
+
+    def __init__(self, path: str = default_checkpoint, resume: bool = False) -> None:
+        self.path = path
+        if not resume and os.path.exists(path):
+            os.unlink(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._f = open(path, "a", encoding="utf-8")
+        if self._f.tell():
+            with open(path, "rb") as f_in:
+                _ = f_in.seek(-1, os.SEEK_END)
+                if f_in.read(1) != b"\n":
+                    # the last line was cut short, don't append to it
+                    _ = self._f.write("\n")
+
+    def load(self, facilities: dict) -> dict:
+        """
+        facility_id -> enriched facility, for facilities an earlier run enriched whose name/address is unchanged.
+        The logged enrichment blocks are merged into (a copy of) the facility we were given, so everything else
+        is this run's data. A line cut short by a crash is skipped.
+        """
+        done: dict = {}
+        with open(self.path, "r", encoding="utf-8") as f_in:
+            for line in f_in:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.debug("  Skipping incomplete checkpoint line: %s", line[:100])
+                    continue
+                if "enrichment" not in entry:
+                    # whole facilities, logged before only enrichment blocks were
+                    continue
+                facility = facilities.get(entry["facility_id"], {})
+                if facility and fingerprint(facility) == entry["fingerprint"]:
+                    resumed = copy.deepcopy(facility)
+                    resumed.update(entry["enrichment"])
+                    done[entry["facility_id"]] = resumed
+        logger.info("  Resuming: %s facilities already enriched in %s", len(done), self.path)
+        return done
+
+    def record(self, facility_id: str, facility: dict) -> None:
+        entry = {
+            "facility_id": facility_id,
+            "fingerprint": fingerprint(facility),
+            "enrichment": {field: facility[field] for field in enrichment_fields if field in facility},
+        }
+        _ = self._f.write(json.dumps(entry) + "\n")
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def finish(self) -> None:
+        """Enrichment completed, nothing to resume from"""
+        self._f.close()
+        os.unlink(self.path)
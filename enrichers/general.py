@@ -1,30 +1,105 @@
-from concurrent.futures import ProcessPoolExecutor
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import copy
+import queue
 from enrichers import (
     openstreetmap,
     wikidata,
     wikipedia,
 )
+from .cache import EnrichmentCache
+from .checkpoint import Checkpoint
+from .incremental import (
+    previous_output,
+    split_facilities,
+)
 from schemas import (
     facilities_schema,
 )
 import time
-from utils import logger
+from utils import (
+    get_http_cache,
+    get_rate_limiter,
+    init_worker,
+    logger,
+    mp_context,
+)
+
+# provider name -> enrichment class
+providers: dict = {
+    "wikipedia": wikipedia.Wikipedia,
+    "wikidata": wikidata.Wikidata,
+    "openstreetmap": openstreetmap.OpenStreetMap,
+}
+# searches allowed in flight per provider (requests are still paced by utils.host_rate_limits)
+provider_concurrency: dict = {
+    "openstreetmap": 2,
+    "wikidata": 8,
+    "wikipedia": 8,
+}
+# seconds a partly filled batch of Wikidata candidates waits for more before it's checked anyway
+wikidata_batch_wait = 2.0
+# state of a dispatch="process" worker, see _init_process_worker()
+_worker: dict = {}
 
 
-def enrich_facility_data(facilities_data: dict, workers: int = 3) -> dict:
-    """wrapper function for multiprocessing of facility enrichment"""
+def enrich_facility_data(
+    facilities_data: dict,
+    workers: int = 100,
+    use_cache: bool = True,
+    fan_out: bool = True,
+    osm_extract: str = "",
+    wikidata_index: str = "",
+    wikipedia_titles: str = "",
+    offline: bool = False,
+    incremental: bool = False,
+    resume: bool = False,
+    dispatch: str = "async",
+) -> dict:
+    """
+    wrapper function for concurrent facility enrichment (`workers` facilities in flight)
+    With fan_out, a facility's providers are searched at the same time rather than one after another.
+    With osm_extract (a local .osm/.osm.pbf file), OpenStreetMap matches come from that before the network.
+    With wikidata_index (see tools/ingest_wikidata_dump.py), Wikidata is searched offline.
+    With wikipedia_titles (see tools/ingest_wikipedia_titles.py), Wikipedia titles and redirects resolve locally,
+    and offline skips the Wikipedia full text search for names that don't resolve.
+    With incremental, only facilities whose name or address changed since the newest enriched JSON export
+    (or that are new, or had a provider fail) are enriched; the rest keep their previous enrichment.
+    Every enriched facility is written to a checkpoint log as it completes; with resume, facilities
+    already in the log (from a run that didn't finish) aren't enriched again.
+    With dispatch="process", searches run in a pool of worker processes instead of threads (see _dispatch_processes).
+    """
     start_time = time.time()
     logger.info("Starting data enrichment with external sources...")
+    sources: dict = {
+        "osm_extract": osm_extract,
+        "wikidata_index": wikidata_index,
+        "wikipedia_titles": wikipedia_titles,
+        "offline": offline,
+    }
+    _use_sources(**sources)
     enriched_data = copy.deepcopy(facilities_schema)
-    total = len(facilities_data["facilities"])
-    processed = 0
+    enrichment_cache = EnrichmentCache() if use_cache else None
 
-    with ProcessPoolExecutor(max_workers=workers) as pool:
-        for res in pool.map(_enrich_facility, facilities_data["facilities"].items()):
-            enriched_data["facilities"][res[0]] = res[1]  # type: ignore [index]
-            processed += 1
-            logger.info("  -> Finished %s, %s/%s completed", res[1]["name"], processed, total)
+    pending = facilities_data["facilities"]
+    carried: dict = {}
+    if incremental:
+        pending, carried = split_facilities(facilities_data["facilities"], previous_output())
+        logger.info("  Incremental run: enriching %s facilities, %s unchanged", len(pending), len(carried))
+    checkpoint = Checkpoint(resume=resume)
+    if resume:
+        carried.update(checkpoint.load(pending))
+        pending = {k: v for k, v in pending.items() if k not in carried}
+    enriched = asyncio.run(
+        _enrich_all(
+            pending, workers, enrichment_cache, enriched_data["enrich_cache"], checkpoint, fan_out, dispatch, sources
+        )
+    )
+    checkpoint.finish()
+    enriched.update(carried)
+    # results arrive in completion order, exports should keep ours
+    for facility_id in facilities_data["facilities"].keys():
+        enriched_data["facilities"][facility_id] = enriched[facility_id]  # type: ignore [index]
 
     logger.info("Data enrichment completed!")
     enriched_data["enrich_runtime"] = time.time() - start_time
@@ -32,20 +107,339 @@ def enrich_facility_data(facilities_data: dict, workers: int = 3) -> dict:
     return enriched_data
 
 
-def _enrich_facility(facility_data: tuple) -> tuple:
-    """enrich a single facility"""
-    facility_id, facility = facility_data
-    facility_name = facility["name"]
+async def _enrich_all(
+    facilities: dict,
+    workers: int,
+    enrichment_cache: EnrichmentCache | None,
+    cache_stats: dict,
+    checkpoint: Checkpoint | None = None,
+    fan_out: bool = True,
+    dispatch: str = "async",
+    sources: dict | None = None,
+) -> dict:
+    """
+    Each facility is a task; searches run in threads (requests is blocking), limited per provider.
+    Throughput is bound by the provider limits rather than by how many facilities we start.
+    With dispatch="process" the pre-passes still run here, the searches in worker processes.
+    Wikidata candidates are verified in batches as facilities find them (see _WikidataBatch).
+    """
+    loop = asyncio.get_running_loop()
+    # enough threads for every search we allow in flight
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=sum(provider_concurrency.values())))
+    semaphores = {provider: asyncio.Semaphore(limit) for provider, limit in provider_concurrency.items()}
+    in_flight = asyncio.Semaphore(workers)
+    payloads = {facility_id: _facility_payload(facility) for facility_id, facility in facilities.items()}
+    await _resolve_wikipedia_titles(payloads, enrichment_cache)
+    _local_geocode(payloads, enrichment_cache)
+    wikidata_batch = _WikidataBatch(payloads, enrichment_cache, semaphores["wikidata"])
+
+    async def _search(provider: str, facility_id: str, payload: dict, cache_hits: dict) -> dict:
+        if provider == "wikidata":
+            await wikidata_batch.prepare(facility_id)
+        async with semaphores[provider]:
+            return await asyncio.to_thread(_provider_search, provider, payload, enrichment_cache, cache_hits)
+
+    async def _enrich(facility_id: str, facility: dict) -> tuple:
+        async with in_flight:
+            payload = payloads[facility_id]
+            results: dict = {}
+            # provider -> answered from the enrichment cache?
+            cache_hits: dict = {}
+            if payload:
+                logger.info("Enriching facility %s...", payload["facility_name"])
+                if fan_out:
+                    # different hosts with their own limits, so a facility takes as long as its slowest lookup
+                    found = await asyncio.gather(
+                        *[_search(p, facility_id, payload, cache_hits) for p in providers.keys()]
+                    )
+                    results = dict(zip(providers.keys(), found))
+                else:
+                    for provider in providers.keys():
+                        results[provider] = await _search(provider, facility_id, payload, cache_hits)
+            return facility_id, _apply_results(facility, results), cache_hits
+
+    enriched: dict = {}
+    total = len(facilities)
+
+    def _finished(facility_id: str, enriched_facility: dict, cache_hits: dict) -> None:
+        enriched[facility_id] = enriched_facility
+        if checkpoint:
+            checkpoint.record(facility_id, enriched_facility)
+        for provider, hit in cache_hits.items():
+            stats = cache_stats.setdefault(provider, {"hits": 0, "misses": 0})
+            stats["hits" if hit else "misses"] += 1
+        logger.info("  -> Finished %s, %s/%s completed", enriched_facility["name"], len(enriched), total)
+
+    if dispatch == "process":
+        # a facility goes to the pool once its Wikidata candidates are verified
+        ready: queue.Queue = queue.Queue()
+
+        async def _prepare(facility_id: str) -> None:
+            async with in_flight:
+                await wikidata_batch.prepare(facility_id)
+            ready.put(facility_id)
+
+        cache_path = enrichment_cache.path if enrichment_cache else ""
+        dispatching = asyncio.create_task(
+            asyncio.to_thread(
+                _dispatch_processes, facilities, payloads, ready, workers, cache_path, sources or {}, fan_out, _finished
+            )
+        )
+        try:
+            await asyncio.gather(*[_prepare(k) for k, v in payloads.items() if v])
+        finally:
+            ready.put(None)
+        await dispatching
+        return enriched
+    for task in asyncio.as_completed([_enrich(k, v) for k, v in facilities.items()]):
+        _finished(*await task)
+    return enriched
+
+
+def _use_sources(
+    osm_extract: str = "", wikidata_index: str = "", wikipedia_titles: str = "", offline: bool = False
+) -> None:
+    """Switch providers over to the local data sources we were given"""
+    if osm_extract:
+        openstreetmap.use_extract(osm_extract)
+    if wikidata_index:
+        wikidata.use_offline_index(wikidata_index)
+    if wikipedia_titles:
+        wikipedia.use_title_index(wikipedia_titles, offline=offline)
+
+
+def _dispatch_processes(
+    facilities: dict,
+    payloads: dict,
+    ready: queue.Queue,
+    workers: int,
+    cache_path: str,
+    sources: dict,
+    fan_out: bool,
+    finished,
+) -> None:
+    """
+    Search in a pool of worker processes. Workers only receive the payload (name, address and pre-pass answers)
+    and only send back provider responses, which are folded into the facility here.
+    Facility IDs are taken from `ready` as their payloads are complete, up to a None.
+    Rate limits are shared through utils.RateLimiter; per-provider concurrency is bound by the pool size.
+    """
+    count = sum(1 for payload in payloads.values() if payload)
+    for facility_id, payload in payloads.items():
+        if not payload:
+            finished(facility_id, facilities[facility_id], {})
+    if not count:
+        return
+    # the pool's task handler thread waits on the queue, not us
+    tasks = ((facility_id, payloads[facility_id]) for facility_id in iter(ready.get, None))
+    processes = min(workers, max(provider_concurrency.values()))
+    with mp_context.Pool(
+        processes,
+        initializer=_init_process_worker,
+        initargs=(
+            get_rate_limiter(),
+            get_http_cache(),
+            cache_path,
+            # the extract was parsed here already, its index pickles much faster than a worker re-reads the file
+            {**sources, "osm_extract": ""},
+            openstreetmap.get_extract_index(),
+            logger.level,
+            fan_out,
+        ),
+    ) as pool:
+        results = pool.imap_unordered(_search_in_worker, tasks, chunksize=max(1, count // (processes * 4)))
+        for facility_id, found, cache_hits in results:
+            finished(facility_id, _apply_results(facilities[facility_id], found), cache_hits)
+
+
+def _init_process_worker(
+    limiter, http_cache, cache_path: str, sources: dict, osm_index, log_level: int, fan_out: bool
+) -> None:
+    """Pool initializer: the session, rate limiter, enrichment cache and local sources are set up once per worker"""
+    init_worker(limiter, http_cache, log_level)
+    # workers are spawned, so they open the local sources themselves (the Wikidata index and the title table
+    # are a SQLite file and a memory-mapped file, cheap to open); the OSM extract comes already loaded
+    _use_sources(**sources)
+    openstreetmap.use_index(osm_index)
+    _worker["cache"] = EnrichmentCache(cache_path) if cache_path else None
+    _worker["threads"] = ThreadPoolExecutor(max_workers=len(providers)) if fan_out else None
+
+
+def _search_in_worker(task: tuple) -> tuple:
+    """Pool task: every provider's response for one facility"""
+    facility_id, payload = task
+    cache_hits: dict = {}
+
+    def _search(provider: str) -> dict:
+        return _provider_search(provider, payload, _worker["cache"], cache_hits)
+
+    if _worker["threads"]:
+        found = list(_worker["threads"].map(_search, providers.keys()))
+    else:
+        found = [_search(provider) for provider in providers.keys()]
+    return facility_id, dict(zip(providers.keys(), found)), cache_hits
+
+
+async def _resolve_wikipedia_titles(payloads: dict, enrichment_cache: EnrichmentCache | None) -> None:
+    """
+    Pre-pass: look up every facility name as a Wikipedia title in batches,
+    so searches don't each have to download an article to find out whether it exists.
+    """
+    names = [
+        p["facility_name"]
+        for p in payloads.values()
+        if p and not (enrichment_cache and enrichment_cache.get("wikipedia", p["facility_name"], p["address"]))
+    ]
+    if not names:
+        return
+    resolved = await asyncio.to_thread(wikipedia.resolve_titles, names)
+    for payload in payloads.values():
+        if payload and payload["facility_name"] in resolved:
+            payload.setdefault("provider_args", {})["wikipedia"] = {"resolved": resolved[payload["facility_name"]]}
+
+
+class _WikidataBatch(object):
+    """
+    Wikidata candidates are collected as each facility's search finds them and checked with bulk wbgetentities
+    calls, a batch at a time: as soon as wikidata.entity_batch_size IDs are waiting, or wikidata_batch_wait
+    seconds after the first of them arrived. Facilities don't wait for everyone else's candidates,
+    and other providers' searches aren't held up at all.
+    """
+
+    def __init__(self, payloads: dict, enrichment_cache: EnrichmentCache | None, semaphore: asyncio.Semaphore) -> None:
+        self.payloads = payloads
+        self.semaphore = semaphore
+        # facilities the enrichment cache can't answer
+        self.pending = {
+            facility_id
+            for facility_id, p in payloads.items()
+            if p and not (enrichment_cache and enrichment_cache.get("wikidata", p["facility_name"], p["address"]))
+        }
+        # (candidate IDs, future for their verification) not yet sent
+        self._waiting: list = []
+        self._timer: asyncio.TimerHandle | None = None
+        # the event loop only keeps weak references to tasks
+        self._checks: set = set()
+
+    async def prepare(self, facility_id: str) -> None:
+        """Fill in the facility's Wikidata candidates and their verification (provider_args)"""
+        if facility_id not in self.pending:
+            return
+        self.pending.discard(facility_id)
+        payload = self.payloads[facility_id]
+        async with self.semaphore:
+            candidates = await asyncio.to_thread(
+                wikidata.Wikidata(
+                    facility_name=payload["facility_name"],
+                    # what _local_geocode found, the offline index uses it to tell same-named facilities apart
+                    coordinates=payload.get("provider_args", {}).get("openstreetmap", {}).get("known_coordinates", {}),
+                ).candidates
+            )
+        verified = await self._verify([result["id"] for result in candidates["search"]])
+        payload.setdefault("provider_args", {})["wikidata"] = {"candidates": candidates, "verified": verified}
+
+    async def _verify(self, qids: list[str]) -> dict:
+        if not qids:
+            return {}
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiting.append((qids, future))
+        if len({q for ids, _ in self._waiting for q in ids}) >= wikidata.entity_batch_size:
+            self._flush()
+        elif not self._timer:
+            self._timer = loop.call_later(wikidata_batch_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        waiting, self._waiting = self._waiting, []
+        if waiting:
+            task = asyncio.ensure_future(self._check(waiting))
+            self._checks.add(task)
+            task.add_done_callback(self._checks.discard)
+
+    async def _check(self, waiting: list) -> None:
+        try:
+            verified = await asyncio.to_thread(wikidata.verify_entities, [q for ids, _ in waiting for q in ids])
+        except Exception as e:
+            for _, future in waiting:
+                future.set_exception(e)
+            return
+        for qids, future in waiting:
+            future.set_result({q: verified[q] for q in qids if q in verified})
+
+
+def _local_geocode(payloads: dict, enrichment_cache: EnrichmentCache | None) -> None:
+    """
+    Pre-pass: find coordinates we already hold, so only true misses go to Nominatim.
+    Tiers, in order: Vera coordinates, the previous enriched export, the address cache.
+    """
+    previous = openstreetmap.previous_coordinates()
+    tiers: dict = {}
+    for payload in payloads.values():
+        if not payload:
+            continue
+        key = openstreetmap.address_key(payload["address"])
+        known: dict = {}
+        if payload["coordinates"]:
+            known = {"tier": "vera", **payload["coordinates"]}
+        elif key and key in previous:
+            known = {"tier": "previous_output", **previous[key]}
+        elif key and enrichment_cache:
+            cached = enrichment_cache.get_coordinates(key)
+            known = {"tier": "address_cache", **cached} if cached else {}
+        if known:
+            tiers[known["tier"]] = tiers.get(known["tier"], 0) + 1
+            payload.setdefault("provider_args", {})["openstreetmap"] = {"known_coordinates": known}
+    logger.info("  Coordinates known locally for %s facilities: %s", sum(tiers.values()), tiers)
+
+
+def _facility_payload(facility: dict) -> dict:
+    """The little a provider search needs to know about a facility (empty if we skip it)"""
     if len(facility["source_urls"]) == 1 and "vera-institute/ice-detention-trends" in facility["source_urls"][0]:
         logger.debug("  Skipping enrichment of facility with only vera.org data: %s", facility["name"])
-        return facility_id, facility
-    logger.info("Enriching facility %s...", facility_name)
-    enriched_facility = copy.deepcopy(facility)
+        return {}
+    osm = facility.get("osm", {})
+    coordinates = {}
+    if osm.get("latitude", 0) and osm.get("longitude", 0):
+        coordinates = {"latitude": osm["latitude"], "longitude": osm["longitude"]}
+    return {"facility_name": facility["name"], "address": facility.get("address", {}), "coordinates": coordinates}
 
-    wiki_res = wikipedia.Wikipedia(facility_name=facility_name).search()
-    wd_res = wikidata.Wikidata(facility_name=facility_name).search()
-    osm = openstreetmap.OpenStreetMap(facility_name=facility_name, address=facility.get("address", {}))
-    osm_res = osm.search()
+
+def _provider_search(provider: str, payload: dict, enrichment_cache: EnrichmentCache | None, cache_hits: dict) -> dict:
+    """Run one provider's search, answering from the enrichment cache when we can"""
+    name = payload["facility_name"]
+    address = payload["address"]
+    if enrichment_cache:
+        res = enrichment_cache.get(provider, name, address)
+        cache_hits[provider] = bool(res)
+        if res:
+            logger.debug("  Using cached %s result for %s", provider, name)
+            return res
+    res = providers[provider](
+        facility_name=name, address=address, **payload.get("provider_args", {}).get(provider, {})
+    ).search()
+    if enrichment_cache:
+        enrichment_cache.put(provider, name, address, res)
+        key = openstreetmap.address_key(address)
+        if provider == "openstreetmap" and res.get("method", "") == "nominatim" and res.get("url", "") and key:
+            details = res["details"]
+            enrichment_cache.put_coordinates(
+                key, {"latitude": details["latitude"], "longitude": details["longitude"], "url": res["url"]}
+            )
+    return res
+
+
+def _apply_results(facility: dict, results: dict) -> dict:
+    """Fold provider responses into (a copy of) the facility"""
+    if not results:
+        return facility
+    enriched_facility = copy.deepcopy(facility)
+    wiki_res = results["wikipedia"]
+    wd_res = results["wikidata"]
+    osm_res = results["openstreetmap"]
     url = wiki_res.get("url", None)
     if url:
         enriched_facility["wikipedia"]["page_url"] = url
@@ -64,6 +458,7 @@ def _enrich_facility(facility_data: tuple) -> tuple:
     if url:
         enriched_facility["osm"]["url"] = url
     enriched_facility["osm"]["search_query"] = osm_res.get("search_query_steps", "")
+    enriched_facility["osm"]["method"] = osm_res.get("method", "")
 
     logger.debug(enriched_facility)
-    return facility_id, enriched_facility
+    return enriched_facility
@@ -0,0 +1,62 @@
+import copy
+import glob
+import hashlib
+import json
+import os
+from utils import (
+    logger,
+    output_folder,
+)
+
+# facility blocks filled in by enrichment, carried forward from the previous run when a facility is unchanged
+enrichment_fields = ["wikipedia", "wikidata", "osm"]
+
+
+def previous_output(pattern: str = f"{output_folder}*_enriched.json") -> dict:
+    """Facilities of the newest enriched JSON export ({} if there isn't a readable one)"""
+    files = sorted(glob.glob(pattern), key=os.path.getmtime)
+    if not files:
+        return {}
+    try:
+        with open(files[-1], "r", encoding="utf-8") as f_in:
+            data = json.load(f_in)
+    except (OSError, ValueError) as e:
+        logger.warning("  Could not read previous output %s: %s", files[-1], e)
+        return {}
+    logger.debug("  Loaded %s facilities from %s", len(data.get("facilities", {})), files[-1])
+    return data.get("facilities", {})
+
+
+def fingerprint(facility: dict) -> str:
+    """What enrichment depends on: the facility's name and address"""
+    content = {"name": facility.get("name", ""), "address": facility.get("address", {})}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _failed(facility: dict) -> bool:
+    """Did any provider fail (rather than find nothing) for this facility last time?"""
+    return any(
+        "(Failed" in str(step)
+        for field in enrichment_fields
+        for step in facility.get(field, {}).get("search_query", [])
+    )
+
+
+def split_facilities(facilities: dict, previous: dict) -> tuple:
+    """
+    Returns (facility_id -> facility still to enrich, facility_id -> facility carried forward).
+    Carried facilities are the current record with the previous run's enrichment blocks.
+    """
+    changed: dict = {}
+    carried: dict = {}
+    for facility_id, facility in facilities.items():
+        before = previous.get(facility_id, {})
+        if not before or fingerprint(before) != fingerprint(facility) or _failed(before):
+            changed[facility_id] = facility
+            continue
+        carried_facility = copy.deepcopy(facility)
+        for field in enrichment_fields:
+            if field in before:
+                carried_facility[field] = before[field]
+        carried[facility_id] = carried_facility
+    return changed, carried
@@ -1,5 +1,53 @@
 from enrichers import Enrichment
-from utils import logger, req_get
+from .incremental import previous_output
+from .osm_extract import (
+    load_extract,
+    PrisonIndex,
+)
+from utils import (
+    logger,
+    output_folder,
+    req_get,
+)
+
+
+# prisons from a local OSM extract, see use_extract()
+_extract_index: PrisonIndex | None = None
+
+
+def use_extract(path: str) -> None:
+    """Match facilities against a local OSM extract before anything else"""
+    use_index(load_extract(path))
+
+
+def use_index(index: PrisonIndex | None) -> None:
+    """Match facilities against an already loaded extract (e.g. one handed to a worker process)"""
+    global _extract_index
+    _extract_index = index
+
+
+def get_extract_index() -> PrisonIndex | None:
+    return _extract_index
+
+
+def address_key(address: dict) -> str:
+    """Normalized address we geocode on (empty if we have no address)"""
+    parts = [
+        str(address.get(k, "")).strip().upper() for k in ["street", "locality", "administrative_area", "postal_code"]
+    ]
+    return "|".join(parts) if any(parts) else ""
+
+
+def previous_coordinates(pattern: str = f"{output_folder}*_enriched.json") -> dict:
+    """address -> {"latitude", "longitude", "url"} from the newest enriched JSON export"""
+    coordinates: dict = {}
+    for facility in previous_output(pattern).values():
+        osm = facility.get("osm", {})
+        key = address_key(facility.get("address", {}))
+        if key and osm.get("url", "") and osm.get("latitude", 0) and osm.get("longitude", 0):
+            coordinates[key] = {"latitude": osm["latitude"], "longitude": osm["longitude"], "url": osm["url"]}
+    logger.debug("  Loaded %s known coordinates", len(coordinates))
+    return coordinates
 
 
 class OpenStreetMap(Enrichment):
@@ -15,6 +63,34 @@ class OpenStreetMap(Enrichment):
         search_name = self._clean_facility_name(facility_name)
         search_url = "https://nominatim.openstreetmap.org/search"
         self.resp_info["enrichment_type"] = "openstreetmap"
+        # coordinates we already hold (Vera data, earlier output, address cache) win over asking Nominatim
+        known = self.search_args.get("known_coordinates", {})
+        if _extract_index:
+            match = _extract_index.match(
+                self._minimal_clean_facility_name(facility_name),
+                float(known["latitude"]) if known else None,
+                float(known["longitude"]) if known else None,
+                state=address.get("administrative_area", ""),
+            )
+            if match:
+                self.resp_info["method"] = "osm_extract"
+                self.resp_info["title"] = match["name"]
+                self.resp_info["details"] = {
+                    "latitude": match["latitude"],
+                    "longitude": match["longitude"],
+                    "class": "",
+                }
+                self.resp_info["search_query_steps"].append(f"[osm_extract] {match['name']}")  # type: ignore [attr-defined]
+                self.resp_info["url"] = f"https://www.openstreetmap.org/{match['type']}/{match['id']}"
+                return self.resp_info
+        if known:
+            lat = known["latitude"]
+            lon = known["longitude"]
+            self.resp_info["method"] = known["tier"]
+            self.resp_info["details"] = {"latitude": lat, "longitude": lon, "class": ""}
+            self.resp_info["search_query_steps"].append(f"[{known['tier']}] {lat}&{lon}")  # type: ignore [attr-defined]
+            self.resp_info["url"] = known.get("url", "") or f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}"
+            return self.resp_info
         self.resp_info["method"] = "nominatim"
         data = []
         if not address:
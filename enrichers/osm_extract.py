@@ -0,0 +1,195 @@
+import bz2
+import gzip
+import math
+from rapidfuzz import fuzz, process
+from utils import logger
+import xml.etree.ElementTree as ET
+
+# tags that mark a feature as a prison/detention facility
+prison_tags: dict = {
+    "amenity": ["prison"],
+    "building": ["prison"],
+}
+# grid cell size (degrees) of the spatial index
+cell_size = 0.1
+
+
+def _is_prison(tags: dict) -> bool:
+    return any(tags.get(k, "") in values for k, values in prison_tags.items())
+
+
+def _distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """haversine distance"""
+    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 6371 * 2 * math.asin(math.sqrt(a))
+
+
+class PrisonIndex(object):
+    """Prison features from an OSM extract, in a grid for proximity lookups"""
+
+    def __init__(self) -> None:
+        # (osm type, osm id, name, latitude, longitude, addr:state)
+        self.features: list = []
+        self.grid: dict = {}
+
+    def add(self, osm_type: str, osm_id: int, name: str, lat: float, lon: float, state: str = "") -> None:
+        self.grid.setdefault((int(lat // cell_size), int(lon // cell_size)), []).append(len(self.features))
+        self.features.append((osm_type, osm_id, name, lat, lon, state.strip().upper()))
+
+    def _nearby(self, lat: float, lon: float) -> list:
+        row = int(lat // cell_size)
+        col = int(lon // cell_size)
+        return [i for r in range(row - 1, row + 2) for c in range(col - 1, col + 2) for i in self.grid.get((r, c), [])]
+
+    def match(
+        self,
+        name: str,
+        lat: float | None = None,
+        lon: float | None = None,
+        state: str = "",
+        radius_km: float = 5,
+        min_score: int = 60,
+    ) -> dict:
+        """
+        Best feature for a facility: with coordinates, a feature within radius_km with a similar enough name
+        (a very close feature wins even without one), otherwise a strong name match among the features
+        tagged with the facility's state (no match without a state, names alone are too ambiguous nationwide).
+        """
+        candidates: dict = {}
+        if lat is not None and lon is not None:
+            for i in self._nearby(lat, lon):
+                feature_name, f_lat, f_lon = self.features[i][2:5]
+                distance = _distance_km(lat, lon, f_lat, f_lon)
+                if distance > radius_km:
+                    continue
+                score = fuzz.token_set_ratio(name.upper(), feature_name.upper()) if feature_name else 0
+                if score >= min_score or distance < 0.5:
+                    candidates[i] = score - distance * 5
+        elif state:
+            state = state.strip().upper()
+            names = {i: f[2].upper() for i, f in enumerate(self.features) if f[2] and f[5] == state}
+            # token_set_ratio would take "DETENTION CENTER" as a perfect match for any "... DETENTION CENTER"
+            best = process.extractOne(name.upper(), names, scorer=fuzz.token_sort_ratio, score_cutoff=90)
+            if best:
+                candidates[best[2]] = best[1]
+        if not candidates:
+            return {}
+        osm_type, osm_id, feature_name, f_lat, f_lon, _ = self.features[max(candidates, key=candidates.__getitem__)]
+        return {"type": osm_type, "id": osm_id, "name": feature_name, "latitude": f_lat, "longitude": f_lon}
+
+
+def _open(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    return open(path, "rb")
+
+
+def _load_xml(path: str, index: PrisonIndex) -> None:
+    """
+    Two streaming passes: the first finds prison nodes/ways (and the nodes those ways need),
+    the second collects the node coordinates to place each way at the centre of its nodes.
+    Multipolygon relations aren't followed.
+    Every finished element is dropped from the root, so memory doesn't grow with the size of the extract.
+    """
+    ways: dict = {}
+    needed: set = set()
+    with _open(path) as f_in:
+        root = None
+        for event, elem in ET.iterparse(f_in, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event == "start":
+                continue
+            if elem.tag == "node":
+                tags = {t.get("k"): t.get("v") for t in elem.iter("tag")}
+                if _is_prison(tags):
+                    index.add(
+                        "node",
+                        int(elem.get("id")),
+                        tags.get("name", ""),
+                        float(elem.get("lat")),
+                        float(elem.get("lon")),
+                        tags.get("addr:state", ""),
+                    )
+                root.clear()
+            elif elem.tag == "way":
+                tags = {t.get("k"): t.get("v") for t in elem.iter("tag")}
+                if _is_prison(tags):
+                    refs = [int(nd.get("ref")) for nd in elem.iter("nd")]
+                    ways[int(elem.get("id"))] = (tags.get("name", ""), tags.get("addr:state", ""), refs)
+                    needed.update(refs)
+                root.clear()
+            elif elem.tag == "relation":
+                root.clear()
+    coords: dict = {}
+    with _open(path) as f_in:
+        root = None
+        for event, elem in ET.iterparse(f_in, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event == "start":
+                continue
+            if elem.tag == "node":
+                if int(elem.get("id")) in needed:
+                    coords[int(elem.get("id"))] = (float(elem.get("lat")), float(elem.get("lon")))
+                root.clear()
+            elif elem.tag in ["way", "relation"]:
+                # nodes come first in an extract, nothing more to find
+                break
+    for way_id, (name, state, refs) in ways.items():
+        points = [coords[ref] for ref in dict.fromkeys(refs) if ref in coords]
+        if points:
+            index.add(
+                "way",
+                way_id,
+                name,
+                sum(p[0] for p in points) / len(points),
+                sum(p[1] for p in points) / len(points),
+                state,
+            )
+
+
+def _load_pbf(path: str, index: PrisonIndex) -> None:
+    try:
+        import osmium  # type: ignore [import-not-found]
+    except ImportError:
+        raise ImportError(
+            "Reading .pbf extracts needs the osmium package (`uv sync --extra pbf`), .osm (XML) extracts work without it"
+        )
+
+    class _Handler(osmium.SimpleHandler):
+        def node(self, n) -> None:
+            if _is_prison({t.k: t.v for t in n.tags}):
+                index.add(
+                    "node", n.id, n.tags.get("name", ""), n.location.lat, n.location.lon, n.tags.get("addr:state", "")
+                )
+
+        def way(self, w) -> None:
+            if _is_prison({t.k: t.v for t in w.tags}):
+                points = [(nd.location.lat, nd.location.lon) for nd in w.nodes if nd.location.valid()]
+                if points:
+                    index.add(
+                        "way",
+                        w.id,
+                        w.tags.get("name", ""),
+                        sum(p[0] for p in points) / len(points),
+                        sum(p[1] for p in points) / len(points),
+                        w.tags.get("addr:state", ""),
+                    )
+
+    _Handler().apply_file(path, locations=True)
+
+
+def load_extract(path: str) -> PrisonIndex:
+    """Build a PrisonIndex from a .osm(.gz/.bz2) or .osm.pbf extract"""
+    index = PrisonIndex()
+    logger.info("Loading prisons from OSM extract %s...", path)
+    if path.endswith(".pbf"):
+        _load_pbf(path, index)
+    else:
+        _load_xml(path, index)
+    logger.info("  Found %s prison features", len(index.features))
+    return index
@@ -1,19 +1,95 @@
 from enrichers import Enrichment
 from utils import logger, req_get
+from .wikidata_index import WikidataIndex
 
+search_url = "https://www.wikidata.org/w/api.php"
+# wbgetentities takes at most this many IDs per request
+entity_batch_size = 50
+# detention facility classes, their P279 (subclass of) descendants are too (see tools/ingest_wikidata_dump.py)
+facility_class_roots = [
+    "Q40357",  # prison
+]
+# terms in a P31 (instance of) class's label that make it a detention facility class
+class_terms = ["prison", "detention", "correctional", "jail", "penitentiary"]
+# P31 class -> is it a detention facility class? Filled in from class labels as we meet new classes.
+facility_classes: dict = {qid: True for qid in facility_class_roots}
 
-class Wikidata(Enrichment):
-    # wikidata can handle slightly more aggressive requests
-    _wait_time = 0.5
+# local index built from a Wikidata dump (tools/ingest_wikidata_dump.py), see use_offline_index()
+_offline_index: WikidataIndex | None = None
 
-    def search(self) -> dict:
+
+def use_offline_index(path: str) -> None:
+    """Answer searches and verification from a local index instead of the Wikidata API"""
+    global _offline_index
+    _offline_index = WikidataIndex(path)
+
+
+def _get_entities(qids: list[str], props: str) -> dict:
+    """wbgetentities in batches, returns qid -> entity (batches that fail are left out)"""
+    entities: dict = {}
+    qids = sorted(set(qids))
+    for start in range(0, len(qids), entity_batch_size):
+        params = {
+            "action": "wbgetentities",
+            "ids": "|".join(qids[start : start + entity_batch_size]),
+            "props": props,
+            "languages": "en",
+            "format": "json",
+        }
+        try:
+            entities.update(req_get(search_url, params=params, timeout=30).json().get("entities", {}))
+        except Exception as e:
+            logger.debug("  Wikidata entity lookup failed: %s", e)
+    return entities
+
+
+def _instance_of(entity: dict) -> list[str]:
+    """P31 values of an entity"""
+    return [
+        claim["mainsnak"]["datavalue"]["value"]["id"]
+        for claim in entity.get("claims", {}).get("P31", [])
+        if claim.get("mainsnak", {}).get("datavalue", {})
+    ]
+
+
+def verify_entities(qids: list[str]) -> dict:
+    """
+    Fetch candidate entities in bulk and check what they are an instance of.
+    Returns qid -> {"instance_of": [...], "description": str, "facility": bool}
+    """
+    if _offline_index:
+        return _offline_index.verify(qids)
+    entities = _get_entities(qids, "claims|descriptions")
+    unknown = [c for e in entities.values() for c in _instance_of(e) if c not in facility_classes]
+    for qid, entity in _get_entities(unknown, "labels").items():
+        label = entity.get("labels", {}).get("en", {}).get("value", "").lower()
+        facility_classes[qid] = any(term in label for term in class_terms)
+    verified = {}
+    for qid, entity in entities.items():
+        classes = _instance_of(entity)
+        verified[qid] = {
+            "instance_of": classes,
+            "description": entity.get("descriptions", {}).get("en", {}).get("value", ""),
+            "facility": any(facility_classes.get(c, False) for c in classes),
+        }
+    return verified
+
+
+class Wikidata(Enrichment):
+    def candidates(self) -> dict:
+        """wbsearchentities results for the facility, plus the search steps taken to get them"""
         facility_name = self.search_args["facility_name"]
         # Fetches 3 results based on _clean_facility_name (not exact name). todo: needs adjustment.
-        # Falls back to first result (usually truncated, eg. county)
         search_name_fallback = self._clean_facility_name(facility_name)
-        self.resp_info["enrichment_type"] = "wikidata"
         logger.debug("Searching wikidata for %s and %s", facility_name, search_name_fallback)
-        search_url = "https://www.wikidata.org/w/api.php"
+        if _offline_index:
+            coordinates = self.search_args.get("coordinates", {})
+            latitude = float(coordinates["latitude"]) if coordinates else None
+            longitude = float(coordinates["longitude"]) if coordinates else None
+            results = _offline_index.search(facility_name, latitude=latitude, longitude=longitude) or (
+                _offline_index.search(search_name_fallback, latitude=latitude, longitude=longitude)
+            )
+            return {"search": results, "search_query_steps": [f"[offline] {facility_name}"]}
         params = {
             "facility_name": {
                 "action": "wbsearchentities",
@@ -30,29 +106,47 @@ class Wikidata(Enrichment):
                 "limit": 3,
             },
         }
+        steps: list = []
         data = {}
         for search, params in params.items():
-            self.resp_info["search_query_steps"].append(params["search"])  # type: ignore [attr-defined]
+            steps.append(params["search"])
             try:
-                response = req_get(search_url, params=params, wait_time=self._wait_time)
+                response = req_get(search_url, params=params)
                 data = response.json()
                 break
             except Exception as e:
                 logger.debug("  Wikidata search error for '%s': %s", facility_name, e)
-                self.resp_info["search_query_steps"].append(f"(Failed -> {e})")  # type: ignore [attr-defined]
-        if not data.get("search"):
+                steps.append(f"(Failed -> {e})")
+        return {"search": data.get("search", []), "search_query_steps": steps}
+
+    def search(self) -> dict:
+        self.resp_info["enrichment_type"] = "wikidata"
+        # candidates/verified may come from a batch pre-pass over many facilities
+        candidates = self.search_args.get("candidates", None)
+        if candidates is None:
+            candidates = self.candidates()
+        self.resp_info["search_query_steps"].extend(candidates["search_query_steps"])  # type: ignore [attr-defined]
+        results = candidates["search"]
+        if not results:
             return self.resp_info
+        verified = self.search_args.get("verified", None)
+        if verified is None:
+            verified = verify_entities([result["id"] for result in results])
         match_terms = ["prison", "detention", "correctional", "jail", "facility", "processing"]
-        for result in data["search"]:
-            description = result.get("description", "").lower()
-            if any(term in description for term in match_terms):
-                self.resp_info["url"] = f"https://www.wikidata.org/wiki/{result['id']}"
-                self.resp_info["title"] = result.get("label", "")
-                break
-        else:
-            # fall back to first result
-            first = data["search"][0]
-            logger.debug("   Closer matching failed, falling back to first result %s", first)
-            self.resp_info["url"] = f"https://www.wikidata.org/wiki/{first['id']}"
-            self.resp_info["title"] = first.get("label", "")
+        # prefer what an entity is (P31), then what its description says, then the first result
+        chosen = next((r for r in results if verified.get(r["id"], {}).get("facility", False)), None)
+        self.resp_info["method"] = "instance_of"
+        if not chosen:
+            chosen = next(
+                (r for r in results if any(term in r.get("description", "").lower() for term in match_terms)), None
+            )
+            self.resp_info["method"] = "description"
+        if not chosen:
+            # fall back to first result (usually truncated, eg. county)
+            chosen = results[0]
+            logger.debug("   Closer matching failed, falling back to first result %s", chosen)
+            self.resp_info["method"] = "first_result"
+        self.resp_info["url"] = f"https://www.wikidata.org/wiki/{chosen['id']}"
+        self.resp_info["title"] = chosen.get("label", "")
+        self.resp_info["details"] = {"instance_of": verified.get(chosen["id"], {}).get("instance_of", [])}
         return self.resp_info
@@ -0,0 +1,231 @@
+import bz2
+import gzip
+import json
+import os
+import re
+from rapidfuzz import fuzz
+import sqlite3
+import tempfile
+import threading
+from typing import Iterator
+from utils import logger
+from .osm_extract import _distance_km
+
+non_word_re = re.compile(r"[^0-9a-z]+")
+# name trigrams a query has to share with an entity before we score it
+min_shared_grams = 2
+# with coordinates to compare, entities placed further away than this (km) aren't the facility
+max_distance_km = 25.0
+
+
+def _normalize(name: str) -> str:
+    return " ".join(non_word_re.sub(" ", name.lower()).split())
+
+
+def _grams(name: str) -> set:
+    """character trigrams of a normalized name (padded so short words still count)"""
+    padded = f" {_normalize(name)} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _open(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_dump(path: str) -> Iterator[dict]:
+    """
+    Entities of a Wikidata JSON dump, one at a time.
+    Dumps are one big array with an entity per line, so we never hold more than one line.
+    """
+    with _open(path) as f_in:
+        for line in f_in:
+            line = line.strip().rstrip(",")
+            if not line or line in ["[", "]"]:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                logger.warning("  Skipping unreadable dump line (%s): %s", e, line[:100])
+
+
+def _claim_values(entity: dict, prop: str) -> list:
+    return [
+        claim["mainsnak"]["datavalue"]["value"]
+        for claim in entity.get("claims", {}).get(prop, [])
+        if claim.get("mainsnak", {}).get("datavalue", {})
+    ]
+
+
+def find_facility_classes(path: str, roots: list[str]) -> set:
+    """
+    First pass over the dump: the root classes and every class that is (through any number of steps)
+    a P279 "subclass of" one of them. Labels aren't looked at, "detention basin" isn't a facility.
+    Subclass links are collected in a temporary SQLite table, so the pass runs in constant memory.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        conn = sqlite3.connect(os.path.join(tmp_dir, "subclass.sqlite3"))
+        _ = conn.execute("CREATE TABLE subclass (child TEXT NOT NULL, parent TEXT NOT NULL)")
+        links = 0
+        for entity in iter_dump(path):
+            parents = [v["id"] for v in _claim_values(entity, "P279")]
+            if not parents:
+                continue
+            _ = conn.executemany("INSERT INTO subclass VALUES (?, ?)", [(entity["id"], p) for p in parents])
+            links += len(parents)
+            if links % 100000 < len(parents):
+                conn.commit()
+        _ = conn.execute("CREATE INDEX parent_idx ON subclass (parent)")
+        # UNION (not UNION ALL) drops classes we've already seen, so subclass cycles end
+        rows = conn.execute(
+            f"""WITH RECURSIVE facility_class(qid) AS (
+                    VALUES {",".join(["(?)"] * len(roots))}
+                    UNION SELECT child FROM subclass JOIN facility_class ON parent = facility_class.qid
+                )
+                SELECT qid FROM facility_class""",
+            roots,
+        ).fetchall()
+        conn.close()
+    classes = {qid for (qid,) in rows}
+    logger.info("  Found %s detention facility classes (%s subclass links)", len(classes), links)
+    return classes
+
+
+def build_index(path: str, index_path: str, classes: set) -> int:
+    """Second pass: write every entity that is an instance of `classes` to a SQLite index"""
+    if os.path.exists(index_path):
+        os.unlink(index_path)
+    conn = sqlite3.connect(index_path)
+    with conn:
+        _ = conn.executescript(
+            """
+            CREATE TABLE entity (
+                qid TEXT PRIMARY KEY,
+                label TEXT NOT NULL,
+                description TEXT NOT NULL,
+                instance_of TEXT NOT NULL,
+                latitude REAL,
+                longitude REAL,
+                country TEXT NOT NULL
+            );
+            CREATE TABLE name (qid TEXT NOT NULL, name TEXT NOT NULL);
+            CREATE TABLE gram (gram TEXT NOT NULL, qid TEXT NOT NULL);
+            """
+        )
+    kept = 0
+    for entity in iter_dump(path):
+        instance_of = [v["id"] for v in _claim_values(entity, "P31")]
+        if not any(c in classes for c in instance_of):
+            continue
+        label = entity.get("labels", {}).get("en", {}).get("value", "")
+        names = {label} | {alias["value"] for alias in entity.get("aliases", {}).get("en", [])}
+        names.discard("")
+        if not names:
+            continue
+        coords = _claim_values(entity, "P625")
+        countries = _claim_values(entity, "P17")
+        _ = conn.execute(
+            "INSERT OR REPLACE INTO entity VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                entity["id"],
+                label,
+                entity.get("descriptions", {}).get("en", {}).get("value", ""),
+                ",".join(instance_of),
+                coords[0]["latitude"] if coords else None,
+                coords[0]["longitude"] if coords else None,
+                countries[0]["id"] if countries else "",
+            ),
+        )
+        _ = conn.executemany("INSERT INTO name VALUES (?, ?)", [(entity["id"], n) for n in names])
+        grams = set().union(*[_grams(n) for n in names])
+        _ = conn.executemany("INSERT INTO gram VALUES (?, ?)", [(g, entity["id"]) for g in grams])
+        kept += 1
+        if kept % 1000 == 0:
+            conn.commit()
+            logger.info("  %s entities indexed...", kept)
+    with conn:
+        _ = conn.execute("CREATE INDEX gram_idx ON gram (gram)")
+        _ = conn.execute("CREATE INDEX name_idx ON name (qid)")
+    conn.close()
+    logger.info("  Indexed %s entities in %s", kept, index_path)
+    return kept
+
+
+class WikidataIndex(object):
+    """Read side of the index build_index() writes"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        # sqlite connections can't be shared between threads
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if not conn:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            self._local.conn = conn
+        return conn
+
+    def search(
+        self,
+        name: str,
+        limit: int = 3,
+        min_score: int = 70,
+        latitude: float | None = None,
+        longitude: float | None = None,
+    ) -> list:
+        """
+        Entities named most like `name` (scoring at least min_score), shaped like wbsearchentities results.
+        With the facility's coordinates, entities placed more than max_distance_km away are dropped
+        and the nearest of equally named entities comes first (entities without coordinates come after those).
+        """
+        grams = list(_grams(name))
+        if not grams:
+            return []
+        conn = self._connection()
+        rows = conn.execute(
+            f"""SELECT qid FROM gram WHERE gram IN ({",".join("?" * len(grams))})
+                GROUP BY qid HAVING COUNT(*) >= ? ORDER BY COUNT(*) DESC LIMIT 50""",
+            [*grams, min(min_shared_grams, len(grams))],
+        ).fetchall()
+        scored = []
+        for (qid,) in rows:
+            names = [n for (n,) in conn.execute("SELECT name FROM name WHERE qid = ?", (qid,))]
+            scored.append((max(fuzz.token_set_ratio(_normalize(name), _normalize(n)) for n in names), qid))
+        ranked = []
+        for score, qid in sorted([s for s in scored if s[0] >= min_score], reverse=True):
+            label, description, e_lat, e_lon = conn.execute(
+                "SELECT label, description, latitude, longitude FROM entity WHERE qid = ?", (qid,)
+            ).fetchone()
+            distance = float("inf")
+            if latitude is not None and longitude is not None and e_lat is not None and e_lon is not None:
+                distance = _distance_km(latitude, longitude, e_lat, e_lon)
+                if distance > max_distance_km:
+                    continue
+            ranked.append((-score, distance, {"id": qid, "label": label, "description": description, "score": score}))
+        return [result for _, _, result in sorted(ranked, key=lambda r: r[:2])[:limit]]
+
+    def verify(self, qids: list[str]) -> dict:
+        """Same shape as wikidata.verify_entities; everything in the index is a facility"""
+        verified = {}
+        for qid in set(qids):
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT instance_of, description, latitude, longitude, country FROM entity WHERE qid = ?", (qid,)
+                )
+                .fetchone()
+            )
+            if row:
+                verified[qid] = {
+                    "instance_of": row[0].split(","),
+                    "description": row[1],
+                    "facility": True,
+                    "latitude": row[2],
+                    "longitude": row[3],
+                    "country": row[4],
+                }
+        return verified
@@ -1,10 +1,115 @@
 from enrichers import Enrichment
 from urllib.parse import quote
 from utils import logger, req_get
+from .wikipedia_titles import TitleIndex
+
+# the MediaWiki API resolves at most this many titles per request
+title_batch_size = 50
+# local title/redirect table (tools/ingest_wikipedia_titles.py), see use_title_index()
+_title_index: TitleIndex | None = None
+# with a title index, never fall back to the network
+_offline = False
+
+
+def use_title_index(prefix: str, offline: bool = False) -> None:
+    """Resolve titles and redirects from a local title table rather than the API"""
+    global _title_index, _offline
+    _title_index = TitleIndex(prefix)
+    _offline = offline
+
+
+def _resolve_local(name: str) -> dict:
+    """resolve_titles() answer for one name, from the local title table"""
+    page = _title_index.resolve(_as_title(name)) if _title_index else {}
+    if not page:
+        return {
+            "title": _as_title(name),
+            "url": "",
+            "missing": True,
+            "disambiguation": False,
+            "description": "",
+            "extract": "",
+        }
+    final = page["title"]
+    return {
+        "title": final,
+        "url": f"{Wikipedia.static_search}{quote(final.replace(' ', '_'))}",
+        "missing": False,
+        # the suffix still catches pages from a table built without page_props
+        "disambiguation": page["disambiguation"] or final.endswith("(disambiguation)"),
+        "description": "",
+        "extract": "",
+    }
+
+
+def _as_title(name: str) -> str:
+    """A facility name as a page title ("|" separates titles in API calls)"""
+    return " ".join(name.replace("|", " ").replace("_", " ").split())
+
+
+def resolve_titles(names: list[str]) -> dict:
+    """
+    Look up facility names as page titles, `title_batch_size` per API call.
+    Returns name -> {"title", "url", "missing", "disambiguation", "description", "extract"} (following redirects),
+    where extract is the plain text introduction of the article.
+    Names in batches that failed are left out, so callers can fall back to fetching the page.
+    """
+    if _title_index:
+        return {name: _resolve_local(name) for name in names}
+    titles = sorted({_as_title(name) for name in names if _as_title(name)})
+    pages: dict = {}
+    for start in range(0, len(titles), title_batch_size):
+        batch = titles[start : start + title_batch_size]
+        params = {
+            "action": "query",
+            "titles": "|".join(batch),
+            "redirects": 1,
+            "prop": "pageprops|info|extracts",
+            "ppprop": "disambiguation|wikibase-shortdesc",
+            "inprop": "url",
+            "exintro": 1,
+            "explaintext": 1,
+            "exlimit": "max",
+            "format": "json",
+            "formatversion": 2,
+        }
+        try:
+            data = req_get(Wikipedia.api_search, params=params, timeout=30).json()
+            query = data["query"]
+            found = {page["title"]: page for page in query.get("pages", [])}
+            # introductions come at most 20 to a response, the rest through continuation
+            while "continue" in data:
+                data = req_get(Wikipedia.api_search, params={**params, **data["continue"]}, timeout=30).json()
+                for page in data["query"].get("pages", []):
+                    if page.get("extract") and page["title"] in found:
+                        found[page["title"]]["extract"] = page["extract"]
+        except Exception as e:
+            logger.debug("  Wikipedia title lookup failed for %s titles: %s", len(batch), e)
+            continue
+        # requested title -> final title, through normalization and redirects
+        moved = {m["from"]: m["to"] for m in query.get("normalized", []) + query.get("redirects", [])}
+        for title in batch:
+            final = title
+            # redirect chains are short, but never loop forever
+            for _ in range(5):
+                if final not in moved:
+                    break
+                final = moved[final]
+            page = found.get(final, {})
+            props = page.get("pageprops", {})
+            pages[title] = {
+                "title": page.get("title", final),
+                "url": page.get("fullurl", ""),
+                "missing": not page or page.get("missing", False) or page.get("invalid", False),
+                "disambiguation": "disambiguation" in props,
+                "description": props.get("wikibase-shortdesc", ""),
+                "extract": page.get("extract", ""),
+            }
+    logger.debug("  Resolved %s Wikipedia titles in %s requests", len(pages), -(-len(titles) // title_batch_size))
+    return {name: pages[_as_title(name)] for name in names if _as_title(name) in pages}
 
 
 class Wikipedia(Enrichment):
-    _wait_time = 0.5
     static_search: str = "https://en.wikipedia.org/wiki/"
     api_search: str = "https://en.wikipedia.org/w/api.php"
     facility_terms: list = [
@@ -27,12 +132,54 @@ class Wikipedia(Enrichment):
         # Clean facility name for search
         search_name: str = self._clean_facility_name(facility_name)
         logger.debug("Searching Wikipedia for %s", facility_name)
+        resolved = self.search_args.get("resolved", None)
+        if _title_index:
+            # resolving locally is cheap, so try every variation of the name
+            for name in [facility_name, search_name, self._minimal_clean_facility_name(facility_name)]:
+                resolved = _resolve_local(name)
+                if not resolved["missing"]:
+                    break
+        if resolved is not None:
+            # title already looked up in a batch (see resolve_titles), no need to fetch the article
+            step = (
+                f"[local] {resolved['title']}"
+                if _title_index
+                else f"{self.api_search}?titles={_as_title(facility_name)}"
+            )
+            self.resp_info["search_query_steps"].append(step)  # type: ignore [attr-defined]
+            if resolved["missing"]:
+                self.resp_info["search_query_steps"].append("[no_page]")  # type: ignore [attr-defined]
+            elif not resolved["disambiguation"]:
+                # missing and disambiguation pages are settled without downloading anything, for a page that exists
+                # the title, short description and introduction stand in for the article in the direct access checks
+                # (hatnotes aren't part of the introduction, but disambiguation pages are already out)
+                context = f"{resolved['title']} {resolved['description']} {resolved['extract']}"
+                accepted = False
+                if _offline or resolved["description"] or resolved["extract"]:
+                    # (offline, that's only the title)
+                    accepted = self._is_facility_page(context, search_name)
+                else:
+                    self.resp_info["search_query_steps"].append(resolved["url"])  # type: ignore [attr-defined]
+                    try:
+                        accepted = self._is_facility_page(req_get(resolved["url"]).text, search_name)
+                    except Exception as e:
+                        logger.debug("  Wikipedia search error for '%s': %s", resolved["url"], e)
+                        self.resp_info["search_query_steps"].append(f"(Failed -> {e})")  # type: ignore [attr-defined]
+                if accepted:
+                    self.resp_info["url"] = resolved["url"]
+                    self.resp_info["method"] = "direct_access"
+                    return self.resp_info
+                self.resp_info["search_query_steps"].append("[REJECTED: false_positive or no_facility_context]")  # type: ignore [attr-defined]
+            else:
+                self.resp_info["search_query_steps"].append("[REJECTED: false_positive or no_facility_context]")  # type: ignore [attr-defined]
+            return self._api_search(facility_name, search_name)
+
         # Try direct page access first (replace space with underscores is the only change)
         wiki_url = f"{self.static_search}{quote(facility_name.replace(' ', '_').replace('|', '_'))}"
         self.resp_info["search_query_steps"].append(wiki_url)  # type: ignore [attr-defined]
         initial_response = False
         try:
-            response = req_get(wiki_url, wait_time=self._wait_time)
+            response = req_get(wiki_url)
             initial_response = True
         except Exception as e:
             logger.debug("  Wikipedia search error for '%s': %s", wiki_url, e)
@@ -40,41 +187,51 @@ class Wikipedia(Enrichment):
             wiki_url = f"{self.static_search}{quote(facility_name.replace(' ', '_').replace('|', '_'))}"
             self.resp_info["search_query_steps"].append(wiki_url)  # type: ignore [attr-defined]
             try:
-                response = req_get(wiki_url, wait_time=self._wait_time)
+                response = req_get(wiki_url)
                 initial_response = True
             except Exception as e:
                 logger.debug("  Wikipedia search error for '%s': %s", wiki_url, e)
                 self.resp_info["search_query_steps"].append(f"(Failed -> {e})")  # type: ignore [attr-defined]
 
         if initial_response:
-            # Check if we got a real article (not a disambiguation or search page)
-            page_text = response.text.lower()
-
-            # Enhanced false positive detection
-            false_positive_indicators = [
-                "may refer to:",  # Disambiguation page
-                "did you mean",  # Search suggestion
-                "disambiguation)",  # Disambiguation in title
-                "is a disambiguation",  # Disambiguation description
-                "this article is about",  # Generic topic page
-                "for other uses",  # Disambiguation header
-            ]
-
-            # Additional check: ensure result is actually about a detention facility
-            is_false_positive = any(indicator in page_text for indicator in false_positive_indicators)
-            has_facility_context = any(indicator in page_text for indicator in self.facility_terms)
-
-            # Only accept if it's not a false positive AND has facility context
-            # OR if the cleaned name still contains facility-related terms
-            facility_terms_in_name = any(term in search_name.lower() for term in self.facility_terms)
-
-            if not is_false_positive and (has_facility_context or facility_terms_in_name):
+            if self._is_facility_page(response.text, search_name):
                 self.resp_info["url"] = response.url
                 self.resp_info["method"] = "direct_access"
                 return self.resp_info
             else:
                 self.resp_info["search_query_steps"].append("[REJECTED: false_positive or no_facility_context]")  # type: ignore [attr-defined]
 
+        return self._api_search(facility_name, search_name)
+
+    def _is_facility_page(self, page_text: str, search_name: str) -> bool:
+        """Is this a real article (not a disambiguation or search page) about a detention facility?"""
+        page_text = page_text.lower()
+
+        # Enhanced false positive detection
+        false_positive_indicators = [
+            "may refer to:",  # Disambiguation page
+            "did you mean",  # Search suggestion
+            "disambiguation)",  # Disambiguation in title
+            "is a disambiguation",  # Disambiguation description
+            "this article is about",  # Generic topic page
+            "for other uses",  # Disambiguation header
+        ]
+
+        # Additional check: ensure result is actually about a detention facility
+        is_false_positive = any(indicator in page_text for indicator in false_positive_indicators)
+        has_facility_context = any(indicator in page_text for indicator in self.facility_terms)
+
+        # Only accept if it's not a false positive AND has facility context
+        # OR if the cleaned name still contains facility-related terms
+        facility_terms_in_name = any(term in search_name.lower() for term in self.facility_terms)
+        return not is_false_positive and (has_facility_context or facility_terms_in_name)
+
+    def _api_search(self, facility_name: str, search_name: str) -> dict:
+        """Full text search for the facility, used when there's no page under its name"""
+        if _offline:
+            self.resp_info["search_query_steps"].append("[offline: no_title_match]")  # type: ignore [attr-defined]
+            self.resp_info["method"] = "failed"
+            return self.resp_info
         logger.debug("  Falling back to Wikipedia API searches for %s and %s", facility_name, search_name)
         # If direct access fails, try Wikipedia search API with original name first
         search_queries = [
@@ -101,7 +258,7 @@ class Wikipedia(Enrichment):
             }
 
             try:
-                response = req_get(self.api_search, params=params, wait_time=self._wait_time)
+                response = req_get(self.api_search, params=params)
                 data = response.json()
             except Exception as e:
                 logger.debug("   Wikipedia search for %s failed: %s", self.api_search, e)
@@ -161,7 +318,7 @@ class Wikipedia(Enrichment):
 
                         # Verify the page exists and isn't a redirect to something unrelated
                         try:
-                            verify_response = req_get(final_url, wait_time=self._wait_time)
+                            verify_response = req_get(final_url)
                         except Exception as e:
                             logger.debug("    Wikipedia query for %s failed: %s", final_url, e)
                             self.resp_info["search_query_steps"].append(final_url)  # type: ignore [attr-defined]
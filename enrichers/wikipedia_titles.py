@@ -0,0 +1,196 @@
+"""
+A sorted, memory-mapped table of every enwiki article title (and where redirects point).
+Built from the dumps at https://dumps.wikimedia.org/enwiki/latest/:
+  * enwiki-latest-all-titles-in-ns0.gz
+  * enwiki-latest-page.sql.gz (which pages are redirects, and their IDs)
+  * enwiki-latest-redirect.sql.gz (redirect targets by page ID)
+  * enwiki-latest-page_props.sql.gz (which pages are disambiguation pages, by page ID)
+
+<prefix>.titles holds "key\\ttitle\\ttarget\\tdisambiguation\\n" lines sorted by key (the lower-cased title),
+<prefix>.offsets the byte offset of each line, so lookups are a binary search over the mmap.
+"""
+
+from array import array
+import gzip
+import mmap
+import os
+import re
+import sqlite3
+from typing import Iterator
+from utils import logger
+
+
+# (page_id, namespace, 'title', is_redirect, ...
+page_row_re = re.compile(r"\((\d+),(-?\d+),'((?:[^'\\]|\\.)*)',([01]),")
+# (rd_from, rd_namespace, 'rd_title', ...
+redirect_row_re = re.compile(r"\((\d+),(-?\d+),'((?:[^'\\]|\\.)*)',")
+# (pp_page, 'disambiguation', ...
+disambiguation_row_re = re.compile(r"\((\d+),'disambiguation',")
+# redirects followed from one title before we give up on it
+max_redirect_hops = 5
+escape_re = re.compile(r"\\(.)")
+
+
+def title_key(title: str) -> str:
+    return " ".join(title.replace("_", " ").split()).lower()
+
+
+def _open(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def _sql_rows(path: str, row_re: re.Pattern) -> Iterator[tuple]:
+    """Rows of the INSERT statements in a MediaWiki SQL dump, streamed"""
+    with _open(path) as f_in:
+        for line in f_in:
+            if not line.startswith("INSERT INTO"):
+                continue
+            for match in row_re.finditer(line):
+                yield match.groups()
+
+
+def build_title_index(all_titles: str, page_sql: str, redirect_sql: str, page_props_sql: str, prefix: str) -> int:
+    """Join the four dumps (in a scratch SQLite file, so memory stays flat) and write the sorted table"""
+    scratch = f"{prefix}.scratch.sqlite3"
+    if os.path.exists(scratch):
+        os.unlink(scratch)
+    conn = sqlite3.connect(scratch)
+    _ = conn.executescript(
+        """
+        PRAGMA journal_mode=OFF;
+        PRAGMA synchronous=OFF;
+        CREATE TABLE redirect (page_id INTEGER PRIMARY KEY, target TEXT NOT NULL);
+        CREATE TABLE disambiguation (page_id INTEGER PRIMARY KEY);
+        CREATE TABLE title (key TEXT NOT NULL, title TEXT NOT NULL, target TEXT NOT NULL, disambiguation INTEGER);
+        """
+    )
+    logger.info("Reading redirect targets from %s...", redirect_sql)
+    _ = conn.executemany(
+        "INSERT OR REPLACE INTO redirect VALUES (?, ?)",
+        (
+            (int(page_id), escape_re.sub(r"\1", target))
+            for page_id, ns, target in _sql_rows(redirect_sql, redirect_row_re)
+            if ns == "0"
+        ),
+    )
+    conn.commit()
+    logger.info("Reading disambiguation pages from %s...", page_props_sql)
+    _ = conn.executemany(
+        "INSERT OR IGNORE INTO disambiguation VALUES (?)",
+        ((int(page_id),) for (page_id,) in _sql_rows(page_props_sql, disambiguation_row_re)),
+    )
+    conn.commit()
+    logger.info("Reading redirect and disambiguation pages from %s...", page_sql)
+    pages = (
+        (int(page_id), escape_re.sub(r"\1", title), is_redirect == "1")
+        for page_id, ns, title, is_redirect in _sql_rows(page_sql, page_row_re)
+        if ns == "0"
+    )
+    for page_id, title, is_redirect in pages:
+        if is_redirect:
+            row = conn.execute("SELECT target FROM redirect WHERE page_id = ?", (page_id,)).fetchone()
+            if row:
+                _ = conn.execute("INSERT INTO title VALUES (?, ?, ?, 0)", (title_key(title), title, row[0]))
+        elif conn.execute("SELECT 1 FROM disambiguation WHERE page_id = ?", (page_id,)).fetchone():
+            _ = conn.execute("INSERT INTO title VALUES (?, ?, '', 1)", (title_key(title), title))
+    conn.commit()
+    logger.info("Reading titles from %s...", all_titles)
+    with _open(all_titles) as f_in:
+        titles = (line.rstrip("\n") for line in f_in)
+        # redirects and disambiguation pages are listed here as well, the GROUP BY below keeps what we know about them
+        _ = conn.executemany(
+            "INSERT INTO title VALUES (?, ?, '', 0)",
+            ((title_key(t), t) for t in titles if t and t != "page_title"),
+        )
+    conn.commit()
+
+    count = 0
+    offsets = array("Q")
+    with open(f"{prefix}.titles", "wb") as f_out:
+        for key, title, target, disambiguation in conn.execute(
+            "SELECT key, title, MAX(target), MAX(disambiguation) FROM title GROUP BY key, title ORDER BY key, title"
+        ):
+            offsets.append(f_out.tell())
+            _ = f_out.write(f"{key}\t{title}\t{target}\t{disambiguation}\n".encode("utf-8"))
+            count += 1
+    with open(f"{prefix}.offsets", "wb") as f_out:
+        offsets.tofile(f_out)
+    conn.close()
+    os.unlink(scratch)
+    logger.info("  Wrote %s titles to %s.titles", count, prefix)
+    return count
+
+
+class TitleIndex(object):
+    """Read side of build_title_index(); safe to share between threads"""
+
+    def __init__(self, prefix: str) -> None:
+        self.titles = self._map(f"{prefix}.titles")
+        self._offsets_map = self._map(f"{prefix}.offsets")
+        self.offsets = memoryview(self._offsets_map).cast("Q")
+
+    @staticmethod
+    def _map(path: str) -> mmap.mmap | bytes:
+        """The file memory-mapped, an empty file (an empty table) can't be mapped and is simply empty"""
+        with open(path, "rb") as f_in:
+            if not os.fstat(f_in.fileno()).st_size:
+                return b""
+            return mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _line(self, i: int) -> list[str]:
+        start = self.offsets[i]
+        fields = self.titles[start : self.titles.find(b"\n", start)].decode("utf-8").split("\t")
+        # tables built before disambiguation pages were marked have three columns
+        return fields + ["0"] * (4 - len(fields))
+
+    def lookup(self, title: str) -> dict:
+        """
+        {"title", "target", "disambiguation"} for a page title (target is empty unless it's a redirect), or {}.
+        Matching ignores case; an exact-case title wins if several pages only differ in case.
+        """
+        key = title_key(title)
+        encoded = key.encode("utf-8")
+        lo = 0
+        hi = len(self.offsets)
+        # first line with a key >= ours
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = self.offsets[mid]
+            if self.titles[start : self.titles.find(b"\t", start)] < encoded:
+                lo = mid + 1
+            else:
+                hi = mid
+        matches = []
+        while lo < len(self.offsets):
+            line_key, line_title, target, disambiguation = self._line(lo)
+            if line_key != key:
+                break
+            matches.append(
+                {
+                    "title": line_title.replace("_", " "),
+                    "target": target.replace("_", " "),
+                    "disambiguation": disambiguation == "1",
+                }
+            )
+            lo += 1
+        if not matches:
+            return {}
+        wanted = " ".join(title.replace("_", " ").split())
+        return next((m for m in matches if m["title"] == wanted), matches[0])
+
+    def resolve(self, title: str) -> dict:
+        """
+        lookup() of the page a title ends up at, following redirects to redirects.
+        {} when there's no such page, the redirects go round in a loop or take more than max_redirect_hops.
+        """
+        page = self.lookup(title)
+        seen: set = set()
+        while page and page["target"]:
+            seen.add(title_key(page["title"]))
+            if title_key(page["target"]) in seen or len(seen) > max_redirect_hops:
+                logger.debug("  Giving up on the redirects from %s at %s", title, page["title"])
+                return {}
+            page = self.lookup(page["target"])
+        return page
@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 import copy
+import functools
 import json
 import os
 import polars as pl
@@ -11,57 +13,117 @@ from utils import (
 import xlsxwriter  # type: ignore [import-untyped]
 
 
+# list items json.dumps() writes without \uXXXX escapes: printable ASCII plus the escapes _json_string() reproduces
+_json_plain_re = r"^[\x20-\x7e\n\r\t]*$"
+
+
+def _json_string(expr: pl.Expr) -> pl.Expr:
+    """json.dumps() of (plain, see _json_plain_re) strings as a polars expression"""
+    escaped = expr.str.replace_all("\\", "\\\\", literal=True).str.replace_all('"', '\\"', literal=True)
+    for char, escape in [("\n", "\\n"), ("\r", "\\r"), ("\t", "\\t")]:
+        escaped = escaped.str.replace_all(char, escape, literal=True)
+    return pl.concat_str([pl.lit('"'), escaped, pl.lit('"')])
+
+
+def _stringify_list_column(column: pl.Series) -> pl.Expr:
+    """
+    json.dumps(value, default=str) of every list in a column. Lists of integers or plain strings are
+    written by polars itself; anything else (floats, non-ASCII text, nested types...) goes through json.
+    """
+    inner = column.dtype.inner  # type: ignore [attr-defined]
+    native = inner.is_integer() or (
+        inner == pl.String and bool(column.explode().drop_nulls().str.contains(_json_plain_re).all())
+    )
+    if not native:
+        return (
+            pl.col(column.name)
+            .map_elements(lambda val: json.dumps(val.to_list(), default=str), return_dtype=pl.String)
+            .alias(column.name)
+        )
+    item = _json_string(pl.element()) if inner == pl.String else pl.element().cast(pl.String)
+    items = pl.col(column.name).list.eval(pl.when(pl.element().is_null()).then(pl.lit("null")).otherwise(item))
+    # lists that are null stay null, like map_elements() leaves them
+    return pl.concat_str([pl.lit("["), items.list.join(", "), pl.lit("]")]).alias(column.name)
+
+
 # Deals with list columns data that CSV cannot deal with.
 def _stringify_list_columns(df: pl.DataFrame) -> pl.DataFrame:
     """Convert any List-type columns to JSON strings so CSV/Excel can handle them."""
     list_cols = [col for col, dtype in zip(df.columns, df.dtypes) if dtype.base_type() == pl.List]
     if list_cols:
-        df = df.with_columns(
-            [
-                pl.col(c)
-                .map_elements(lambda val: json.dumps(val.to_list(), default=str), return_dtype=pl.String)
-                .alias(c)
-                for c in list_cols
-            ]
-        )
+        df = df.with_columns([_stringify_list_column(df[c]) for c in list_cols])
     return df
 
 
-def export_to_file(
-    facilities_data: dict,
-    filename: str = "ice_detention_facilities_enriched",
-    file_type: str = "csv",
-) -> str:
-    if not facilities_data or not facilities_data.get("facilities", []):
-        logger.warning("No data to export!")
-        return ""
-    full_name = f"{output_folder}{os.sep}{filename}.{file_type}"
-    if file_type in ["csv", "xlsx", "parquet"]:
-        writer = convert_to_dataframe(facilities_data["facilities"])
+class ExportSession(object):
+    """
+    Export one dataset to several formats. Facilities are flattened into a DataFrame once
+    (and list columns stringified once for csv/xlsx), then every format is written from that.
+    """
+
+    def __init__(self, facilities_data: dict, filename: str = "ice_detention_facilities_enriched") -> None:
+        self.facilities_data = facilities_data
+        self.filename = filename
+
+    @functools.cached_property
+    def frame(self) -> pl.DataFrame:
+        return convert_to_dataframe(self.facilities_data["facilities"])
+
+    @functools.cached_property
+    def stringified_frame(self) -> pl.DataFrame:
+        """frame with list columns as JSON strings, for formats without list types"""
+        return _stringify_list_columns(self.frame)
+
+    def write(self, file_type: str = "csv") -> str:
+        if not self.facilities_data or not self.facilities_data.get("facilities", []):
+            logger.warning("No data to export!")
+            return ""
+        full_name = f"{output_folder}{os.sep}{self.filename}.{file_type}"
+        os.makedirs(output_folder, exist_ok=True)
         match file_type:
             case "xlsx":
                 with xlsxwriter.Workbook(full_name, {"remove_timezone": True}) as wb:
-                    _ = _stringify_list_columns(writer).write_excel(workbook=wb, include_header=True, autofit=True)
-                    # _ = writer.write_excel(workbook=wb, include_header=True, autofit=True)
+                    _ = self.stringified_frame.write_excel(workbook=wb, include_header=True, autofit=True)
             case "csv":
                 with open(full_name, "w", newline="", encoding="utf-8") as f_out:
-                    # writer.write_csv(file=f_out, include_header=True)
-                    _stringify_list_columns(writer).write_csv(file=f_out, include_header=True)
+                    self.stringified_frame.write_csv(file=f_out, include_header=True)
             case "parquet":
-                writer.write_parquet(full_name, use_pyarrow=True)
+                self.frame.write_parquet(full_name, use_pyarrow=True)
+            case "json":
+                with open(full_name, "w", encoding="utf-8") as f_out:
+                    json.dump(self.facilities_data, f_out, indent=2, sort_keys=True, default=str)
             case _:
-                logger.warning("Invalid dataframe output type %s", file_type)
-    elif file_type == "json":
-        with open(full_name, "w", encoding="utf-8") as f_out:
-            json.dump(facilities_data, f_out, indent=2, sort_keys=True, default=str)
-
-    logger.info(
-        "%s file '%s' created successfully with %s facilities.",
-        file_type,
-        full_name,
-        len(facilities_data["facilities"]),
-    )
-    return filename
+                logger.warning("Invalid output type %s", file_type)
+                return ""
+
+        logger.info(
+            "%s file '%s' created successfully with %s facilities.",
+            file_type,
+            full_name,
+            len(self.facilities_data["facilities"]),
+        )
+        return self.filename
+
+    def write_all(self, file_types: list[str]) -> list[str]:
+        """Write every format at once, in threads (export takes about as long as the slowest writer)"""
+        if not self.facilities_data or not self.facilities_data.get("facilities", []):
+            logger.warning("No data to export!")
+            return []
+        # build the shared frames up front rather than racing to build them in every thread
+        if any(t in ["csv", "xlsx", "parquet"] for t in file_types):
+            _ = self.frame
+        if any(t in ["csv", "xlsx"] for t in file_types):
+            _ = self.stringified_frame
+        with ThreadPoolExecutor(max_workers=max(1, len(file_types))) as pool:
+            return list(pool.map(self.write, file_types))
+
+
+def export_to_file(
+    facilities_data: dict,
+    filename: str = "ice_detention_facilities_enriched",
+    file_type: str = "csv",
+) -> str:
+    return ExportSession(facilities_data, filename).write(file_type)
 
 
 def print_summary(facilities_data: dict) -> None:
@@ -75,6 +137,10 @@ def print_summary(facilities_data: dict) -> None:
     logger.info("\n=== ICE Detention Facilities Scraper Summary ===")
     logger.info("Scraped data at %s", facilities_data["scraped_date"])
     logger.info("Total facilities: %s", total_facilities)
+    if facilities_data.get("stage_timings", {}):
+        logger.info("\nScrape stage timings:")
+        for stage, runtime in facilities_data["stage_timings"].items():
+            logger.info("  %s: %.2f seconds", stage, runtime)
 
     # Count by field office
     field_offices: dict = {}
@@ -119,6 +185,11 @@ def print_summary(facilities_data: dict) -> None:
             enrich_data["osm_found"] / total_facilities * 100,
         )
 
+        if facilities_data.get("enrich_cache", {}):
+            logger.info("\nEnrichment cache:")
+            for provider, stats in sorted(facilities_data["enrich_cache"].items()):
+                logger.info("  %s: %s hits, %s misses", provider, stats["hits"], stats["misses"])
+
         # Debug information if available
         logger.info("\n=== Wikipedia Debug Information ===")
         false_positives = 0
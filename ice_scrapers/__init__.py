@@ -4,6 +4,9 @@ types exist before attempting to import functions that
 may call them
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 ice_inspection_types = {
     # found in https://www.ice.gov/foia/odo-facility-inspections
     "ODO": "Office of Detention Oversight",
@@ -131,23 +134,76 @@ area_of_responsibility = {
 }
 field_office_to_aor = {v: k for k, v in area_of_responsibility.items()}
 
-from .agencies import scrape_agencies  # noqa: F401,E402
-from .utils import (  # noqa: E402
-    download_file,  # noqa: F401
-    get_ice_scrape_pages,  # noqa: F401
-    repair_locality,  # noqa: F401
-    repair_street,  # noqa: F401
-    repair_zip,  # noqa: F401
-    repair_name,  # noqa: F401
-    special_facilities,  # noqa: F401
-    update_facility,  # noqa: F401
-)
-from .facilities_scraper import scrape_facilities  # noqa: F401,E402
-from .spreadsheet_load import load_sheet  # noqa: F401,E402
-from .field_offices import (  # noqa: E402
-    merge_field_offices,  # noqa: F401
-    scrape_field_offices,  # noqa: F401
-)
-from .vera_data import collect_vera_facility_data  # noqa: F401,E402
-from .custom_facilities import insert_additional_facilities  # noqa: F401,E402
-from .general import facilities_scrape_wrapper  # noqa: F401,E402
+# in pipeline order, for command line choices (see general.facilities_scrape_wrapper)
+scrape_stages: list[str] = [
+    "agencies",
+    "sheet",
+    "inspections",
+    "field_offices",
+    "vera_download",
+    "facilities",
+    "match_inspections",
+    "vera",
+    "merge_field_offices",
+    "additional_facilities",
+]
+
+# public functions -> the module they live in. They're imported on first use, so the data above
+# (and e.g. `python main.py --help`) doesn't pull in bs4, pdfplumber and polars.
+_lazy_exports: dict = {
+    "scrape_agencies": ".agencies",
+    "download_file": ".utils",
+    "get_ice_scrape_pages": ".utils",
+    "repair_locality": ".utils",
+    "repair_street": ".utils",
+    "repair_zip": ".utils",
+    "repair_name": ".utils",
+    "special_facilities": ".utils",
+    "update_facility": ".utils",
+    "scrape_facilities": ".facilities_scraper",
+    "load_sheet": ".spreadsheet_load",
+    "merge_field_offices": ".field_offices",
+    "scrape_field_offices": ".field_offices",
+    "collect_vera_facility_data": ".vera_data",
+    "download_vera_data": ".vera_data",
+    "insert_additional_facilities": ".custom_facilities",
+    "Pipeline": ".pipeline",
+    "Stage": ".pipeline",
+    "facilities_scrape_wrapper": ".general",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_exports:
+        return getattr(importlib.import_module(_lazy_exports[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if TYPE_CHECKING:
+    from .agencies import scrape_agencies  # noqa: F401
+    from .utils import (
+        download_file,  # noqa: F401
+        get_ice_scrape_pages,  # noqa: F401
+        repair_locality,  # noqa: F401
+        repair_street,  # noqa: F401
+        repair_zip,  # noqa: F401
+        repair_name,  # noqa: F401
+        special_facilities,  # noqa: F401
+        update_facility,  # noqa: F401
+    )
+    from .facilities_scraper import scrape_facilities  # noqa: F401
+    from .spreadsheet_load import load_sheet  # noqa: F401
+    from .field_offices import (
+        merge_field_offices,  # noqa: F401
+        scrape_field_offices,  # noqa: F401
+    )
+    from .vera_data import (
+        collect_vera_facility_data,  # noqa: F401
+        download_vera_data,  # noqa: F401
+    )
+    from .custom_facilities import insert_additional_facilities  # noqa: F401
+    from .pipeline import (
+        Pipeline,  # noqa: F401
+        Stage,  # noqa: F401
+    )
+    from .general import facilities_scrape_wrapper  # noqa: F401
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import datetime
 import re
@@ -26,23 +27,17 @@ from .utils import (
 base_scrape_url = "https://www.ice.gov/detention-facilities"
 
 
-def scrape_facilities(facilities_data: dict) -> dict:
+def scrape_facilities(facilities_data: dict, max_concurrency: int = 8) -> dict:
     """Scrape all ICE detention facility data from all discovered pages"""
     start_time = time.time()
     logger.info("Starting to scrape ICE.gov detention facilities...")
     facilities_data["scraped_date"] = datetime.datetime.now(datetime.UTC)
     urls = get_ice_scrape_pages(base_scrape_url)
+    pages = asyncio.run(_crawl(urls, max_concurrency))
 
     scraped_count = 0
-    for page_num, url in enumerate(urls):
-        logger.info("Scraping page %s/%s...", page_num + 1, len(urls))
-        facilities = []
-        try:
-            facilities = _scrape_page(url)
-        except Exception as e:
-            logger.error("Error scraping page %s: %s", page_num + 1, e)
+    for page_num, facilities in enumerate(pages):
         logger.debug("Found %s facilities on page %s", len(facilities), page_num + 1)
-        time.sleep(1)  # Be respectful to the server
         scraped_count += len(facilities)
         for facility in facilities:
             facility = special_facilities(facility)
@@ -93,6 +88,37 @@ def scrape_facilities(facilities_data: dict) -> dict:
     return facilities_data
 
 
+async def _crawl(urls: list[str], max_concurrency: int) -> list[list]:
+    """
+    Fetch every listing page, and every facility detail page found on them,
+    with at most max_concurrency requests in flight. (req_get still enforces
+    the per-host rate limit.)
+    Pages, and the facilities on each page, come back in the same order as urls.
+    """
+    limit = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(func, *args):
+        async with limit:
+            return await asyncio.to_thread(func, *args)
+
+    async def _updated(facility: dict) -> None:
+        # the facility's own page is the last url we recorded for it
+        if len(facility["source_urls"]) > 1:
+            facility["page_updated_date"] = await _bounded(_scrape_updated, facility["source_urls"][-1])
+
+    async def _page(page_num: int, url: str) -> list:
+        logger.info("Scraping page %s/%s...", page_num + 1, len(urls))
+        try:
+            facilities = await _bounded(_scrape_page, url)
+        except Exception as e:
+            logger.error("Error scraping page %s: %s", page_num + 1, e)
+            return []
+        _ = await asyncio.gather(*[_updated(f) for f in facilities])
+        return facilities
+
+    return await asyncio.gather(*[_page(page_num, url) for page_num, url in enumerate(urls)])
+
+
 def _scrape_updated(url: str) -> datetime.datetime:
     """
     Scrape url to get "last updated" time
@@ -103,7 +129,7 @@ def _scrape_updated(url: str) -> datetime.datetime:
         return datetime.datetime.strptime(default_timestamp, timestamp_format)
     logger.debug("  Fetching: %s", url)
     try:
-        response = req_get(url, timeout=30, wait_time=0.1)
+        response = req_get(url, timeout=30)
     except Exception as e:
         logger.error("  Error parsing %s: %s", url, e)
         return datetime.datetime.strptime(default_timestamp, timestamp_format)
@@ -125,7 +151,7 @@ def _scrape_page(page_url: str) -> list:
     """Scrape a single page of facilities using BeautifulSoup"""
     logger.debug("  Fetching: %s", page_url)
     try:
-        response = req_get(page_url, timeout=30, wait_time=0.1)
+        response = req_get(page_url, timeout=30)
     except Exception as e:
         logger.error("  Error parsing %s: %s", page_url, e)
         return []
@@ -268,13 +294,10 @@ def _extract_single_facility(element, page_url):
     image_element = element.findAll("img")
     if image_element:
         facility["image_url"] = f"https://www.ice.gov{image_element[0]['src']}"
+    # page_updated_date comes from this page, which _crawl fetches alongside other pages
     facility_url_element = element.findAll("a")
-    facility_url = ""
     if facility_url_element:
-        facility_url = f"https://www.ice.gov{facility_url_element[0]['href']}"
-        facility["source_urls"].append(facility_url)
-    if facility_url:
-        facility["page_updated_date"] = _scrape_updated(facility_url)
+        facility["source_urls"].append(f"https://www.ice.gov{facility_url_element[0]['href']}")
     # Clean up extracted data
     facility = _clean_facility_data(facility)
 
@@ -32,7 +32,6 @@ def scrape_field_offices() -> dict:
         logger.info("Scraping page %s/%s...", page_num + 1, len(urls))
         offices = _scrape_page(url)
         logger.debug("Found %s offices on page %s", len(offices), page_num + 1)
-        time.sleep(1)  # Be respectful to the server
         for office in offices:
             office_data["field_offices"][office["field_office"]] = office
     office_data["scrape_runtime"] = time.time() - start_time
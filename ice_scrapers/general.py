@@ -1,6 +1,7 @@
 import copy
-from thefuzz import fuzz  # type: ignore [import-untyped]
+import hashlib
 from schemas import facilities_schema
+from utils import logger
 from .agencies import scrape_agencies
 from .custom_facilities import insert_additional_facilities
 from .facilities_scraper import scrape_facilities
@@ -8,10 +9,21 @@ from .field_offices import (
     merge_field_offices,
     scrape_field_offices,
 )
-from .inspections import find_inspections
+from .inspections import (
+    find_inspections,
+    match_inspections,
+)
+from .pipeline import (
+    Pipeline,
+    Stage,
+    stage_cache_dir,
+)
 from .spreadsheet_load import load_sheet
-from .vera_data import collect_vera_facility_data
-from utils import logger
+from .utils import repair_name_expr
+from .vera_data import (
+    collect_vera_facility_data,
+    download_vera_data,
+)
 
 
 def facilities_scrape_wrapper(
@@ -19,37 +31,91 @@ def facilities_scrape_wrapper(
     force_download: bool = True,
     skip_vera: bool = False,
     inspection_text: bool = False,
+    from_stage: str = "",
+    only_stage: str = "",
 ) -> tuple[dict, dict]:
-    agencies = scrape_agencies(keep_sheet, force_download)
-    facilities_data = copy.deepcopy(facilities_schema)
-    facilities = load_sheet(keep_sheet, force_download)
-    facilities_data["facilities"] = copy.deepcopy(facilities)
-    facility_name_map = {v["name"].lower(): k for k, v in facilities_data["facilities"].items()}
-    inspections = find_inspections(keep_text=inspection_text)
-    facilities_data = scrape_facilities(facilities_data)
+    """
+    Every stage names the outputs it consumes, so the independent downloads
+    (agencies, the detention sheet, inspections, field offices and Vera) run side by side
+    while the facility merges still happen in order.
+    Stage outputs are materialized in `stage_cache_dir`; see `Pipeline` for when they're reused.
+    """
+
+    def _load_sheet() -> dict:
+        facilities_data = copy.deepcopy(facilities_schema)
+        facilities_data["facilities"] = copy.deepcopy(load_sheet(keep_sheet, force_download))
+        return facilities_data
+
+    def _download_vera() -> dict:
+        if skip_vera:
+            return {}
+        vera_file = download_vera_data(force_download)
+        with open(vera_file, "rb") as f_in:
+            # the file name never changes, its contents are what later stages depend on
+            return {"file": vera_file, "sha256": hashlib.sha256(f_in.read()).hexdigest()}
 
-    # actually attach inspections to facilities
-    for facility, inspect in inspections.items():
-        logger.debug("  Matching %s for inspection details...", facility)
-        # exact match (extremely unlikely)
-        if facility.lower() in facility_name_map:
-            facilities_data["facilities"][facility_name_map[facility.lower()]]["inspection"]["details"] = copy.deepcopy(
-                inspect
-            )
-            break
-        # logger.debug("    Checking fuzzy matches:")
-        for k, v in facility_name_map.items():
-            r = fuzz.partial_ratio(facility, k)
-            # logger.debug("    %s === %s, ratio: %s", facility, k, r)
-            if r > 80:
-                logger.debug("  Probably the right facility %s => %s, (ratio %s)", k, facility, r)
-                facilities_data["facilities"][facility_name_map[k]]["inspection"]["details"] = copy.deepcopy(inspect)
-                break
+    def _vera(matched: dict, vera_file: dict) -> dict:
+        if skip_vera:
+            return matched
+        # the download stage already fetched the file
+        return collect_vera_facility_data(matched, keep_sheet, force_download=False)
 
-    if not skip_vera:
-        facilities_data = collect_vera_facility_data(facilities_data, keep_sheet, force_download)
-    field_offices = scrape_field_offices()
-    facilities_data = merge_field_offices(facilities_data, field_offices)
-    facilities_data = insert_additional_facilities(facilities_data)
+    stages = [
+        Stage("agencies", lambda: scrape_agencies(keep_sheet, force_download), remote=True),
+        Stage("sheet", _load_sheet, code=[load_sheet, repair_name_expr], remote=True),
+        Stage(
+            "inspections",
+            lambda: find_inspections(keep_text=inspection_text),
+            code=[find_inspections],
+            params={"inspection_text": inspection_text},
+            remote=True,
+        ),
+        Stage("field_offices", scrape_field_offices, remote=True),
+        Stage(
+            "vera_download",
+            _download_vera,
+            output="vera_file",
+            code=[download_vera_data],
+            params={"skip_vera": skip_vera},
+            remote=True,
+        ),
+        Stage(
+            "facilities",
+            lambda sheet: scrape_facilities(sheet),
+            inputs=["sheet"],
+            code=[scrape_facilities, repair_name_expr],
+            remote=True,
+        ),
+        Stage(
+            "match_inspections",
+            lambda facilities, inspections: match_inspections(facilities, inspections),
+            inputs=["facilities", "inspections"],
+            output="matched",
+            code=[match_inspections],
+        ),
+        Stage("vera", _vera, inputs=["matched", "vera_file"], code=[collect_vera_facility_data]),
+        Stage(
+            "merge_field_offices",
+            lambda vera, field_offices: merge_field_offices(vera, field_offices),
+            inputs=["vera", "field_offices"],
+            output="merged",
+            code=[merge_field_offices],
+        ),
+        Stage(
+            "additional_facilities",
+            lambda merged: insert_additional_facilities(merged),
+            inputs=["merged"],
+            code=[insert_additional_facilities],
+        ),
+    ]
+    pipeline = Pipeline(stages, cache_dir=stage_cache_dir, from_stage=from_stage, only_stage=only_stage)
+    results = pipeline.run()
+    if pipeline.cached:
+        logger.info("  Re-used materialized output of stages: %s", ", ".join(pipeline.cached))
+    if "additional_facilities" not in results:
+        logger.info("  Ran stage %s only, its output is materialized in %s", only_stage, stage_cache_dir)
+        return {}, results.get("agencies", {})
+    facilities_data = results["additional_facilities"]
+    facilities_data["stage_timings"] = pipeline.timings
 
-    return facilities_data, agencies
+    return facilities_data, results["agencies"]
@@ -1,12 +1,20 @@
 from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import hashlib
 import zstandard as zstd
 import os
 import pdfplumber
 from pprint import pformat
+from rapidfuzz import fuzz, process
 import re
 import sys
 from utils import (
+    get_http_cache,
+    get_rate_limiter,
+    init_worker,
     logger,
+    mp_context,
     output_folder,
     req_get,
 )
@@ -14,28 +22,57 @@ from .utils import download_file
 
 root_url = "https://www.ice.gov/foia/odo-facility-inspections"
 storage_dir = f"{output_folder}{os.sep}inspections{os.sep}"
+# extracted report text, zstd compressed and named by the sha256 of the source PDF
+text_store_dir = f"{storage_dir}text{os.sep}"
 """
 example: 2011 Calhoun County Correctional Facility, Battle Creek, MI - Dec. 6-8, 2011
 example 2: 2024 Chippewa County, Sault Sainte Marie, MI – Apr. 23-25, 2024
 example 3: FY 2018 South Texas ICE Processing Center Compliance Inspection Report – Pearsall, TX - May 1-3, 2018
 """
 text_re = re.compile(r"^(\w+\s)?(\d+)\s(.+)\s(-|–)\s(.+)$")
+# the location in the link text should end with a state: "Calhoun County Correctional Facility, Battle Creek, MI"
+state_re = re.compile(r",\s*([A-Z]{2})\s*$")
 
 
-def _extract_txt(url: str) -> str:
+def _extract_txt(url: str) -> bytes:
+    """
+    Download an inspection report and return its (zstd compressed) text.
+    Text is stored by the PDF's sha256, so an unchanged report is never parsed twice.
+    """
     file_name = url.split("/")[-1]  # type: ignore [union-attr]
     download_file(str(url), f"{storage_dir}{file_name}")
+    try:
+        with open(f"{storage_dir}{file_name}", "rb") as f_in:
+            digest = hashlib.sha256(f_in.read()).hexdigest()
+    except OSError as e:
+        logger.error("  Could not read inspection report %s :: %s", url, e)
+        return b""
+    text_path = f"{text_store_dir}{digest}.txt.zst"
+    if os.path.exists(text_path):
+        logger.debug("    Re-using extracted text of %s", url)
+        with open(text_path, "rb") as f_in:
+            return f_in.read()
     full_text = ""
     with pdfplumber.open(f"{storage_dir}{file_name}") as pdf:
         for idx, page in enumerate(pdf.pages):
             txt = page.extract_text()
             logger.debug("    Page %s: %s", idx + 1, txt)
             full_text = f"{full_text}\n{txt}"
-    return full_text
+    text = zstd.compress(full_text.encode("utf-8"))
+    # write then rename so a crashed worker never leaves a partial entry behind
+    with open(f"{text_path}.{os.getpid()}.tmp", "wb") as f_out:
+        f_out.write(text)
+    os.replace(f"{text_path}.{os.getpid()}.tmp", text_path)
+    return text
 
 
-def find_inspections(keep_text: bool = True) -> dict:
-    os.makedirs(storage_dir, exist_ok=True)
+def find_inspections(keep_text: bool = True, workers: int | None = None) -> dict:
+    """
+    Collect ODO inspection reports.
+    With keep_text, reports are downloaded and their text extracted in a pool of
+    `workers` processes (defaults to one per CPU).
+    """
+    os.makedirs(text_store_dir, exist_ok=True)
     inspections: dict = {}
     logger.info("Collecting inspection reports from %s", root_url)
     resp = req_get(root_url, timeout=120)
@@ -43,6 +80,7 @@ def find_inspections(keep_text: bool = True) -> dict:
     soup = BeautifulSoup(resp.content, "html.parser")
     content = soup.select_one("div.facility-inspections")
     links = content.select("a")  # type: ignore [union-attr]
+    reports = []
     for link in links:
         url = link["href"]
         obj = {"date": "", "url": url, "text": ""}
@@ -55,20 +93,77 @@ def find_inspections(keep_text: bool = True) -> dict:
         # fifth capture group should be the inspection date
         date: str = matches.group(5)  # type: ignore [union-attr]
         obj["date"] = date
-        if keep_text:
-            text = zstd.compress(_extract_txt(str(url)).encode("utf-8"))
-            logger.debug(
-                "    Facility: %s, date: %s, url: %s, report length (compressed): %s",
-                location,
-                date,
-                url,
-                sys.getsizeof(text),
-            )
-            obj["text"] = text
+        reports.append((location, obj))
         if location in inspections:
             inspections[location].append(obj)
         else:
             inspections[location] = [obj]
 
+    if keep_text:
+        logger.info("  Extracting text from %s inspection reports...", len(reports))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=init_worker,
+            initargs=(get_rate_limiter(), get_http_cache(), logger.level),
+        ) as pool:
+            for (location, obj), text in zip(reports, pool.map(_extract_txt, [str(obj["url"]) for _, obj in reports])):
+                logger.debug(
+                    "    Facility: %s, date: %s, url: %s, report length (compressed): %s",
+                    location,
+                    obj["date"],
+                    obj["url"],
+                    sys.getsizeof(text),
+                )
+                obj["text"] = text
+
     logger.debug(pformat(inspections))
     return inspections
+
+
+def match_inspections(facilities_data: dict, inspections: dict, min_score: int = 80) -> dict:
+    """
+    Attach inspection reports to facilities.
+
+    Exact (case-insensitive) name matches win outright. Otherwise the location is scored
+    (rapidfuzz partial_ratio) against every facility in the same state in a single batched
+    call, falling back to all facilities if we can't find a state. Each attached report
+    records how it was matched in `match`, so bad matches can be audited.
+    """
+    facility_name_map = {v["name"].lower(): k for k, v in facilities_data["facilities"].items()}
+    facilities_by_state: dict = {}
+    for k, v in facilities_data["facilities"].items():
+        state = v["address"]["administrative_area"].upper()
+        facilities_by_state.setdefault(state, {})[k] = v["name"].lower()
+    all_facilities = {k: v["name"].lower() for k, v in facilities_data["facilities"].items()}
+    matched = 0
+    for location, inspect in inspections.items():
+        logger.debug("  Matching %s for inspection details...", location)
+        query = location.lower()
+        # exact match (extremely unlikely)
+        if query in facility_name_map:
+            facility_id = facility_name_map[query]
+            match = {"method": "exact", "score": 100}
+        else:
+            state_match = state_re.search(location)
+            candidates = all_facilities
+            method = "fuzzy"
+            if state_match and facilities_by_state.get(state_match.group(1), {}):
+                candidates = facilities_by_state[state_match.group(1)]
+                method = f"fuzzy_{state_match.group(1)}"
+            result = process.extractOne(query, candidates, scorer=fuzz.partial_ratio, score_cutoff=min_score)
+            # keep the old "ratio > 80" cut-off on the rounded score
+            if not result or round(result[1]) <= min_score:
+                logger.debug("    No facility found for %s", location)
+                continue
+            name, score, facility_id = result
+            logger.debug("  Probably the right facility %s => %s, (ratio %s)", name, location, score)
+            match = {"method": method, "score": round(score, 2)}
+        details = facilities_data["facilities"][facility_id]["inspection"].setdefault("details", [])
+        for report in inspect:
+            report = copy.deepcopy(report)
+            report["match"] = {"location": location, **match}
+            details.append(report)
+        matched += 1
+    logger.info("  Matched %s/%s inspected locations to facilities", matched, len(inspections))
+    return facilities_data
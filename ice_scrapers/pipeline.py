@@ -0,0 +1,234 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+import glob
+import hashlib
+import inspect
+import os
+import pickle
+import schemas
+import time
+from typing import Callable
+from utils import (
+    logger,
+    output_folder,
+)
+import zstandard as zstd
+
+stage_cache_dir = f"{output_folder}stage_cache{os.sep}"
+# set anew on every run (schemas.py, the scrapers, Pipeline.timings), so left out of fingerprints
+run_metadata_keys = ["scraped_date", "scrape_runtime", "stage_timings"]
+
+
+def _without_run_metadata(value: object) -> object:
+    """A stage input as it is fingerprinted: dicts (also those in a list or tuple) minus run_metadata_keys"""
+    if isinstance(value, dict):
+        return {k: v for k, v in value.items() if k not in run_metadata_keys}
+    if isinstance(value, (list, tuple)):
+        return [_without_run_metadata(v) for v in value]
+    return value
+
+
+class Stage(object):
+    """
+    A single step of a scrape.
+    `func` is called with the outputs of the stages named in `inputs` (as keyword arguments,
+    in the order given) and whatever it returns is published as `output`.
+    `code` lists any functions/modules (besides `func`) whose source changes should invalidate
+    a materialized output, and `params` anything else the result depends on.
+    `remote` marks stages that fetch data from elsewhere, so identical inputs don't mean an identical result.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        inputs: list[str] | None = None,
+        output: str = "",
+        code: list | None = None,
+        params: dict | None = None,
+        remote: bool = False,
+    ) -> None:
+        self.name = name
+        self.func = func
+        self.inputs = inputs or []
+        self.output = output or name
+        self.code = code or []
+        self.params = params or {}
+        self.remote = remote
+
+    def fingerprint(self, kwargs: dict) -> str:
+        """
+        Hash of the stage's code version (including schemas.py), parameters and input values.
+        Run metadata (scrape dates and runtimes) isn't part of the values, or a local stage
+        downstream of a remote one would never match its stored output.
+        """
+        digest = hashlib.sha256(self.name.encode("utf-8"))
+        # every stage builds its records from schemas, so a schema change invalidates them all
+        modules = {inspect.getmodule(obj) for obj in [self.func, *self.code]} | {schemas}
+        for module in sorted(modules, key=lambda m: getattr(m, "__name__", "")):
+            try:
+                digest.update(inspect.getsource(module).encode("utf-8"))  # type: ignore [arg-type]
+            except (OSError, TypeError):
+                # no source to look at (interactive session, frozen build), so never re-use
+                digest.update(str(time.time()).encode("utf-8"))
+        digest.update(repr(sorted(self.params.items())).encode("utf-8"))
+        for key in self.inputs:
+            digest.update(pickle.dumps(_without_run_metadata(kwargs[key]), protocol=pickle.HIGHEST_PROTOCOL))
+        return digest.hexdigest()
+
+
+def _carry_run_metadata(result: object, kwargs: dict) -> None:
+    """A stored output carries the run metadata of the run that made it, replace it with this run's (from the inputs)"""
+    if not isinstance(result, dict):
+        return
+    for key in run_metadata_keys:
+        current = [v[key] for v in kwargs.values() if isinstance(v, dict) and key in v]
+        if key in result and current:
+            result[key] = current[0]
+
+
+class Pipeline(object):
+    """
+    Run stages as soon as everything they depend on is available.
+    Stages without a dependency between them (mostly downloads) run concurrently in threads.
+
+    With a `cache_dir` every stage's output is materialized (pickle + zstd) under its fingerprint,
+    and make-style reuse applies:
+      * local stages load the stored result when code, parameters and inputs are unchanged
+      * remote stages only do so when `from_stage` or `only_stage` was requested,
+        since their real input lives on someone else's server
+      * `from_stage` and everything after it always re-runs
+      * `only_stage` re-runs that one stage (its inputs coming from the cache where possible)
+        and skips everything downstream of it
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        max_workers: int = 8,
+        cache_dir: str = "",
+        from_stage: str = "",
+        only_stage: str = "",
+    ) -> None:
+        self.stages = stages
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self.timings: dict = {}
+        self.cached: list = []
+        producers = {stage.output: stage for stage in stages}
+        if len(producers) != len(stages):
+            raise ValueError("Stages must publish unique outputs")
+        for stage in stages:
+            missing = [i for i in stage.inputs if i not in producers]
+            if missing:
+                raise ValueError(f"Stage {stage.name} needs {missing}, which no stage produces")
+        names = [stage.name for stage in stages]
+        for requested in [from_stage, only_stage]:
+            if requested and requested not in names:
+                raise ValueError(f"Unknown stage {requested}, expected one of {names}")
+        # walk the graph once so a cycle fails here rather than hanging in run()
+        resolved: set = set()
+        pending = list(stages)
+        while pending:
+            ready = [s for s in pending if all(i in resolved for i in s.inputs)]
+            if not ready:
+                raise ValueError(f"Stages {[s.name for s in pending]} depend on each other")
+            resolved.update(s.output for s in ready)
+            pending = [s for s in pending if s not in ready]
+
+        # stages the requested stage depends on (directly or not)
+        self.upstream: set = set()
+        self.target = from_stage or only_stage
+        if self.target:
+            to_visit = [s for s in stages if s.name == self.target]
+            while to_visit:
+                for i in to_visit.pop().inputs:
+                    if producers[i].name not in self.upstream:
+                        self.upstream.add(producers[i].name)
+                        to_visit.append(producers[i])
+        # stages that must be recomputed regardless of what is stored
+        self.forced: set = set()
+        if from_stage:
+            self.forced = {s.name for s in stages if s.name == from_stage or self._depends_on(s, from_stage, producers)}
+        elif only_stage:
+            self.forced = {only_stage}
+            self.stages = [s for s in stages if s.name in self.upstream or s.name == only_stage]
+
+    def _depends_on(self, stage: Stage, name: str, producers: dict) -> bool:
+        """Does `stage` (transitively) consume the output of stage `name`?"""
+        for i in stage.inputs:
+            if producers[i].name == name or self._depends_on(producers[i], name, producers):
+                return True
+        return False
+
+    def _cache_path(self, stage: Stage, fingerprint: str) -> str:
+        return os.path.join(self.cache_dir, f"{stage.name}-{fingerprint}.pkl.zst")
+
+    def _load(self, stage: Stage, fingerprint: str) -> tuple[bool, object]:
+        path = self._cache_path(stage, fingerprint)
+        if not os.path.exists(path):
+            return False, None
+        with open(path, "rb") as f_in:
+            return True, pickle.loads(zstd.decompress(f_in.read()))
+
+    def _store(self, stage: Stage, fingerprint: str, result: object) -> None:
+        path = self._cache_path(stage, fingerprint)
+        # only the latest materialization of a stage is worth keeping
+        for old in glob.glob(os.path.join(glob.escape(self.cache_dir), f"{stage.name}-*.pkl.zst")):
+            if old != path:
+                os.unlink(old)
+        with open(f"{path}.tmp", "wb") as f_out:
+            f_out.write(zstd.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)))
+        os.replace(f"{path}.tmp", path)
+
+    def _timed(self, stage: Stage, kwargs: dict) -> object:
+        start_time = time.time()
+        fingerprint = ""
+        if self.cache_dir:
+            fingerprint = stage.fingerprint(kwargs)
+            reusable = stage.name not in self.forced and (not stage.remote or self.target)
+            if reusable:
+                found, result = self._load(stage, fingerprint)
+                if found:
+                    _carry_run_metadata(result, kwargs)
+                    self.timings[stage.name] = time.time() - start_time
+                    self.cached.append(stage.name)
+                    logger.info("  Loaded materialized output of stage %s", stage.name)
+                    return result
+        logger.debug("  Starting stage %s", stage.name)
+        result = stage.func(**kwargs)
+        if self.cache_dir:
+            # before any downstream stage gets the chance to modify it
+            self._store(stage, fingerprint, result)
+        self.timings[stage.name] = time.time() - start_time
+        logger.debug("  Finished stage %s in %s seconds", stage.name, self.timings[stage.name])
+        return result
+
+    def run(self) -> dict:
+        """Execute every stage and return all published outputs"""
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        results: dict = {}
+        pending = list(self.stages)
+        running: dict[Future, Stage] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                for stage in [s for s in pending if all(i in results for i in s.inputs)]:
+                    kwargs = {i: results[i] for i in stage.inputs}
+                    running[pool.submit(self._timed, stage, kwargs)] = stage
+                    pending.remove(stage)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        results[stage.output] = future.result()
+                    except Exception:
+                        logger.error("Stage %s failed", stage.name)
+                        for other in running:
+                            other.cancel()
+                        raise
+        return results
@@ -1,12 +1,11 @@
 from bs4 import BeautifulSoup
-import copy
 import datetime
 from ice_scrapers import (
     ice_facility_types,
     ice_inspection_types,
 )
 import os
-import polars
+import polars as pl
 import re
 from schemas import (
     facility_schema,
@@ -19,11 +18,12 @@ from utils import (
 )
 from .utils import (
     download_file,
-    repair_locality,
-    repair_name,
-    repair_street,
-    repair_zip,
+    repair_locality_expr,
+    repair_name_expr,
+    repair_street_expr,
+    repair_zip_expr,
     special_facilities,
+    special_facility_names,
 )
 
 base_xlsx_url = "https://www.ice.gov/detain/detention-management"
@@ -71,7 +71,7 @@ required_cols = [
 ]
 
 
-def _download_sheet(keep_sheet: bool = True, force_download: bool = True) -> tuple[polars.DataFrame, str]:
+def _download_sheet(keep_sheet: bool = True, force_download: bool = True) -> tuple[pl.DataFrame, str]:
     """Download the detention stats sheet from ice.gov"""
     resp = req_get(base_xlsx_url, timeout=120)
     soup = BeautifulSoup(resp.content, "html.parser")
@@ -98,7 +98,7 @@ def _download_sheet(keep_sheet: bool = True, force_download: bool = True) -> tup
     if force_download or not os.path.exists(filename):
         logger.info("Downloading detention stats sheet from %s", actual_link)
         download_file(actual_link, filename)
-    df = polars.read_excel(
+    df = pl.read_excel(
         drop_empty_rows=True,
         drop_empty_cols=False,
         has_header=False,
@@ -113,108 +113,123 @@ def _download_sheet(keep_sheet: bool = True, force_download: bool = True) -> tup
     return df, actual_link
 
 
+def _facility_struct(schema: dict, fields: dict, prefix: str = "") -> pl.Expr:
+    """
+    Build a struct expression shaped like `schema`.
+    Keys found in `fields` (by dotted path) use that expression, everything else keeps the schema default.
+    """
+    exprs = []
+    for k, v in schema.items():
+        key = f"{prefix}{k}"
+        if key in fields:
+            exprs.append(fields[key].alias(k))
+        elif isinstance(v, dict):
+            exprs.append(_facility_struct(v, fields, f"{key}.").alias(k))
+        elif isinstance(v, list):
+            exprs.append(pl.lit([], dtype=pl.List(pl.String)).alias(k))
+        else:
+            exprs.append(pl.lit(v).alias(k))
+    return pl.struct(exprs)
+
+
 def load_sheet(keep_sheet: bool = True, force_download: bool = True) -> dict:
     logger.info("Collecting initial facility data from %s", base_xlsx_url)
     df, sheet_url = _download_sheet(keep_sheet, force_download)
-    """Convert the detentionstats sheet data into something we can update our facilities with"""
+    """
+    Convert the detentionstats sheet data into something we can update our facilities with
+
+    All repairs, lookups and sums happen as polars expressions over the whole sheet,
+    and the nested facility records are materialized from a single struct column.
+    """
     results: dict = {}
+    # skip all rows that don't manage to populate all required headers
+    complete = pl.all_horizontal([pl.col(k).is_not_null() for k in required_cols])
+    for row in df.filter(~complete).iter_rows(named=True):
+        logger.debug("Skipping bad row in spreadsheet: %s", row)
+    df = df.filter(complete)
+
+    city = pl.col("City")
+    zcode, zip_cleaned, other_zips = repair_zip_expr(pl.col("Zip"), city)
+    street, street_cleaned, other_streets = repair_street_expr(pl.col("Address"), city)
     # occassionally a phone number shows up in weird places in the spreadsheet.
     # let's capture it
-    phone_re = re.compile(r".+(\d{3}\s\d{3}\s\d{4})$")
-    for row in df.iter_rows(named=True):
-        # skip all rows that don't manage to populate all required headers
-        if not all(row[k] is not None for k in required_cols):
-            logger.debug("Skipping bad row in spreadsheet: %s", row)
-            continue
-        # logger.debug("processing %s", row)
-        details = copy.deepcopy(facility_schema)
-        zcode, cleaned, other_zips = repair_zip(row["Zip"], row["City"])
-        details["address"]["other_postal_codes"].extend(other_zips)
-        if cleaned:
-            details["_repaired_record"] = True
-        street, cleaned, other_st = repair_street(row["Address"], row["City"])
-        details["address"]["other_streets"].extend(other_st)
-        if cleaned:
-            details["_repaired_record"] = True
-        match = phone_re.search(row["Address"])
-        if match:
-            if details.get("phone", None):
-                details["other_phones"].append(details["phone"])
-            details["phone"] = match.group(1)
-            details["_repaired_record"] = True
-        locality, cleaned, other_city = repair_locality(row["City"], row["State"])
-        details["address"]["other_localities"].extend(other_city)
-        if cleaned:
-            details["_repaired_record"] = True
-        name, cleaned, other_names = repair_name(row["Name"], row["City"])
-        details["other_names"].extend(other_names)
-        if cleaned:
-            details["_repaired_record"] = True
-        details["address"]["administrative_area"] = row["State"]
-        details["address"]["locality"] = locality
-        details["address"]["postal_code"] = zcode
-        details["address"]["street"] = street
-        details["name"] = name
-        details = special_facilities(details)
-        full_address = ",".join(
-            [
-                details["address"]["street"],
-                details["address"]["locality"],
-                details["address"]["administrative_area"],
-                details["address"]["postal_code"],
-            ]
-        ).upper()
-
-        """
-        population statistics
-        """
-        details["population"]["male"]["criminal"] = row["Male Crim"]
-        details["population"]["male"]["non_criminal"] = row["Male Non-Crim"]
-        details["population"]["female"]["criminal"] = row["Female Crim"]
-        details["population"]["female"]["non_criminal"] = row["Female Non-Crim"]
-        details["population"]["total"] = (
-            row["Male Crim"] + row["Male Non-Crim"] + row["Female Crim"] + row["Female Non-Crim"]
-        )
-        if row["Male/Female"]:
-            if "/" in row["Male/Female"]:
-                details["population"]["female"]["allowed"] = True
-                details["population"]["male"]["allowed"] = True
-            elif row["Male/Female"] == "Female":
-                details["population"]["female"]["allowed"] = True
-            else:
-                details["population"]["male"]["allowed"] = True
-        details["population"]["ice_threat_level"] = {
-            "level_1": row["ICE Threat Level 1"],
-            "level_2": row["ICE Threat Level 2"],
-            "level_3": row["ICE Threat Level 3"],
-            "none": row["No ICE Threat Level"],
-        }
-        # Levels extracted from https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx 2025-09-22
-        details["population"]["security_threat"]["low"] = row["Level A"]
-        details["population"]["security_threat"]["medium_low"] = row["Level B"]
-        details["population"]["security_threat"]["medium_high"] = row["Level C"]
-        details["population"]["security_threat"]["high"] = row["Level D"]
-        details["population"]["housing"]["mandatory"] = row["Mandatory"]
-        details["population"]["housing"]["guaranteed_min"] = row["Guaranteed Minimum"]
-        details["population"]["avg_stay_length"] = row["FY26 ALOS"]
-
-        details["facility_type"] = {
-            "id": row["Type Detailed"],
-        }
-        ft_details = ice_facility_types.get(row["Type Detailed"], {})
-        if ft_details:
-            details["facility_type"]["description"] = ft_details["description"]
-            details["facility_type"]["expanded_name"] = ft_details["expanded_name"]
-        details["inspection"] = {
+    phone = pl.col("Address").str.extract(r".+(\d{3}\s\d{3}\s\d{4})$", 1)
+    locality, locality_cleaned, other_localities = repair_locality_expr(city, pl.col("State"))
+    name, name_cleaned, other_names = repair_name_expr(pl.col("Name"), city)
+    full_address = pl.concat_str([street, locality, pl.col("State"), zcode], separator=",").str.to_uppercase()
+    male_female = pl.col("Male/Female").fill_null("")
+    both_allowed = male_female.str.contains("/", literal=True)
+    fields = {
+        "_repaired_record": zip_cleaned | street_cleaned | phone.is_not_null() | locality_cleaned | name_cleaned,
+        "address.administrative_area": pl.col("State"),
+        "address.locality": locality,
+        "address.other_localities": other_localities,
+        "address.other_postal_codes": other_zips,
+        "address.other_streets": other_streets,
+        "address.postal_code": zcode,
+        "address.street": street,
+        "address_str": full_address,
+        "facility_type": pl.struct(
+            pl.col("Type Detailed").alias("id"),
+            pl.col("Type Detailed")
+            .replace_strict({k: v["description"] for k, v in ice_facility_types.items()}, default=None)
+            .alias("description"),
+            pl.col("Type Detailed")
+            .replace_strict({k: v["expanded_name"] for k, v in ice_facility_types.items()}, default=None)
+            .alias("expanded_name"),
+        ),
+        "field_office": _facility_struct(field_office_schema, {"id": pl.col("AOR")}),
+        "inspection": pl.struct(
             # fall back to type code
-            "last_type": ice_inspection_types.get(row["Last Inspection Type"], row["Last Inspection Type"]),
-            "last_date": row["Last Inspection End Date"],
-            "last_rating": row["Last Final Rating"],
-        }
-        details["source_urls"].append(sheet_url)
-        details["field_office"] = copy.deepcopy(field_office_schema)
-        details["field_office"]["id"] = row["AOR"]
-        details["address_str"] = full_address
-        results[full_address] = details
+            pl.col("Last Inspection Type").replace(ice_inspection_types).alias("last_type"),
+            pl.col("Last Inspection End Date").alias("last_date"),
+            pl.col("Last Final Rating").alias("last_rating"),
+        ),
+        "name": name,
+        "other_names": other_names,
+        "phone": phone.fill_null(""),
+        # population statistics
+        "population.avg_stay_length": pl.col(r"^FY\d+ ALOS$"),
+        "population.female.allowed": both_allowed | (male_female == "Female"),
+        "population.female.criminal": pl.col("Female Crim"),
+        "population.female.non_criminal": pl.col("Female Non-Crim"),
+        "population.male.allowed": both_allowed | ((male_female != "") & (male_female != "Female")),
+        "population.male.criminal": pl.col("Male Crim"),
+        "population.male.non_criminal": pl.col("Male Non-Crim"),
+        "population.total": pl.col("Male Crim")
+        + pl.col("Male Non-Crim")
+        + pl.col("Female Crim")
+        + pl.col("Female Non-Crim"),
+        "population.ice_threat_level": pl.struct(
+            pl.col("ICE Threat Level 1").alias("level_1"),
+            pl.col("ICE Threat Level 2").alias("level_2"),
+            pl.col("ICE Threat Level 3").alias("level_3"),
+            pl.col("No ICE Threat Level").alias("none"),
+        ),
+        # Levels extracted from https://www.ice.gov/doclib/detention/FY25_detentionStats09112025.xlsx 2025-09-22
+        "population.security_threat.low": pl.col("Level A"),
+        "population.security_threat.medium_low": pl.col("Level B"),
+        "population.security_threat.medium_high": pl.col("Level C"),
+        "population.security_threat.high": pl.col("Level D"),
+        "population.housing.mandatory": pl.col("Mandatory"),
+        "population.housing.guaranteed_min": pl.col("Guaranteed Minimum"),
+        "source_urls": pl.concat_list(pl.lit(sheet_url)),
+    }
+    facilities = df.select(_facility_struct(facility_schema, fields).alias("facility")).get_column("facility")
+    for details in facilities.to_list():
+        # unknown facility types only carry their id
+        if details["facility_type"]["description"] is None:
+            details["facility_type"] = {"id": details["facility_type"]["id"]}
+        if details["name"] in special_facility_names:
+            details = special_facilities(details)
+            details["address_str"] = ",".join(
+                [
+                    details["address"]["street"],
+                    details["address"]["locality"],
+                    details["address"]["administrative_area"],
+                    details["address"]["postal_code"],
+                ]
+            ).upper()
+        results[details["address_str"]] = details
     logger.info("  Loaded %s facilities", len(results.keys()))
     return results
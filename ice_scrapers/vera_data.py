@@ -6,8 +6,8 @@ from schemas import facility_schema
 from utils import (
     logger,
     output_folder,
-    req_get,
 )
+from .utils import download_file
 
 # Github can aggressively rate-limit requests, so this may fail in surprising ways!
 base_url = (
@@ -213,16 +213,21 @@ def _vera_city_fixes(city: str, state: str) -> tuple[str, bool]:
     return city, fixed
 
 
+def _vera_match_key(name: str, city: str, state: str) -> tuple[str, str, str]:
+    """Normalized (name, city, state) we match Vera rows and facilities on"""
+    return name.upper(), city.upper(), state.upper()
+
+
+def download_vera_data(force_download: bool = True) -> str:
+    """Fetch Vera's facility CSV (if needed) and return where it lives"""
+    if force_download or not os.path.exists(filename):
+        download_file(base_url, filename)
+    return filename
+
+
 def collect_vera_facility_data(facilities_data: dict, keep_sheet: bool = True, force_download: bool = True) -> dict:
     logger.info("Collecting and extracting data from vera.org facility data...")
-    if force_download or not os.path.exists(filename):
-        res = req_get(base_url, timeout=120, stream=True)
-        size = len(res.content)
-        with open(filename, "wb") as f:
-            for chunk in res.iter_content(chunk_size=1024):
-                if chunk:
-                    f.write(chunk)
-        logger.debug("Wrote %s byte sheet to %s", size, filename)
+    download_vera_data(force_download)
     df = polars.read_csv(has_header=True, raise_if_empty=True, source=filename, use_pyarrow=True)
     if df.is_empty():
         raise ValueError("Empty CSV loaded somehow! %s", df)
@@ -242,6 +247,18 @@ def collect_vera_facility_data(facilities_data: dict, keep_sheet: bool = True, f
     matched_count = 0
     skipped_count = 0
     fixed = 0
+    """
+    Build the match index once rather than scanning every facility for every row.
+    Values are (facility id, position) so the first facility wins, just like a linear scan would,
+    and we can report how many comparisons that scan would have needed.
+    """
+    facility_index: dict = {}
+    for position, (k, v) in enumerate(facilities_data["facilities"].items()):
+        key = _vera_match_key(v["name"], v["address"]["locality"], v["address"]["administrative_area"])
+        if key not in facility_index:
+            facility_index[key] = (k, position)
+    probes = 0
+    linear_comparisons = 0
     for row in df.iter_rows(named=True):
         if not row["state"] or not row["city"]:
             logger.warning("  Skipping Vera row with missing values: %s", row)
@@ -259,23 +276,34 @@ def collect_vera_facility_data(facilities_data: dict, keep_sheet: bool = True, f
             row["city"] = "FPO"
             row["name"] = "Naval Station Guantanamo Bay (JTF Camp Six and Migrant Ops Center Main A)"
         addr_str = f"{row['name']},{row['city']},{row['state']}"
-        for k, v in facilities_data["facilities"].items():
-            if (
-                v["name"].upper() == row["name"].upper()
-                and v["address"]["administrative_area"].upper() == row["state"].upper()
-                and v["address"]["locality"].upper() == row["city"].upper()
-            ):
-                logger.debug("  Found matching facility %s...", v["name"])
-                facilities_data["facilities"][k]["osm"]["latitude"] = row["latitude"]
-                facilities_data["facilities"][k]["osm"]["longitude"] = row["longitude"]
-                facilities_data["facilities"][k]["vera_id"] = row["detention_facility_code"]
-                facilities_data["facilities"][k]["source_urls"].append(base_url)
-                if fixed_name or fixed_city:
-                    facilities_data["facilities"][k]["_repaired_record"] = True
-                matched_count += 1
-                found = True
-                break
+        probes += 1
+        match = facility_index.get(_vera_match_key(row["name"], row["city"], row["state"]), None)
+        if match:
+            k, position = match
+            linear_comparisons += position + 1
+            logger.debug("  Found matching facility %s...", facilities_data["facilities"][k]["name"])
+            facilities_data["facilities"][k]["osm"]["latitude"] = row["latitude"]
+            facilities_data["facilities"][k]["osm"]["longitude"] = row["longitude"]
+            facilities_data["facilities"][k]["vera_id"] = row["detention_facility_code"]
+            facilities_data["facilities"][k]["source_urls"].append(base_url)
+            if fixed_name or fixed_city:
+                facilities_data["facilities"][k]["_repaired_record"] = True
+            matched_count += 1
+            found = True
+        else:
+            linear_comparisons += len(facilities_data["facilities"])
         if not found:
+            # assigning keeps the position of a facility we overwrite, new ones go at the end
+            position = len(facilities_data["facilities"])
+            replaced = facilities_data["facilities"].get(addr_str, None)
+            if replaced:
+                position = list(facilities_data["facilities"].keys()).index(addr_str)
+                old_key = _vera_match_key(
+                    replaced["name"], replaced["address"]["locality"], replaced["address"]["administrative_area"]
+                )
+                # the facility behind the old key is gone, don't match later rows to its replacement
+                if facility_index.get(old_key, ("", 0))[0] == addr_str:
+                    del facility_index[old_key]
             facilities_data["facilities"][addr_str] = copy.deepcopy(facility_schema)
             facilities_data["facilities"][addr_str]["source_urls"].append(base_url)
             facilities_data["facilities"][addr_str]["name"] = row["name"]
@@ -293,7 +321,16 @@ def collect_vera_facility_data(facilities_data: dict, keep_sheet: bool = True, f
                 facilities_data["facilities"][addr_str]["facility_type"]["expanded_name"] = ft_details["expanded_name"]
             if fixed_name or fixed_city:
                 facilities_data["facilities"][addr_str]["_repaired_record"] = True
+            # later rows can match the facility we just added
+            key = _vera_match_key(row["name"], row["city"], row["state"])
+            if key not in facility_index:
+                facility_index[key] = (addr_str, position)
 
+    logger.debug(
+        "  Vera matching used %s index probes (a linear scan would have made %s facility comparisons)",
+        probes,
+        linear_comparisons,
+    )
     logger.info(
         "  Found %s facilities: Skipped %s, Matched %s, corrected names on %s",
         df.height,
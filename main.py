@@ -18,15 +18,18 @@ Usage:
     python main.py --load-existing --enrich --debug -o debug_facilities
 """
 
+# scraping, enrichment and export modules (and bs4/pdfplumber/polars/xlsxwriter with them) are imported
+# where they're used, so `--help` and runs that skip a step don't pay for them
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
-import copy
 import logging
-from file_utils import export_to_file, print_summary
-import default_data
-from ice_scrapers import facilities_scrape_wrapper
-from enrichers import enrich_facility_data
+from enrichers import dispatch_modes
+from ice_scrapers import scrape_stages
 from schemas import supported_output_types
-from utils import logger
+from utils import (
+    configure_http_cache,
+    default_cache_dir,
+    logger,
+)
 
 
 def main() -> None:
@@ -73,8 +76,8 @@ def main() -> None:
     _ = parser.add_argument(
         "--enrich-workers",
         type=int,
-        default=3,
-        help="Number of concurrent processes to allow while enriching data",
+        default=100,
+        help="Number of facilities to enrich concurrently (each source is also limited separately)",
     )
     # todo these need more attention, but should now be accepted as command line options now.
     _ = parser.add_argument(
@@ -108,6 +111,85 @@ def main() -> None:
         default=False,
         help="Collect vera.org data",
     )
+    _ = parser.add_argument(
+        "--no-fan-out",
+        action="store_true",
+        default=False,
+        help="Search Wikipedia, Wikidata and OpenStreetMap one after another for each facility",
+    )
+    _ = parser.add_argument(
+        "--osm-extract",
+        type=str,
+        default="",
+        help="Local OpenStreetMap extract (.osm, .osm.gz, .osm.bz2 or .osm.pbf) to match facilities against offline",
+    )
+    _ = parser.add_argument(
+        "--wikidata-index",
+        type=str,
+        default="",
+        help="Search Wikidata offline, in an index built by tools/ingest_wikidata_dump.py",
+    )
+    _ = parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Only enrich facilities that are new or changed (name/address) since the newest *_enriched.json export",
+    )
+    _ = parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="Continue an enrichment run that didn't finish, skipping facilities in its checkpoint log",
+    )
+    _ = parser.add_argument(
+        "--dispatch",
+        choices=dispatch_modes,
+        default="async",
+        type=str,
+        help="Run enrichment searches in threads of one process (async) or in a pool of worker processes",
+    )
+    _ = parser.add_argument(
+        "--wikipedia-titles",
+        type=str,
+        default="",
+        help="Resolve Wikipedia titles/redirects locally, from a table built by tools/ingest_wikipedia_titles.py",
+    )
+    _ = parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=False,
+        help="With --wikipedia-titles, don't fall back to Wikipedia's search API",
+    )
+    _ = parser.add_argument(
+        "--save-default-data",
+        action="store_true",
+        default=False,
+        help="Store the scraped data as the new baseline for --load-existing (default_data.json.zst)",
+    )
+    _ = parser.add_argument(
+        "--from-stage",
+        choices=scrape_stages,
+        type=str,
+        help="Re-run this scrape stage and everything after it, re-using stored output of the stages before it",
+    )
+    _ = parser.add_argument(
+        "--only-stage",
+        choices=scrape_stages,
+        type=str,
+        help="Re-run just this scrape stage (inputs from stored stage output) and store its result",
+    )
+    _ = parser.add_argument(
+        "--cache-dir",
+        default=default_cache_dir,
+        type=str,
+        help="Where to keep cached HTTP responses (revalidated with ETag/If-Modified-Since on every run)",
+    )
+    _ = parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Don't read or write cached HTTP responses or enrichment results",
+    )
 
     args = parser.parse_args()
     if args.debug:
@@ -127,22 +209,45 @@ def main() -> None:
     if args.scrape and args.load_existing:
         logger.error("Can't scrape and load existing data!")
         exit(1)
+    if args.save_default_data and not args.scrape:
+        logger.error("--save-default-data only applies to --scrape!")
+        exit(1)
+    if (args.from_stage or args.only_stage) and not args.scrape:
+        logger.error("--from-stage and --only-stage only apply to --scrape!")
+        exit(1)
+    if args.from_stage and args.only_stage:
+        logger.error("Can't use --from-stage and --only-stage together!")
+        exit(1)
+    http_cache = configure_http_cache(args.cache_dir, enabled=not args.no_cache)
 
     facilities_data: dict = {}
     if args.scrape:
+        from ice_scrapers import facilities_scrape_wrapper
+
         facilities_data, agencies = facilities_scrape_wrapper(
             keep_sheet=not args.delete_sheets,
             force_download=not args.skip_downloads,
             skip_vera=not args.use_vera,
+            from_stage=args.from_stage or "",
+            only_stage=args.only_stage or "",
         )
+        if args.save_default_data and facilities_data:
+            from default_data import save_default_data
+
+            save_default_data(facilities_data)
+            logger.info("Saved %s facilities as the new default data", len(facilities_data["facilities"]))
     elif args.load_existing:
-        facilities_data = copy.deepcopy(default_data.facilities_data)
+        from default_data import load_default_data
+
+        facilities_data = load_default_data()
         logger.info(
             "Loaded %s existing facilities from local data. (Not scraping)",
             len(facilities_data["facilities"].keys()),  # type: ignore [attr-defined]
         )
     elif args.enrich:
-        facilities_data = copy.deepcopy(default_data.facilities_data)
+        from default_data import load_default_data
+
+        facilities_data = load_default_data()
         logger.warning(
             "  Did not supply --scrape or --load-existing. Proceeding with default data set (%s facilities)",
             len(facilities_data["facilities"].keys()),  # type: ignore [attr-defined]
@@ -152,20 +257,42 @@ def main() -> None:
         if not facilities_data:
             logger.warning("  No facility data available for enrichment.")
             return
-        facilities_data = enrich_facility_data(facilities_data, args.enrich_workers)
+        from enrichers import enrich_facility_data
+
+        facilities_data = enrich_facility_data(
+            facilities_data,
+            args.enrich_workers,
+            use_cache=not args.no_cache,
+            fan_out=not args.no_fan_out,
+            osm_extract=args.osm_extract,
+            wikidata_index=args.wikidata_index,
+            wikipedia_titles=args.wikipedia_titles,
+            offline=args.offline,
+            incremental=args.incremental,
+            resume=args.resume,
+            dispatch=args.dispatch,
+        )
 
     if facilities_data:
+        from file_utils import ExportSession, print_summary
+
         output_filename = args.output_file_name
         if args.enrich and not output_filename.endswith("_enriched"):
             output_filename = f"{output_filename}_enriched"
+        export = ExportSession(facilities_data, output_filename)
         if not args.file_type:
-            for ftype in supported_output_types:
-                export_to_file(facilities_data, output_filename, ftype)
+            _ = export.write_all(supported_output_types)
         else:
-            export_to_file(facilities_data, output_filename, args.file_type)
+            _ = export.write(args.file_type)
         print_summary(facilities_data)
     else:
         logger.warning("  No data to export!")
+    if http_cache:
+        logger.info(
+            "HTTP cache: %s responses revalidated, %s stored",
+            http_cache.stats["revalidated"],
+            http_cache.stats["stored"],
+        )
 
 
 if __name__ == "__main__":
@@ -2,10 +2,12 @@ import copy
 import datetime
 
 facilities_schema: dict = {
+    "enrich_cache": {},
     "enrich_runtime": 0,
     "facilities": {},
     "scrape_runtime": 0,
     "scraped_date": datetime.datetime.now(datetime.UTC),
+    "stage_timings": {},
 }
 
 field_offices_schema: dict = {
@@ -61,6 +63,7 @@ facility_schema: dict = {
     "osm": {
         "latitude": 0,
         "longitude": 0,
+        "method": "",
         "search_query": "",
         "url": "",
     },
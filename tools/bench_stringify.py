@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Compare file_utils._stringify_list_columns against json.dumps() per cell (what it used to do),
+on a generated frame of string and integer list columns.
+
+    uv run python tools/bench_stringify.py --rows 100000
+"""
+
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+import json
+import os
+import random
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPT_DIR))
+
+import polars as pl  # noqa: E402
+from file_utils import _stringify_list_columns  # noqa: E402
+
+
+def _sample_frame(rows: int, seed: int = 0) -> pl.DataFrame:
+    rng = random.Random(seed)
+    # plenty of characters that need escaping
+    words = ["https://www.ice.gov/detain/detention-facilities", 'say "hi"', "back\\slash", "tab\there", "new\nline", ""]
+    return pl.DataFrame(
+        {
+            "urls": [
+                None if i % 50 == 0 else [rng.choice(words) for _ in range(rng.randint(0, 4))] for i in range(rows)
+            ],
+            "counts": [[rng.randint(-1000, 1000) for _ in range(rng.randint(0, 4))] for _ in range(rows)],
+        },
+        schema={"urls": pl.List(pl.String), "counts": pl.List(pl.Int64)},
+    )
+
+
+def _stringify_with_json(df: pl.DataFrame) -> pl.DataFrame:
+    list_cols = [col for col, dtype in zip(df.columns, df.dtypes) if dtype.base_type() == pl.List]
+    return df.with_columns(
+        [
+            pl.col(c).map_elements(lambda val: json.dumps(val.to_list(), default=str), return_dtype=pl.String).alias(c)
+            for c in list_cols
+        ]
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="Benchmark list column stringification",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    _ = parser.add_argument("--rows", type=int, default=100_000, help="Rows in the generated frame")
+    args = parser.parse_args()
+
+    df = _sample_frame(args.rows)
+    start = time.perf_counter()
+    expected = _stringify_with_json(df)
+    json_time = time.perf_counter() - start
+    start = time.perf_counter()
+    native = _stringify_list_columns(df)
+    native_time = time.perf_counter() - start
+
+    print(f"{args.rows} rows, {len(df.columns)} list columns")
+    print(f"  json.dumps per cell: {json_time:.3f}s")
+    print(f"  _stringify_list_columns: {native_time:.3f}s ({json_time / native_time:.1f}x)")
+    if not native.equals(expected, null_equal=True):
+        print("  Output differs from json.dumps!")
+        sys.exit(1)
+    print("  Output identical")
+
+
+if __name__ == "__main__":
+    main()
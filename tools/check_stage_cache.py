@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Run `main.py --scrape` twice in a row and check that the second run loads the local (matching and merging)
+stages from output/stage_cache/ instead of computing them again.
+
+    uv run python tools/check_stage_cache.py
+    uv run python tools/check_stage_cache.py -- --use-vera   # any other main.py arguments
+
+A stage that ran stores its output again, so a stored file that wasn't rewritten by the second run was loaded.
+"""
+
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter, REMAINDER
+import glob
+import os
+import subprocess
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+REPO_DIR = os.path.dirname(SCRIPT_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from ice_scrapers.pipeline import stage_cache_dir  # noqa: E402
+
+# stages without a remote=True in ice_scrapers/general.py
+local_stages = ["match_inspections", "vera", "merge_field_offices", "additional_facilities"]
+
+
+def stored_outputs() -> dict:
+    """stage name -> (file, mtime) of its materialized output"""
+    stored = {}
+    for path in glob.glob(os.path.join(REPO_DIR, glob.escape(stage_cache_dir), "*.pkl.zst")):
+        stored[os.path.basename(path).rsplit("-", 1)[0]] = (path, os.stat(path).st_mtime_ns)
+    return stored
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="Check that a repeated scrape re-uses the stored output of local stages",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    _ = parser.add_argument("main_args", nargs=REMAINDER, help="Arguments for main.py (after --)")
+    args = parser.parse_args()
+    main_args = ["--scrape", *[a for a in args.main_args if a != "--"]]
+
+    before: dict = {}
+    for run in [1, 2]:
+        print(f"Run {run}: main.py {' '.join(main_args)}")
+        result = subprocess.run([sys.executable, os.path.join(REPO_DIR, "main.py"), *main_args], cwd=REPO_DIR)
+        if result.returncode:
+            print(f"main.py exited with {result.returncode}")
+            sys.exit(1)
+        if run == 1:
+            before = stored_outputs()
+    after = stored_outputs()
+
+    recomputed = []
+    for stage in sorted(after):
+        reused = before.get(stage) == after[stage]
+        print(f"  {stage:<25} {'loaded' if reused else 'computed'}")
+        if stage in local_stages and not reused:
+            recomputed.append(stage)
+    if recomputed:
+        print(f"Local stages computed again on an unchanged rerun: {', '.join(recomputed)}")
+        sys.exit(1)
+    print("Every local stage was loaded from the stage cache")
+
+
+if __name__ == "__main__":
+    main()
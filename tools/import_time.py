@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+How long `main.py` takes to import its modules, from `python -X importtime`.
+
+    uv run python tools/import_time.py                    # main.py --help
+    uv run python tools/import_time.py --max-ms 150       # fail when startup imports get slower than that
+    uv run python tools/import_time.py -- --load-existing # any other main.py arguments
+
+Heavy dependencies (polars, bs4, pdfplumber, xlsxwriter, ...) should only show up for the steps that use them.
+"""
+
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter, REMAINDER
+import os
+import re
+import subprocess
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+REPO_DIR = os.path.dirname(SCRIPT_DIR)
+
+# import time:  self [us] | cumulative | imported package
+line_re = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_times(main_args: list[str]) -> list:
+    """(module, self us, cumulative us, nesting level) for every import main.py makes"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(REPO_DIR, "main.py"), *main_args],
+        capture_output=True,
+        text=True,
+        cwd=REPO_DIR,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        match = line_re.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            times.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return times
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="Report per-module import time of main.py",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    _ = parser.add_argument("--top", type=int, default=15, help="How many of the slowest imports to list")
+    _ = parser.add_argument(
+        "--max-ms", type=float, default=0, help="Exit with an error when total import time is above this"
+    )
+    _ = parser.add_argument("main_args", nargs=REMAINDER, help="Arguments for main.py (after --)")
+    args = parser.parse_args()
+    main_args = [a for a in args.main_args if a != "--"] or ["--help"]
+
+    times = import_times(main_args)
+    if not times:
+        print("No import times found, did main.py run?")
+        sys.exit(1)
+    # top level imports add up to the whole
+    total_ms = sum(cumulative for _, _, cumulative, level in times if level == 0) / 1000
+    print(f"main.py {' '.join(main_args)}: {len(times)} modules imported in {total_ms:.1f} ms")
+    print(f"\n{'module':<50} {'self ms':>10} {'cumulative ms':>14}")
+    for module, self_us, cumulative_us, level in sorted(times, key=lambda t: t[2], reverse=True)[: args.top]:
+        print(f"{'  ' * level + module:<50} {self_us / 1000:>10.1f} {cumulative_us / 1000:>14.1f}")
+    if args.max_ms and total_ms > args.max_ms:
+        print(f"\nImport time {total_ms:.1f} ms is over the {args.max_ms} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Build the local Wikidata index used by `main.py --enrich --wikidata-index <file>`.
+
+    uv run python tools/ingest_wikidata_dump.py latest-all.json.gz output/wikidata_index.sqlite3
+
+The dump (https://dumps.wikimedia.org/wikidatawiki/entities/) is streamed twice in constant memory:
+once to find detention facility classes (the --roots classes and all their P279 subclasses),
+once to keep their instances.
+"""
+
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPT_DIR))
+
+from enrichers.wikidata import (  # noqa: E402
+    facility_class_roots,
+)
+from enrichers.wikidata_index import (  # noqa: E402
+    build_index,
+    find_facility_classes,
+)
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="Index prisons/jails/detention centers from a Wikidata JSON dump",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    _ = parser.add_argument("dump", type=str, help="Wikidata JSON dump (.json, .json.gz or .json.bz2)")
+    _ = parser.add_argument("index", type=str, help="SQLite index to write")
+    _ = parser.add_argument(
+        "--classes",
+        type=str,
+        default="",
+        help="Comma separated P31 classes to keep (skips the class discovery pass over the dump)",
+    )
+    _ = parser.add_argument(
+        "--roots",
+        type=str,
+        default=",".join(facility_class_roots),
+        help="Comma separated classes that, with their subclasses, are detention facility classes",
+    )
+    args = parser.parse_args()
+    if args.classes:
+        classes = {c.strip() for c in args.classes.split(",") if c.strip()}
+    else:
+        classes = find_facility_classes(args.dump, [c.strip() for c in args.roots.split(",") if c.strip()])
+    build_index(args.dump, args.index, classes)
+
+
+if __name__ == "__main__":
+    main()
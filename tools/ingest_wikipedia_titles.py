@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Build the local Wikipedia title table used by `main.py --enrich --wikipedia-titles <prefix>`.
+
+    uv run python tools/ingest_wikipedia_titles.py \
+        enwiki-latest-all-titles-in-ns0.gz enwiki-latest-page.sql.gz enwiki-latest-redirect.sql.gz \
+        enwiki-latest-page_props.sql.gz output/wikipedia_titles
+
+Dumps come from https://dumps.wikimedia.org/enwiki/latest/ and are streamed, never loaded whole.
+"""
+
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPT_DIR))
+
+from enrichers.wikipedia_titles import build_title_index  # noqa: E402
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="Build a sorted, memory-mapped table of enwiki titles and redirect targets",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    _ = parser.add_argument("all_titles", type=str, help="enwiki all-titles-in-ns0 dump")
+    _ = parser.add_argument("page_sql", type=str, help="enwiki page.sql dump")
+    _ = parser.add_argument("redirect_sql", type=str, help="enwiki redirect.sql dump")
+    _ = parser.add_argument("page_props_sql", type=str, help="enwiki page_props.sql dump")
+    _ = parser.add_argument("prefix", type=str, help="Output prefix (writes <prefix>.titles and <prefix>.offsets)")
+    args = parser.parse_args()
+    build_title_index(args.all_titles, args.page_sql, args.redirect_sql, args.page_props_sql, args.prefix)
+
+
+if __name__ == "__main__":
+    main()
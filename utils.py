@@ -1,35 +1,81 @@
 # For general helpers, regexes, or shared logic (e.g. phone/address parsing functions).
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
-import polars
-import requests
-from requests.adapters import HTTPAdapter
+import threading
 import time
-import urllib3
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+# requests and polars are imported where they're used, so importing utils (as every module does) stays cheap
+if TYPE_CHECKING:
+    import polars
+    import requests
 
 SCRIPTDIR = os.path.dirname(os.path.realpath(__file__))
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 logger.addHandler(logging.StreamHandler())
 
-_retry_strategy = urllib3.Retry(
-    total=4,
-    backoff_factor=1,
-)
+# start method for every process pool (and the shared memory handed to it): workers are started from pipeline
+# threads, and forking a threaded process copies locks other threads may be holding
+mp_context = multiprocessing.get_context("spawn")
+
 default_headers = {"User-Agent": "ICE-Facilities-Research/1.0 (Educational Research Purpose)"}
-_adapter = HTTPAdapter(max_retries=_retry_strategy)
-session = requests.Session()
-session.mount("https://", _adapter)
-session.mount("http://", _adapter)
-session.headers.update(default_headers)
 
+
+def _new_session() -> "requests.Session":
+    import requests
+    from requests.adapters import HTTPAdapter
+    import urllib3
+
+    new_session = requests.Session()
+    # enrichment runs many requests per host at once from threads, so keep enough pooled connections around
+    adapter = HTTPAdapter(max_retries=urllib3.Retry(total=4, backoff_factor=1), pool_maxsize=32)
+    new_session.mount("https://", adapter)
+    new_session.mount("http://", adapter)
+    new_session.headers.update(default_headers)
+    return new_session
+
+
+_session: "requests.Session | None" = None
+
+
+def get_session() -> "requests.Session":
+    """The process-wide HTTP session, created on first use"""
+    global _session
+    if not _session:
+        _session = _new_session()
+    return _session
+
+
+# created by whatever writes to it first, not on import
 output_folder = f"{SCRIPTDIR}{os.sep}output{os.sep}"
-# and make sure our output folder exists
-os.makedirs(output_folder, exist_ok=True)
 
 default_timestamp = "1970-01-01T00:00:00-+0000"
 timestamp_format = "%Y-%m-%dT%H:%M:%S-%z"
 
+# requests per second (and how many requests may burst at once) we allow against each host
+host_rate_limits: dict = {
+    "www.ice.gov": {"rate": 5, "burst": 1},
+    "en.wikipedia.org": {"rate": 2, "burst": 2},
+    "www.wikidata.org": {"rate": 2, "burst": 2},
+    # https://operations.osmfoundation.org/policies/nominatim/ (absolute max of 1 request/second)
+    "nominatim.openstreetmap.org": {"rate": 1, "burst": 1},
+    # Github can aggressively rate-limit requests
+    "raw.githubusercontent.com": {"rate": 1, "burst": 1},
+}
+# anything not listed above
+default_rate_limit: dict = {"rate": 1, "burst": 1}
+
+default_cache_dir = f"{output_folder}http_cache{os.sep}"
+# cached responses we haven't used in this long are thrown away
+default_cache_ttl = 14 * 24 * 60 * 60
+# and once the cache grows past this many bytes, the least recently used responses go first
+default_cache_max_size = 2 * 1024 * 1024 * 1024
+
 # all values that will only complicate workbook output types
 flatdata_filtered_keys = [
     "_repaired_record",
@@ -43,24 +89,297 @@ flatdata_filtered_keys = [
 ]
 
 
-def req_get(url: str, **kwargs) -> requests.Response:
-    """requests response wrapper to ensure we honor waits"""
-    headers = kwargs.get("headers", {})
+class RateLimiter(object):
+    """
+    One token bucket per host.
+
+    Bucket state lives in shared memory, so handing the limiter to worker
+    processes (see `init_worker`) keeps every process drawing from the same
+    buckets. Hosts without a configured limit use `default_rate_limit`: the
+    process that created the limiter gives each its own bucket, worker
+    processes (which can't add shared buckets after the fact) share one.
+    """
+
+    def __init__(self, limits: dict, default: dict = default_rate_limit) -> None:
+        self._default = default
+        self._buckets: dict = {}
+        self._lock = threading.Lock()
+        self._owner = os.getpid()
+        for host, limit in limits.items():
+            self.configure(host, limit["rate"], limit["burst"])
+        # allocated up front so it is shared with workers, see acquire()
+        self._unknown_hosts = self._bucket(default["rate"], default["burst"])
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket(rate: float, burst: float) -> dict:
+        return {
+            "rate": float(rate),
+            "burst": float(burst),
+            # [available tokens, last refill time]
+            "state": mp_context.Array("d", [float(burst), time.monotonic()]),
+        }
+
+    def configure(self, host: str, rate: float, burst: float = 1) -> None:
+        """(Re-)define the allowed rate for a host (before handing the limiter to workers)"""
+        self._buckets[host] = self._bucket(rate, burst)
+
+    def acquire(self, url: str) -> float:
+        """Block until the host of url has a token available, returns seconds spent waiting"""
+        host = urlsplit(url).hostname or ""
+        bucket = self._buckets.get(host, None)
+        if not bucket:
+            if os.getpid() != self._owner:
+                # a bucket made here would only limit this worker
+                bucket = self._unknown_hosts
+            else:
+                with self._lock:
+                    if host not in self._buckets:
+                        self.configure(host, self._default["rate"], self._default["burst"])
+                    bucket = self._buckets[host]
+        state = bucket["state"]
+        waited = 0.0
+        while True:
+            with state.get_lock():
+                now = time.monotonic()
+                tokens = min(bucket["burst"], state[0] + (now - state[1]) * bucket["rate"])
+                state[1] = now
+                if tokens >= 1:
+                    state[0] = tokens - 1
+                    return waited
+                state[0] = tokens
+                wait = (1 - tokens) / bucket["rate"]
+            time.sleep(wait)
+            waited += wait
+
+
+_rate_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    The process-wide rate limiter.
+    Created on first use, so worker processes (which receive the parent's
+    limiter through `init_worker`) never allocate buckets of their own.
+    """
+    global _rate_limiter
+    if not _rate_limiter:
+        _rate_limiter = RateLimiter(host_rate_limits)
+    return _rate_limiter
+
+
+class ResponseCache(object):
+    """
+    On-disk cache of GET responses, keyed by the final request URL (including params).
+
+    Only responses that carry an ETag or Last-Modified header are stored, because
+    every cached response is revalidated with a conditional request. A 304 answer
+    is turned back into the full cached response.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = default_cache_dir,
+        ttl: int = default_cache_ttl,
+        max_size: int = default_cache_max_size,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size = max_size
+        self.stats = {"revalidated": 0, "stored": 0}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, url: str, params: dict) -> str:
+        import requests
+
+        full_url = requests.Request("GET", url, params=params).prepare().url or url
+        # cache_dir may come without a trailing separator (--cache-dir /tmp/ice_cache)
+        return os.path.join(self.cache_dir, hashlib.sha256(full_url.encode("utf-8")).hexdigest())
+
+    def lookup(self, url: str, params: dict) -> dict:
+        """Cached metadata for a request, or an empty dict"""
+        path = self._path(url, params)
+        try:
+            if time.time() - os.path.getmtime(f"{path}.json") > self.ttl:
+                self._remove(path)
+                return {}
+            with open(f"{path}.json", "r", encoding="utf-8") as f_in:
+                meta = json.load(f_in)
+        except (OSError, ValueError):
+            return {}
+        meta["path"] = path
+        return meta
+
+    def validators(self, meta: dict) -> dict:
+        """Conditional request headers for a cached response"""
+        headers = {}
+        if meta["headers"].get("ETag"):
+            headers["If-None-Match"] = meta["headers"]["ETag"]
+        if meta["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+        return headers
+
+    def load(self, meta: dict, request_resp: "requests.Response") -> "requests.Response":
+        """Rebuild the cached response for a 304 answer"""
+        import requests
+        from requests.structures import CaseInsensitiveDict
+        from requests.utils import get_encoding_from_headers
+
+        with open(f"{meta['path']}.body", "rb") as f_in:
+            content = f_in.read()
+        # mark the entry as recently used for eviction
+        os.utime(f"{meta['path']}.json")
+        resp = requests.Response()
+        resp.status_code = meta["status_code"]
+        resp.reason = meta["reason"]
+        resp.headers = CaseInsensitiveDict(meta["headers"])
+        resp.url = meta["url"]
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.request = request_resp.request
+        resp._content = content
+        resp._content_consumed = True  # type: ignore [attr-defined]
+        self.stats["revalidated"] += 1
+        return resp
+
+    def store(self, url: str, params: dict, resp: "requests.Response") -> None:
+        if not (resp.headers.get("ETag") or resp.headers.get("Last-Modified")):
+            return
+        path = self._path(url, params)
+        meta = {
+            "headers": dict(resp.headers),
+            "reason": resp.reason,
+            "status_code": resp.status_code,
+            "url": resp.url,
+        }
+        # write to temp files first so concurrent workers never read half a response
+        # (named per process and thread, threads storing the same URL must not share one)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(f"{tmp}.body", "wb") as f_out:
+            f_out.write(resp.content)
+        with open(f"{tmp}.json", "w", encoding="utf-8") as f_out:
+            json.dump(meta, f_out)
+        os.replace(f"{tmp}.body", f"{path}.body")
+        os.replace(f"{tmp}.json", f"{path}.json")
+        self.stats["stored"] += 1
+
+    def _remove(self, path: str) -> None:
+        for suffix in [".json", ".body"]:
+            try:
+                os.unlink(f"{path}{suffix}")
+            except FileNotFoundError:
+                pass
+
+    def prune(self) -> None:
+        """Evict expired entries, then least recently used entries until we fit in max_size"""
+        entries = []
+        now = time.time()
+        with os.scandir(self.cache_dir) as d:
+            for f in d:
+                if ".tmp." in f.name:
+                    # left behind by a worker that died mid-store
+                    if now - f.stat().st_mtime > self.ttl:
+                        os.unlink(f.path)
+                    continue
+                if not f.name.endswith(".json"):
+                    continue
+                path = f.path.removesuffix(".json")
+                try:
+                    size = f.stat().st_size + os.path.getsize(f"{path}.body")
+                except OSError:
+                    self._remove(path)
+                    continue
+                entries.append((f.stat().st_mtime, size, path))
+        total = 0
+        evicted = 0
+        # newest first, so everything past the size limit is the oldest
+        for mtime, size, path in sorted(entries, reverse=True):
+            if now - mtime > self.ttl or total + size > self.max_size:
+                self._remove(path)
+                evicted += 1
+                continue
+            total += size
+        logger.debug("HTTP cache at %s: %s bytes in use, evicted %s responses", self.cache_dir, total, evicted)
+
+
+_http_cache: ResponseCache | None = None
+_http_cache_enabled = True
+
+
+def configure_http_cache(cache_dir: str = default_cache_dir, enabled: bool = True) -> ResponseCache | None:
+    """Set up (or disable) the response cache req_get uses"""
+    global _http_cache, _http_cache_enabled
+    _http_cache_enabled = enabled
+    _http_cache = None
+    if enabled:
+        _http_cache = ResponseCache(cache_dir)
+        _http_cache.prune()
+    return _http_cache
+
+
+def get_http_cache() -> ResponseCache | None:
+    """The process-wide response cache (None when caching is disabled)"""
+    global _http_cache
+    if not _http_cache and _http_cache_enabled:
+        _http_cache = ResponseCache()
+    return _http_cache
+
+
+def init_worker(limiter: RateLimiter, cache: ResponseCache | None = None, log_level: int = logging.INFO) -> None:
+    """
+    Process pool initializer so workers share the parent's rate limits, response cache and log level
+    (and get their own session), e.g.
+    ProcessPoolExecutor(mp_context=mp_context, initializer=init_worker, initargs=(get_rate_limiter(), get_http_cache()))
+    """
+    global _rate_limiter, _http_cache, _http_cache_enabled, _session
+    # a session of our own, never connections pooled by the parent
+    _session = _new_session()
+    logger.setLevel(log_level)
+    _rate_limiter = limiter
+    _http_cache = cache
+    _http_cache_enabled = cache is not None
+
+
+def req_get(url: str, **kwargs) -> "requests.Response":
+    """requests response wrapper to ensure we honor per-host rate limits and use our response cache"""
+    headers = dict(kwargs.get("headers", {}))
     # ensure we get all headers configured correctly
     # but manually applied headers win the argument
     for k, v in default_headers.items():
         if k in headers.keys():
             continue
         headers[k] = v
+    params = kwargs.get("params", {})
+    cache = get_http_cache()
+    cached: dict = {}
+    if cache:
+        cached = cache.lookup(url, params)
+        headers.update(cache.validators(cached) if cached else {})
 
-    response = session.get(
+    waited = get_rate_limiter().acquire(url)
+    if waited:
+        logger.debug("    Waited %.2f seconds for rate limit on %s", waited, url)
+    response = get_session().get(
         url,
         allow_redirects=True,
         timeout=kwargs.get("timeout", 10),
-        params=kwargs.get("params", {}),
+        params=params,
         stream=kwargs.get("stream", False),
         headers=headers,
     )
+    if cache:
+        if cached and response.status_code == 304:
+            logger.debug("    Cached copy of %s is still current", url)
+            response = cache.load(cached, response)
+        elif response.status_code == 200:
+            cache.store(url, params, response)
     if not kwargs.get("raise_err", False):
         response.raise_for_status()
     else:
@@ -69,7 +388,6 @@ def req_get(url: str, **kwargs) -> requests.Response:
                 logger.error("Client-side error in request to %s :: %s", url, response.text)
             else:
                 logger.error("Server-side error in request to %s :: %s", url, response.text)
-    time.sleep(kwargs.get("wait_time", 1))
     return response
 
 
@@ -85,8 +403,10 @@ def _flatdict(d: dict, parent_key: str = "", sep: str = ".") -> dict:
     return dict(items)
 
 
-def convert_to_dataframe(d: dict) -> polars.DataFrame:
+def convert_to_dataframe(d: dict) -> "polars.DataFrame":
     """internal dict to dataframe"""
+    import polars
+
     flatdata = [_flatdict(f) for f in d.values()]
     fieldnames = [k for k in flatdata[0].keys() if k not in flatdata_filtered_keys]
     # https://docs.pola.rs/api/python/stable/reference/api/polars.from_dicts.html